@@ -0,0 +1,168 @@
+from typing import List, TypedDict
+from sqlalchemy import and_, case, false, func
+from sqlmodel import Session, select
+from app.models import MotorbikeDB
+from app.queries import part_cost_rollup_subquery
+
+
+class BikeAnalytics(TypedDict):
+    id: str
+    name: str
+    initial_cost: float
+    bike_buyer: str | None
+    total_cost: float
+    tanya_investment_on_bike: float
+    gerald_investment_on_bike: float
+    profit: float | None
+    tanya_profit_share: float | None
+    gerald_profit_share: float | None
+    is_sold: bool
+
+
+class AnalyticsSummary(TypedDict):
+    total_tanya_investment: float
+    total_gerald_investment: float
+    total_tanya_profit_share: float
+    total_gerald_profit_share: float
+
+
+class AnalyticsReport(TypedDict):
+    bikes: List[BikeAnalytics]
+    summary: AnalyticsSummary
+
+
+def _sold_status_condition(filter_sold_status: str):
+    if filter_sold_status == "all":
+        return ~MotorbikeDB.ignore_from_calculations
+    if filter_sold_status == "sold":
+        return and_(
+            ~MotorbikeDB.ignore_from_calculations,
+            MotorbikeDB.is_sold,
+        )
+    if filter_sold_status == "unsold":
+        return and_(
+            ~MotorbikeDB.ignore_from_calculations,
+            ~MotorbikeDB.is_sold,
+        )
+    return false()
+
+
+def _analytics_columns():
+    parts = part_cost_rollup_subquery()
+    total_cost = MotorbikeDB.initial_cost + func.coalesce(
+        parts.c.total_parts_cost, 0.0
+    )
+    tanya_investment = MotorbikeDB.tanya_initial_cost + func.coalesce(
+        parts.c.tanya_parts_cost, 0.0
+    )
+    gerald_investment = MotorbikeDB.gerald_initial_cost + func.coalesce(
+        parts.c.gerald_parts_cost, 0.0
+    )
+    profit = case(
+        (
+            and_(
+                MotorbikeDB.is_sold,
+                MotorbikeDB.sold_value.is_not(None),
+            ),
+            MotorbikeDB.sold_value - total_cost,
+        ),
+        else_=None,
+    )
+    return parts, total_cost, tanya_investment, gerald_investment, profit
+
+
+def analytics_rows_statement(filter_sold_status: str):
+    """Builds the per-bike analytics query; rows convert with bike_analytics_from_row."""
+    parts, total_cost, tanya_investment, gerald_investment, profit = (
+        _analytics_columns()
+    )
+    return (
+        select(
+            MotorbikeDB.id,
+            MotorbikeDB.name,
+            MotorbikeDB.initial_cost,
+            MotorbikeDB.buyer,
+            total_cost,
+            tanya_investment,
+            gerald_investment,
+            profit,
+            MotorbikeDB.is_sold,
+        )
+        .outerjoin(parts, parts.c.motorbike_id == MotorbikeDB.id)
+        .where(_sold_status_condition(filter_sold_status))
+    )
+
+
+def bike_analytics_from_row(row) -> BikeAnalytics:
+    (
+        motorbike_id,
+        name,
+        initial_cost,
+        buyer,
+        bike_total_cost,
+        bike_tanya_investment,
+        bike_gerald_investment,
+        bike_profit,
+        is_sold,
+    ) = row
+    return {
+        "id": motorbike_id,
+        "name": name,
+        "initial_cost": initial_cost,
+        "bike_buyer": buyer,
+        "total_cost": bike_total_cost,
+        "tanya_investment_on_bike": bike_tanya_investment,
+        "gerald_investment_on_bike": bike_gerald_investment,
+        "profit": bike_profit,
+        "tanya_profit_share": (
+            bike_profit / 2 if bike_profit is not None else None
+        ),
+        "gerald_profit_share": (
+            bike_profit / 2 if bike_profit is not None else None
+        ),
+        "is_sold": is_sold,
+    }
+
+
+def load_analytics_report(
+    session: Session, filter_sold_status: str
+) -> AnalyticsReport:
+    """Loads the per-bike analytics rows and the partner totals with two SQL queries.
+
+    The sold filter and the ignore flag are WHERE clauses, and the totals are
+    SQL aggregates, so the inventory never has to be loaded into memory.
+    """
+    (
+        parts,
+        _,
+        tanya_investment,
+        gerald_investment,
+        profit,
+    ) = _analytics_columns()
+    condition = _sold_status_condition(filter_sold_status)
+    rows = session.exec(
+        analytics_rows_statement(filter_sold_status)
+    ).all()
+    (
+        total_tanya_investment,
+        total_gerald_investment,
+        total_profit,
+    ) = session.exec(
+        select(
+            func.coalesce(func.sum(tanya_investment), 0.0),
+            func.coalesce(func.sum(gerald_investment), 0.0),
+            func.coalesce(func.sum(profit), 0.0),
+        )
+        .select_from(MotorbikeDB)
+        .outerjoin(parts, parts.c.motorbike_id == MotorbikeDB.id)
+        .where(condition)
+    ).one()
+    return {
+        "bikes": [bike_analytics_from_row(row) for row in rows],
+        "summary": {
+            "total_tanya_investment": total_tanya_investment,
+            "total_gerald_investment": total_gerald_investment,
+            "total_tanya_profit_share": total_profit / 2,
+            "total_gerald_profit_share": total_profit / 2,
+        },
+    }
@@ -0,0 +1,23 @@
+import hmac
+
+from fastapi import HTTPException
+from starlette.requests import Request
+
+
+def has_bearer_token(request: Request, token: str) -> bool:
+    scheme, _, credentials = request.headers.get(
+        "authorization", ""
+    ).partition(" ")
+    return scheme.lower() == "bearer" and hmac.compare_digest(
+        credentials.strip().encode(), token.encode()
+    )
+
+
+def require_bearer_token(request: Request, token: str) -> None:
+    """Rejects the request with a 401 unless it sends "Authorization: Bearer <token>"."""
+    if not has_bearer_token(request, token):
+        raise HTTPException(
+            status_code=401,
+            detail="A valid bearer token is required.",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
@@ -13,6 +13,24 @@ from app.db_setup import (
     create_db_and_tables,
     populate_example_data,
 )
+from app.delta_metrics import (
+    DELTA_METRICS_ENABLED,
+    DeltaSizeMiddleware,
+)
+from app.metrics_endpoint import (
+    METRICS_ENDPOINT_ENABLED,
+    METRICS_TOKEN,
+    add_metrics_endpoint,
+)
+from app.export_endpoint import (
+    EXPORT_ENDPOINT_ENABLED,
+    EXPORT_TOKEN,
+    add_export_endpoint,
+)
+from app.event_metrics import (
+    EVENT_METRICS_ENABLED,
+    EventMetricsMiddleware,
+)
 
 
 def app_with_theme():
@@ -20,6 +38,19 @@ def app_with_theme():
 
 
 app = app_with_theme()
+if EVENT_METRICS_ENABLED:
+    app.add_middleware(
+        EventMetricsMiddleware(
+            [MotorbikeState, AnalyticsState, AuthState],
+            report_delta_sizes=DELTA_METRICS_ENABLED,
+        )
+    )
+elif DELTA_METRICS_ENABLED:
+    app.add_middleware(DeltaSizeMiddleware())
+if METRICS_ENDPOINT_ENABLED:
+    add_metrics_endpoint(app, METRICS_TOKEN)
+if EXPORT_ENDPOINT_ENABLED:
+    add_export_endpoint(app, EXPORT_TOKEN)
 create_db_and_tables()
 populate_example_data()
 app.add_page(
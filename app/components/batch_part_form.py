@@ -0,0 +1,124 @@
+import reflex as rx
+from app.states.motorbike_state import MotorbikeState
+from app.states.motorbike_form_state import BatchPartFormState
+
+INPUT_CLASS_NAME = "block w-full px-2 py-1 bg-white border border-gray-300 rounded-md shadow-sm focus:outline-none focus:ring-indigo-500 focus:border-indigo-500 sm:text-sm"
+
+
+def batch_part_row(row_id: rx.Var[int]) -> rx.Component:
+    return rx.el.div(
+        rx.el.input(
+            name=f"name_{row_id}",
+            placeholder="Part name",
+            class_name=INPUT_CLASS_NAME,
+        ),
+        rx.el.input(
+            name=f"source_{row_id}",
+            placeholder="Source",
+            class_name=INPUT_CLASS_NAME,
+        ),
+        rx.el.select(
+            rx.foreach(
+                MotorbikeState.buyers,
+                lambda buyer: rx.el.option(buyer, value=buyer),
+            ),
+            name=f"buyer_{row_id}",
+            class_name=INPUT_CLASS_NAME,
+        ),
+        rx.el.input(
+            name=f"cost_{row_id}",
+            type="number",
+            step="0.01",
+            placeholder="Cost",
+            class_name=INPUT_CLASS_NAME,
+        ),
+        rx.el.button(
+            rx.icon(tag="x", class_name="h-4 w-4"),
+            type="button",
+            on_click=BatchPartFormState.remove_batch_part_row(
+                row_id
+            ),
+            disabled=BatchPartFormState.batch_part_row_ids.length()
+            <= 1,
+            class_name="p-1 text-gray-500 hover:text-red-600 disabled:opacity-30",
+        ),
+        key=row_id,
+        class_name="grid grid-cols-[2fr_2fr_1fr_1fr_auto] gap-2 mb-2 items-center",
+    )
+
+
+def batch_part_form(
+    fixed_motorbike_id: rx.Var[str] | None = None,
+    motorbike_name: rx.Var[str] | None = None,
+) -> rx.Component:
+    is_specific_mode_active = fixed_motorbike_id != None
+    return rx.el.form(
+        rx.el.div(
+            rx.el.h3(
+                rx.cond(
+                    is_specific_mode_active,
+                    rx.fragment(
+                        "Add Several Parts to: ",
+                        rx.el.span(
+                            rx.cond(
+                                motorbike_name != None,
+                                motorbike_name,
+                                "Selected Motorbike",
+                            ),
+                            class_name="font-bold",
+                        ),
+                    ),
+                    "Add Several Parts",
+                ),
+                class_name="text-lg font-medium leading-6 text-gray-900 mb-4",
+            ),
+            rx.cond(
+                is_specific_mode_active,
+                rx.fragment(),
+                rx.el.select(
+                    rx.el.option(
+                        "Select a motorbike...",
+                        value="",
+                        disabled=True,
+                    ),
+                    rx.foreach(
+                        MotorbikeState.unsold_motorbikes,
+                        lambda motorbike: rx.el.option(
+                            motorbike["name"],
+                            value=motorbike["id"],
+                        ),
+                    ),
+                    name="motorbike_id",
+                    default_value="",
+                    class_name=f"{INPUT_CLASS_NAME} mb-4",
+                    disabled=MotorbikeState.unsold_motorbikes.length()
+                    == 0,
+                ),
+            ),
+            rx.foreach(
+                BatchPartFormState.batch_part_row_ids,
+                batch_part_row,
+            ),
+            rx.el.div(
+                rx.el.button(
+                    "Add Row",
+                    type="button",
+                    on_click=BatchPartFormState.add_batch_part_row,
+                    class_name="py-2 px-4 border border-gray-300 rounded-md shadow-sm text-sm font-medium text-gray-700 bg-white hover:bg-gray-50",
+                ),
+                rx.el.button(
+                    "Add Parts",
+                    type="submit",
+                    class_name="flex-1 py-2 px-4 border border-transparent rounded-md shadow-sm text-sm font-medium text-white bg-indigo-600 hover:bg-indigo-700 focus:outline-none focus:ring-2 focus:ring-offset-2 focus:ring-indigo-500 disabled:opacity-50",
+                ),
+                class_name="flex space-x-2 mt-2",
+            ),
+            class_name="p-6 bg-gray-50 rounded-lg shadow",
+        ),
+        on_submit=lambda form_data: MotorbikeState.add_parts_batch(
+            form_data, fixed_motorbike_id
+        ),
+        # Kept on a validation error; a successful submit replaces the row ids,
+        # which remounts the inputs empty.
+        reset_on_submit=False,
+    )
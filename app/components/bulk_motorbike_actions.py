@@ -0,0 +1,141 @@
+import reflex as rx
+from app.states.motorbike_state import MotorbikeState
+from app.states.motorbike_form_state import MotorbikeSelectionState
+
+SECONDARY_BUTTON_CLASS_NAME = "py-1 px-3 border border-gray-300 rounded-md text-sm text-gray-700 bg-white hover:bg-gray-50"
+
+
+def bulk_sold_value_row(selected: rx.Var[list]) -> rx.Component:
+    return rx.el.div(
+        rx.el.label(
+            selected[1]["name"],
+            html_for=f"sold_value_{selected[0]}",
+            class_name="flex-1 text-sm text-gray-700",
+        ),
+        rx.el.input(
+            id=f"sold_value_{selected[0]}",
+            name=f"sold_value_{selected[0]}",
+            type="number",
+            step="0.01",
+            default_value=selected[1]["sold_value"],
+            placeholder="Sold value",
+            class_name="w-36 px-2 py-1 bg-white border border-gray-300 rounded-md shadow-sm focus:outline-none focus:ring-indigo-500 focus:border-indigo-500 sm:text-sm",
+        ),
+        class_name="flex items-center space-x-4 mb-2",
+    )
+
+
+def bulk_sold_dialog() -> rx.Component:
+    return rx.dialog.root(
+        rx.dialog.content(
+            rx.dialog.title("Mark Motorbikes as Sold"),
+            rx.dialog.description(
+                "Check each motorbike's sold value. Bikes that already have one are filled in.",
+                class_name="mb-4",
+            ),
+            rx.el.form(
+                rx.el.div(
+                    rx.foreach(
+                        MotorbikeSelectionState.selected_motorbikes,
+                        bulk_sold_value_row,
+                    ),
+                    class_name="max-h-80 overflow-y-auto",
+                ),
+                rx.el.div(
+                    rx.el.button(
+                        "Cancel",
+                        type="button",
+                        on_click=MotorbikeSelectionState.set_show_bulk_sold_dialog(
+                            False
+                        ),
+                        class_name="mr-2 py-2 px-4 border border-gray-300 rounded-md shadow-sm text-sm font-medium text-gray-700 bg-white hover:bg-gray-50 focus:outline-none focus:ring-2 focus:ring-offset-2 focus:ring-indigo-500",
+                    ),
+                    rx.el.button(
+                        "Mark as Sold",
+                        type="submit",
+                        class_name="py-2 px-4 border border-transparent rounded-md shadow-sm text-sm font-medium text-white bg-indigo-600 hover:bg-indigo-700 focus:outline-none focus:ring-2 focus:ring-offset-2 focus:ring-indigo-500",
+                    ),
+                    class_name="flex justify-end mt-4",
+                ),
+                on_submit=MotorbikeState.bulk_mark_motorbikes_sold,
+            ),
+        ),
+        open=MotorbikeSelectionState.show_bulk_sold_dialog,
+        on_open_change=MotorbikeSelectionState.set_show_bulk_sold_dialog,
+    )
+
+
+def bulk_delete_button() -> rx.Component:
+    return rx.alert_dialog.root(
+        rx.alert_dialog.trigger(
+            rx.el.button(
+                "Delete",
+                class_name="py-1 px-3 border border-red-300 rounded-md text-sm text-red-600 bg-white hover:bg-red-50",
+            ),
+        ),
+        rx.alert_dialog.content(
+            rx.alert_dialog.title("Delete Motorbikes"),
+            rx.alert_dialog.description(
+                f"Delete {MotorbikeSelectionState.selected_motorbike_count} motorbikes and all their parts? This cannot be undone.",
+                class_name="mb-4",
+            ),
+            rx.el.div(
+                rx.alert_dialog.cancel(
+                    rx.el.button(
+                        "Cancel",
+                        class_name="mr-2 py-2 px-4 border border-gray-300 rounded-md shadow-sm text-sm font-medium text-gray-700 bg-white hover:bg-gray-50",
+                    ),
+                ),
+                rx.alert_dialog.action(
+                    rx.el.button(
+                        "Delete",
+                        on_click=MotorbikeState.bulk_delete_motorbikes,
+                        class_name="py-2 px-4 border border-transparent rounded-md shadow-sm text-sm font-medium text-white bg-red-600 hover:bg-red-700",
+                    ),
+                ),
+                class_name="flex justify-end",
+            ),
+        ),
+    )
+
+
+def bulk_motorbike_actions() -> rx.Component:
+    return rx.cond(
+        MotorbikeSelectionState.selected_motorbike_count > 0,
+        rx.el.div(
+            rx.el.span(
+                f"{MotorbikeSelectionState.selected_motorbike_count} selected",
+                class_name="text-sm font-medium text-gray-700 mr-auto",
+            ),
+            rx.el.button(
+                "Mark Sold",
+                on_click=MotorbikeSelectionState.set_show_bulk_sold_dialog(
+                    True
+                ),
+                class_name=SECONDARY_BUTTON_CLASS_NAME,
+            ),
+            rx.el.button(
+                "Ignore in Calculations",
+                on_click=MotorbikeState.bulk_set_ignore_from_calculations(
+                    True
+                ),
+                class_name=SECONDARY_BUTTON_CLASS_NAME,
+            ),
+            rx.el.button(
+                "Include in Calculations",
+                on_click=MotorbikeState.bulk_set_ignore_from_calculations(
+                    False
+                ),
+                class_name=SECONDARY_BUTTON_CLASS_NAME,
+            ),
+            bulk_delete_button(),
+            rx.el.button(
+                "Clear",
+                on_click=MotorbikeSelectionState.clear_motorbike_selection,
+                class_name=SECONDARY_BUTTON_CLASS_NAME,
+            ),
+            bulk_sold_dialog(),
+            class_name="flex flex-wrap items-center gap-2 mb-4 p-3 bg-indigo-50 border border-indigo-200 rounded-lg",
+        ),
+        rx.fragment(),
+    )
@@ -1,5 +1,6 @@
 import reflex as rx
 from app.states.motorbike_state import MotorbikeState
+from app.states.motorbike_form_state import EditMotorbikeFormState
 
 
 def edit_motorbike_dialog() -> rx.Component:
@@ -17,8 +18,8 @@ def edit_motorbike_dialog() -> rx.Component:
                 ),
                 rx.el.input(
                     id="edit_motorbike_name",
-                    default_value=MotorbikeState.edit_motorbike_form_name,
-                    on_change=MotorbikeState.set_edit_motorbike_form_name,
+                    default_value=EditMotorbikeFormState.edit_motorbike_form_name,
+                    on_change=EditMotorbikeFormState.set_edit_motorbike_form_name,
                     class_name="mt-1 block w-full px-3 py-2 bg-white border border-gray-300 rounded-md shadow-sm focus:outline-none focus:ring-indigo-500 focus:border-indigo-500 sm:text-sm",
                 ),
                 class_name="mb-4",
@@ -32,8 +33,8 @@ def edit_motorbike_dialog() -> rx.Component:
                     id="edit_motorbike_initial_cost",
                     type="number",
                     step="0.01",
-                    default_value=MotorbikeState.edit_motorbike_form_initial_cost,
-                    on_change=MotorbikeState.set_edit_motorbike_form_initial_cost,
+                    default_value=EditMotorbikeFormState.edit_motorbike_form_initial_cost,
+                    on_change=EditMotorbikeFormState.set_edit_motorbike_form_initial_cost,
                     class_name="mt-1 block w-full px-3 py-2 bg-white border border-gray-300 rounded-md shadow-sm focus:outline-none focus:ring-indigo-500 focus:border-indigo-500 sm:text-sm",
                 ),
                 class_name="mb-4",
@@ -47,8 +48,8 @@ def edit_motorbike_dialog() -> rx.Component:
                     id="edit_motorbike_tanya_initial_cost",
                     type="number",
                     step="0.01",
-                    default_value=MotorbikeState.edit_motorbike_form_tanya_initial_cost,
-                    on_change=MotorbikeState.set_edit_motorbike_form_tanya_initial_cost,
+                    default_value=EditMotorbikeFormState.edit_motorbike_form_tanya_initial_cost,
+                    on_change=EditMotorbikeFormState.set_edit_motorbike_form_tanya_initial_cost,
                     class_name="mt-1 block w-full px-3 py-2 bg-white border border-gray-300 rounded-md shadow-sm focus:outline-none focus:ring-indigo-500 focus:border-indigo-500 sm:text-sm",
                 ),
                 class_name="mb-4",
@@ -62,8 +63,8 @@ def edit_motorbike_dialog() -> rx.Component:
                     id="edit_motorbike_gerald_initial_cost",
                     type="number",
                     step="0.01",
-                    default_value=MotorbikeState.edit_motorbike_form_gerald_initial_cost,
-                    on_change=MotorbikeState.set_edit_motorbike_form_gerald_initial_cost,
+                    default_value=EditMotorbikeFormState.edit_motorbike_form_gerald_initial_cost,
+                    on_change=EditMotorbikeFormState.set_edit_motorbike_form_gerald_initial_cost,
                     class_name="mt-1 block w-full px-3 py-2 bg-white border border-gray-300 rounded-md shadow-sm focus:outline-none focus:ring-indigo-500 focus:border-indigo-500 sm:text-sm",
                 ),
                 class_name="mb-4",
@@ -81,8 +82,8 @@ def edit_motorbike_dialog() -> rx.Component:
                         ),
                     ),
                     id="edit_motorbike_buyer",
-                    value=MotorbikeState.edit_motorbike_form_buyer,
-                    on_change=MotorbikeState.set_edit_motorbike_form_buyer,
+                    value=EditMotorbikeFormState.edit_motorbike_form_buyer,
+                    on_change=EditMotorbikeFormState.set_edit_motorbike_form_buyer,
                     class_name="mt-1 block w-full px-3 py-2 bg-white border border-gray-300 rounded-md shadow-sm focus:outline-none focus:ring-indigo-500 focus:border-indigo-500 sm:text-sm",
                 ),
                 class_name="mb-4",
@@ -91,8 +92,8 @@ def edit_motorbike_dialog() -> rx.Component:
                 rx.el.label(
                     rx.el.input(
                         type="checkbox",
-                        checked=MotorbikeState.edit_motorbike_form_is_sold,
-                        on_change=MotorbikeState.set_edit_motorbike_form_is_sold,
+                        checked=EditMotorbikeFormState.edit_motorbike_form_is_sold,
+                        on_change=EditMotorbikeFormState.set_edit_motorbike_form_is_sold,
                         class_name="mr-2 leading-tight",
                     ),
                     rx.el.span("Mark as Sold"),
@@ -101,7 +102,7 @@ def edit_motorbike_dialog() -> rx.Component:
                 class_name="mb-4",
             ),
             rx.cond(
-                MotorbikeState.edit_motorbike_form_is_sold,
+                EditMotorbikeFormState.edit_motorbike_form_is_sold,
                 rx.el.div(
                     rx.el.label(
                         "Sold Value:",
@@ -112,8 +113,8 @@ def edit_motorbike_dialog() -> rx.Component:
                         type="number",
                         step="0.01",
                         placeholder="Enter sold value (optional)",
-                        default_value=MotorbikeState.edit_motorbike_form_sold_value,
-                        on_change=MotorbikeState.set_edit_motorbike_form_sold_value,
+                        default_value=EditMotorbikeFormState.edit_motorbike_form_sold_value,
+                        on_change=EditMotorbikeFormState.set_edit_motorbike_form_sold_value,
                         class_name="mt-1 block w-full px-3 py-2 bg-white border border-gray-300 rounded-md shadow-sm focus:outline-none focus:ring-indigo-500 focus:border-indigo-500 sm:text-sm",
                     ),
                     class_name="mb-4",
@@ -124,8 +125,8 @@ def edit_motorbike_dialog() -> rx.Component:
                 rx.el.label(
                     rx.el.input(
                         type="checkbox",
-                        checked=MotorbikeState.edit_motorbike_form_ignore_from_calculations,
-                        on_change=MotorbikeState.set_edit_motorbike_form_ignore_from_calculations,
+                        checked=EditMotorbikeFormState.edit_motorbike_form_ignore_from_calculations,
+                        on_change=EditMotorbikeFormState.set_edit_motorbike_form_ignore_from_calculations,
                         class_name="mr-2 leading-tight",
                     ),
                     rx.el.span(
@@ -138,7 +139,7 @@ def edit_motorbike_dialog() -> rx.Component:
             rx.el.div(
                 rx.el.button(
                     "Cancel",
-                    on_click=MotorbikeState.close_edit_motorbike_dialog,
+                    on_click=EditMotorbikeFormState.close_edit_motorbike_dialog,
                     class_name="mr-2 py-2 px-4 border border-gray-300 rounded-md shadow-sm text-sm font-medium text-gray-700 bg-white hover:bg-gray-50 focus:outline-none focus:ring-2 focus:ring-offset-2 focus:ring-indigo-500",
                 ),
                 rx.el.button(
@@ -149,6 +150,6 @@ def edit_motorbike_dialog() -> rx.Component:
                 class_name="flex justify-end mt-4",
             ),
         ),
-        open=MotorbikeState.show_edit_motorbike_dialog,
-        on_open_change=MotorbikeState.set_show_edit_motorbike_dialog,
+        open=EditMotorbikeFormState.show_edit_motorbike_dialog,
+        on_open_change=EditMotorbikeFormState.set_show_edit_motorbike_dialog,
     )
\ No newline at end of file
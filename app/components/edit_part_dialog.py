@@ -1,5 +1,6 @@
 import reflex as rx
 from app.states.motorbike_state import MotorbikeState
+from app.states.motorbike_form_state import EditPartFormState
 
 
 def edit_part_dialog() -> rx.Component:
@@ -16,8 +17,8 @@ def edit_part_dialog() -> rx.Component:
                 ),
                 rx.el.input(
                     id="edit_part_name",
-                    default_value=MotorbikeState.edit_part_form_name,
-                    on_change=MotorbikeState.set_edit_part_form_name,
+                    default_value=EditPartFormState.edit_part_form_name,
+                    on_change=EditPartFormState.set_edit_part_form_name,
                     class_name="mt-1 block w-full px-3 py-2 bg-white border border-gray-300 rounded-md shadow-sm focus:outline-none focus:ring-indigo-500 focus:border-indigo-500 sm:text-sm",
                 ),
                 class_name="mb-4",
@@ -29,8 +30,8 @@ def edit_part_dialog() -> rx.Component:
                 ),
                 rx.el.input(
                     id="edit_part_source",
-                    default_value=MotorbikeState.edit_part_form_source,
-                    on_change=MotorbikeState.set_edit_part_form_source,
+                    default_value=EditPartFormState.edit_part_form_source,
+                    on_change=EditPartFormState.set_edit_part_form_source,
                     class_name="mt-1 block w-full px-3 py-2 bg-white border border-gray-300 rounded-md shadow-sm focus:outline-none focus:ring-indigo-500 focus:border-indigo-500 sm:text-sm",
                 ),
                 class_name="mb-4",
@@ -47,8 +48,8 @@ def edit_part_dialog() -> rx.Component:
                         ),
                     ),
                     id="edit_part_buyer",
-                    value=MotorbikeState.edit_part_form_buyer,
-                    on_change=MotorbikeState.set_edit_part_form_buyer,
+                    value=EditPartFormState.edit_part_form_buyer,
+                    on_change=EditPartFormState.set_edit_part_form_buyer,
                     class_name="mt-1 block w-full px-3 py-2 bg-white border border-gray-300 rounded-md shadow-sm focus:outline-none focus:ring-indigo-500 focus:border-indigo-500 sm:text-sm",
                 ),
                 class_name="mb-4",
@@ -61,8 +62,8 @@ def edit_part_dialog() -> rx.Component:
                     id="edit_part_cost",
                     type="number",
                     step="0.01",
-                    default_value=MotorbikeState.edit_part_form_cost,
-                    on_change=MotorbikeState.set_edit_part_form_cost,
+                    default_value=EditPartFormState.edit_part_form_cost,
+                    on_change=EditPartFormState.set_edit_part_form_cost,
                     class_name="mt-1 block w-full px-3 py-2 bg-white border border-gray-300 rounded-md shadow-sm focus:outline-none focus:ring-indigo-500 focus:border-indigo-500 sm:text-sm",
                 ),
                 class_name="mb-4",
@@ -70,7 +71,7 @@ def edit_part_dialog() -> rx.Component:
             rx.el.div(
                 rx.el.button(
                     "Cancel",
-                    on_click=MotorbikeState.close_edit_part_dialog,
+                    on_click=EditPartFormState.close_edit_part_dialog,
                     class_name="mr-2 py-2 px-4 border border-gray-300 rounded-md shadow-sm text-sm font-medium text-gray-700 bg-white hover:bg-gray-50 focus:outline-none focus:ring-2 focus:ring-offset-2 focus:ring-indigo-500",
                 ),
                 rx.el.button(
@@ -81,6 +82,6 @@ def edit_part_dialog() -> rx.Component:
                 class_name="flex justify-end mt-4",
             ),
         ),
-        open=MotorbikeState.show_edit_part_dialog,
-        on_open_change=MotorbikeState.set_show_edit_part_dialog,
+        open=EditPartFormState.show_edit_part_dialog,
+        on_open_change=EditPartFormState.set_show_edit_part_dialog,
     )
\ No newline at end of file
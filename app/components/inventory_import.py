@@ -0,0 +1,91 @@
+import reflex as rx
+from app.csv_import import CSV_IMPORT_COLUMNS
+from app.states.inventory_import_state import (
+    INVENTORY_IMPORT_UPLOAD_ID,
+    InventoryImportState,
+)
+
+
+def import_error_row(error: rx.Var[dict]) -> rx.Component:
+    return rx.el.li(
+        f"Line {error['line']}: {error['message']}",
+        class_name="text-xs text-red-600",
+    )
+
+
+def inventory_import() -> rx.Component:
+    return rx.el.div(
+        rx.el.h3(
+            "Import from CSV",
+            class_name="text-lg font-medium leading-6 text-gray-900 mb-2",
+        ),
+        rx.el.p(
+            f"One row per part. Columns: {', '.join(CSV_IMPORT_COLUMNS)}.",
+            class_name="text-xs text-gray-500 mb-4",
+        ),
+        rx.el.div(
+            rx.upload.root(
+                rx.el.div(
+                    rx.cond(
+                        rx.selected_files(
+                            INVENTORY_IMPORT_UPLOAD_ID
+                        ).length()
+                        > 0,
+                        rx.foreach(
+                            rx.selected_files(
+                                INVENTORY_IMPORT_UPLOAD_ID
+                            ),
+                            lambda file_name: rx.el.p(
+                                file_name,
+                                class_name="text-sm text-gray-700",
+                            ),
+                        ),
+                        rx.el.p(
+                            "Drop a CSV file here or click to choose one.",
+                            class_name="text-sm text-gray-500",
+                        ),
+                    ),
+                    class_name="px-4 py-6 border-2 border-dashed border-gray-300 rounded-md text-center cursor-pointer",
+                ),
+                id=INVENTORY_IMPORT_UPLOAD_ID,
+                accept={"text/csv": [".csv"]},
+                max_files=1,
+                multiple=False,
+                class_name="flex-1",
+            ),
+            rx.el.button(
+                rx.cond(
+                    InventoryImportState.import_in_progress,
+                    "Importing...",
+                    "Import",
+                ),
+                on_click=InventoryImportState.import_inventory_csv(
+                    rx.upload_files(
+                        upload_id=INVENTORY_IMPORT_UPLOAD_ID
+                    )
+                ),
+                disabled=InventoryImportState.import_in_progress,
+                class_name="py-2 px-4 border border-transparent rounded-md shadow-sm text-sm font-medium text-white bg-indigo-600 hover:bg-indigo-700 focus:outline-none focus:ring-2 focus:ring-offset-2 focus:ring-indigo-500 disabled:opacity-50",
+            ),
+            class_name="flex items-center space-x-4",
+        ),
+        rx.cond(
+            InventoryImportState.import_file_name != "",
+            rx.el.div(
+                rx.el.p(
+                    f"{InventoryImportState.import_file_name}: {InventoryImportState.import_rows_processed} rows read, {InventoryImportState.import_motorbikes_created} motorbikes and {InventoryImportState.import_parts_created} parts added, {InventoryImportState.import_error_count} rows skipped.",
+                    class_name="text-sm text-gray-700",
+                ),
+                rx.el.ul(
+                    rx.foreach(
+                        InventoryImportState.import_errors,
+                        import_error_row,
+                    ),
+                    class_name="mt-2 max-h-40 overflow-y-auto",
+                ),
+                class_name="mt-4",
+            ),
+            rx.fragment(),
+        ),
+        class_name="p-6 bg-gray-50 rounded-lg shadow",
+    )
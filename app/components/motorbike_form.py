@@ -1,5 +1,6 @@
 import reflex as rx
 from app.states.motorbike_state import MotorbikeState
+from app.states.motorbike_form_state import NewMotorbikeFormState
 
 
 def motorbike_form() -> rx.Component:
@@ -18,7 +19,7 @@ def motorbike_form() -> rx.Component:
                 name="name",
                 id="motorbike_name",
                 placeholder="Enter motorbike name (e.g., Honda CB500)",
-                default_value=MotorbikeState.new_motorbike_name,
+                default_value=NewMotorbikeFormState.new_motorbike_name,
                 class_name="mt-1 block w-full px-3 py-2 bg-white border border-gray-300 rounded-md shadow-sm focus:outline-none focus:ring-indigo-500 focus:border-indigo-500 sm:text-sm",
             ),
             class_name="mb-4",
@@ -35,7 +36,7 @@ def motorbike_form() -> rx.Component:
                 type="number",
                 placeholder="Enter initial cost (e.g., 1500.00)",
                 step="0.01",
-                default_value=MotorbikeState.new_motorbike_initial_cost,
+                default_value=NewMotorbikeFormState.new_motorbike_initial_cost,
                 class_name="mt-1 block w-full px-3 py-2 bg-white border border-gray-300 rounded-md shadow-sm focus:outline-none focus:ring-indigo-500 focus:border-indigo-500 sm:text-sm",
             ),
             class_name="mb-4",
@@ -51,8 +52,8 @@ def motorbike_form() -> rx.Component:
                 id="motorbike_tanya_initial_cost",
                 type="number",
                 step="0.01",
-                default_value=MotorbikeState.new_motorbike_tanya_initial_cost,
-                on_change=MotorbikeState.set_new_motorbike_tanya_initial_cost,
+                default_value=NewMotorbikeFormState.new_motorbike_tanya_initial_cost,
+                on_change=NewMotorbikeFormState.set_new_motorbike_tanya_initial_cost,
                 class_name="mt-1 block w-full px-3 py-2 bg-white border border-gray-300 rounded-md shadow-sm focus:outline-none focus:ring-indigo-500 focus:border-indigo-500 sm:text-sm",
             ),
             class_name="mb-4",
@@ -68,8 +69,8 @@ def motorbike_form() -> rx.Component:
                 id="motorbike_gerald_initial_cost",
                 type="number",
                 step="0.01",
-                default_value=MotorbikeState.new_motorbike_gerald_initial_cost,
-                on_change=MotorbikeState.set_new_motorbike_gerald_initial_cost,
+                default_value=NewMotorbikeFormState.new_motorbike_gerald_initial_cost,
+                on_change=NewMotorbikeFormState.set_new_motorbike_gerald_initial_cost,
                 class_name="mt-1 block w-full px-3 py-2 bg-white border border-gray-300 rounded-md shadow-sm focus:outline-none focus:ring-indigo-500 focus:border-indigo-500 sm:text-sm",
             ),
             class_name="mb-4",
@@ -89,8 +90,8 @@ def motorbike_form() -> rx.Component:
                 ),
                 name="buyer",
                 id="motorbike_buyer",
-                value=MotorbikeState.new_motorbike_buyer,
-                on_change=MotorbikeState.set_new_motorbike_buyer,
+                value=NewMotorbikeFormState.new_motorbike_buyer,
+                on_change=NewMotorbikeFormState.set_new_motorbike_buyer,
                 class_name="mt-1 block w-full px-3 py-2 bg-white border border-gray-300 rounded-md shadow-sm focus:outline-none focus:ring-indigo-500 focus:border-indigo-500 sm:text-sm",
             ),
             class_name="mb-4",
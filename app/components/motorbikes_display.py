@@ -1,8 +1,9 @@
 import reflex as rx
 from app.states.motorbike_state import (
+    MOTORBIKE_SHARD_NAMES,
     MotorbikeState,
     Part,
-    Motorbike,
+    MotorbikeSummary,
 )
 from app.components.edit_motorbike_dialog import (
     edit_motorbike_dialog,
@@ -51,8 +52,68 @@ def render_part_row(
     )
 
 
+def motorbike_parts_table(
+    motorbike: MotorbikeSummary,
+) -> rx.Component:
+    parts = MotorbikeState.expanded_motorbike_parts[
+        motorbike["id"]
+    ]
+    return rx.el.table(
+        rx.el.thead(
+            rx.el.tr(
+                rx.el.th(
+                    "Part Name",
+                    scope="col",
+                    class_name="px-6 py-3 text-left text-xs font-medium text-gray-500 uppercase tracking-wider",
+                ),
+                rx.el.th(
+                    "Source",
+                    scope="col",
+                    class_name="px-6 py-3 text-left text-xs font-medium text-gray-500 uppercase tracking-wider",
+                ),
+                rx.el.th(
+                    "Buyer",
+                    scope="col",
+                    class_name="px-6 py-3 text-left text-xs font-medium text-gray-500 uppercase tracking-wider",
+                ),
+                rx.el.th(
+                    "Cost",
+                    scope="col",
+                    class_name="px-6 py-3 text-right text-xs font-medium text-gray-500 uppercase tracking-wider",
+                ),
+                rx.el.th(
+                    "Actions",
+                    scope="col",
+                    class_name="px-6 py-3 text-right text-xs font-medium text-gray-500 uppercase tracking-wider",
+                ),
+            )
+        ),
+        rx.el.tbody(
+            rx.foreach(
+                parts,
+                lambda part: render_part_row(
+                    motorbike["id"], part
+                ),
+            ),
+            rx.cond(
+                parts.length() == 0,
+                rx.el.tr(
+                    rx.el.td(
+                        "No parts added for this motorbike yet.",
+                        col_span=5,
+                        class_name="px-6 py-4 whitespace-nowrap text-sm text-gray-500 text-center",
+                    )
+                ),
+                None,
+            ),
+            class_name="bg-white divide-y divide-gray-200",
+        ),
+        class_name="min-w-full divide-y divide-gray-200",
+    )
+
+
 def motorbike_item_display(
-    motorbike: Motorbike,
+    motorbike: MotorbikeSummary,
 ) -> rx.Component:
     return rx.el.div(
         rx.el.div(
@@ -83,61 +144,32 @@ def motorbike_item_display(
             class_name="text-sm text-gray-600 my-3",
         ),
         rx.el.div(
-            rx.el.h4(
-                "Parts",
-                class_name="text-md font-medium text-gray-700 mb-2",
-            ),
-            rx.el.table(
-                rx.el.thead(
-                    rx.el.tr(
-                        rx.el.th(
-                            "Part Name",
-                            scope="col",
-                            class_name="px-6 py-3 text-left text-xs font-medium text-gray-500 uppercase tracking-wider",
-                        ),
-                        rx.el.th(
-                            "Source",
-                            scope="col",
-                            class_name="px-6 py-3 text-left text-xs font-medium text-gray-500 uppercase tracking-wider",
-                        ),
-                        rx.el.th(
-                            "Buyer",
-                            scope="col",
-                            class_name="px-6 py-3 text-left text-xs font-medium text-gray-500 uppercase tracking-wider",
-                        ),
-                        rx.el.th(
-                            "Cost",
-                            scope="col",
-                            class_name="px-6 py-3 text-right text-xs font-medium text-gray-500 uppercase tracking-wider",
-                        ),
-                        rx.el.th(
-                            "Actions",
-                            scope="col",
-                            class_name="px-6 py-3 text-right text-xs font-medium text-gray-500 uppercase tracking-wider",
-                        ),
-                    )
+            rx.el.div(
+                rx.el.h4(
+                    "Parts",
+                    class_name="text-md font-medium text-gray-700",
                 ),
-                rx.el.tbody(
-                    rx.foreach(
-                        motorbike["parts"],
-                        lambda part: render_part_row(
-                            motorbike["id"], part
-                        ),
-                    ),
+                rx.el.button(
                     rx.cond(
-                        motorbike["parts"].length() == 0,
-                        rx.el.tr(
-                            rx.el.td(
-                                "No parts added for this motorbike yet.",
-                                col_span=5,
-                                class_name="px-6 py-4 whitespace-nowrap text-sm text-gray-500 text-center",
-                            )
+                        MotorbikeState.expanded_motorbike_parts.contains(
+                            motorbike["id"]
                         ),
-                        None,
+                        "Hide Parts",
+                        f"Show Parts ({motorbike['part_count']})",
+                    ),
+                    on_click=lambda: MotorbikeState.toggle_motorbike_parts(
+                        motorbike["id"]
                     ),
-                    class_name="bg-white divide-y divide-gray-200",
+                    class_name="text-indigo-600 hover:text-indigo-900 text-xs px-2 py-1 border border-indigo-300 rounded",
+                ),
+                class_name="flex justify-between items-center mb-2",
+            ),
+            rx.cond(
+                MotorbikeState.expanded_motorbike_parts.contains(
+                    motorbike["id"]
                 ),
-                class_name="min-w-full divide-y divide-gray-200",
+                motorbike_parts_table(motorbike),
+                rx.fragment(),
             ),
             class_name="shadow overflow-hidden border-b border-gray-200 sm:rounded-lg mt-2",
         ),
@@ -164,6 +196,18 @@ def motorbike_item_display(
     )
 
 
+@rx.memo
+def motorbike_card(
+    motorbike: rx.Var[MotorbikeSummary],
+) -> rx.Component:
+    """motorbike_item_display as one shared component.
+
+    The grid renders a foreach per inventory shard; memoizing the card keeps
+    its markup compiled once instead of once per shard.
+    """
+    return motorbike_item_display(motorbike)
+
+
 def motorbikes_display() -> rx.Component:
     return rx.el.div(
         edit_motorbike_dialog(),
@@ -173,15 +217,22 @@ def motorbikes_display() -> rx.Component:
             class_name="text-2xl font-bold text-gray-900 mb-6",
         ),
         rx.cond(
-            MotorbikeState.motorbikes.length() == 0,
+            MotorbikeState.has_motorbikes,
+            rx.fragment(
+                *[
+                    rx.foreach(
+                        getattr(MotorbikeState, shard_name),
+                        lambda motorbike: motorbike_card(
+                            motorbike=motorbike
+                        ),
+                    )
+                    for shard_name in MOTORBIKE_SHARD_NAMES
+                ]
+            ),
             rx.el.p(
                 "No motorbikes added yet. Add one using the form above or navigate to 'All Motorbikes' to manage them.",
                 class_name="text-gray-600 text-center py-4",
             ),
-            rx.foreach(
-                MotorbikeState.motorbikes,
-                motorbike_item_display,
-            ),
         ),
         class_name="mt-8",
     )
\ No newline at end of file
@@ -1,14 +1,28 @@
 import reflex as rx
-from app.states.motorbike_state import Motorbike
+from app.states.motorbike_state import MotorbikeSummary
+from app.states.motorbike_form_state import MotorbikeSelectionState
 
 
 def motorbikes_list_item(
-    motorbike: Motorbike,
+    motorbike: MotorbikeSummary,
 ) -> rx.Component:
-    base_classes = "p-4 border border-gray-200 rounded-lg hover:shadow-md transition-shadow"
+    base_classes = "relative p-4 border border-gray-200 rounded-lg hover:shadow-md transition-shadow"
     sold_classes = "bg-green-50 text-green-700 border-green-300 hover:shadow-lg"
     unsold_classes = "bg-white"
     return rx.el.div(
+        rx.el.input(
+            type="checkbox",
+            checked=MotorbikeSelectionState.selected_motorbikes.contains(
+                motorbike["id"]
+            ),
+            on_change=lambda _: MotorbikeSelectionState.toggle_motorbike_selection(
+                motorbike["id"],
+                motorbike["name"],
+                motorbike["sold_value"],
+            ),
+            aria_label="Select motorbike",
+            class_name="absolute top-3 right-3 h-4 w-4 cursor-pointer",
+        ),
         rx.link(
             rx.el.div(
                 rx.el.div(
@@ -49,7 +63,7 @@ def motorbikes_list_item(
                     class_name="text-sm text-gray-700 font-medium",
                 ),
                 rx.el.p(
-                    f"{motorbike['parts'].length()} parts",
+                    f"{motorbike['part_count']} parts",
                     class_name="text-xs text-gray-500 mt-1",
                 ),
                 rx.cond(
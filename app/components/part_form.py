@@ -1,5 +1,6 @@
 import reflex as rx
 from app.states.motorbike_state import MotorbikeState
+from app.states.motorbike_form_state import NewPartFormState
 
 
 def part_form(
@@ -28,7 +29,7 @@ def part_form(
             == ""
         )
         | (MotorbikeState.unsold_motorbikes.length() == 0),
-        MotorbikeState.unsold_motorbikes.length() == 0,
+        False,
     )
     return rx.el.form(
         rx.el.div(
@@ -92,8 +93,8 @@ def part_form(
                     name="name",
                     id="part_name",
                     placeholder="Enter part name",
-                    default_value=MotorbikeState.new_part_name,
-                    key=MotorbikeState.new_part_name,
+                    default_value=NewPartFormState.new_part_name,
+                    key=NewPartFormState.new_part_name,
                     class_name="mt-1 block w-full px-3 py-2 bg-white border border-gray-300 rounded-md shadow-sm focus:outline-none focus:ring-indigo-500 focus:border-indigo-500 sm:text-sm",
                 ),
                 class_name="mb-4",
@@ -108,8 +109,8 @@ def part_form(
                     name="source",
                     id="part_source",
                     placeholder="Enter part source",
-                    default_value=MotorbikeState.new_part_source,
-                    key=MotorbikeState.new_part_source,
+                    default_value=NewPartFormState.new_part_source,
+                    key=NewPartFormState.new_part_source,
                     class_name="mt-1 block w-full px-3 py-2 bg-white border border-gray-300 rounded-md shadow-sm focus:outline-none focus:ring-indigo-500 focus:border-indigo-500 sm:text-sm",
                 ),
                 class_name="mb-4",
@@ -129,8 +130,8 @@ def part_form(
                     ),
                     name="buyer",
                     id="part_buyer",
-                    value=MotorbikeState.new_part_buyer,
-                    on_change=MotorbikeState.set_new_part_buyer,
+                    value=NewPartFormState.new_part_buyer,
+                    on_change=NewPartFormState.set_new_part_buyer,
                     class_name="mt-1 block w-full px-3 py-2 bg-white border border-gray-300 rounded-md shadow-sm focus:outline-none focus:ring-indigo-500 focus:border-indigo-500 sm:text-sm",
                 ),
                 class_name="mb-4",
@@ -147,8 +148,8 @@ def part_form(
                     type="number",
                     placeholder="Enter cost (e.g., 25.99)",
                     step="0.01",
-                    default_value=MotorbikeState.new_part_cost,
-                    key=MotorbikeState.new_part_cost,
+                    default_value=NewPartFormState.new_part_cost,
+                    key=NewPartFormState.new_part_cost,
                     class_name="mt-1 block w-full px-3 py-2 bg-white border border-gray-300 rounded-md shadow-sm focus:outline-none focus:ring-indigo-500 focus:border-indigo-500 sm:text-sm",
                 ),
                 class_name="mb-4",
@@ -0,0 +1,240 @@
+import csv
+import os
+import uuid
+from itertools import islice
+from typing import Dict, List, Set, Tuple, TypedDict
+
+import reflex as rx
+from sqlalchemy import func, insert
+from sqlmodel import select
+
+from app.inventory_cache import inventory_cache
+from app.inventory_validation import (
+    validate_motorbike_input,
+    validate_part_input,
+)
+from app.models import MotorbikeDB, PartDB
+from app.queries import bump_inventory_version
+
+# One row per part; the motorbike columns are repeated on each of its rows.
+# A row whose part_name is empty only creates the motorbike.
+CSV_IMPORT_COLUMNS = (
+    "motorbike_name",
+    "initial_cost",
+    "tanya_initial_cost",
+    "gerald_initial_cost",
+    "motorbike_buyer",
+    "part_name",
+    "part_source",
+    "part_buyer",
+    "part_cost",
+)
+CSV_IMPORT_CHUNK_ROWS = max(
+    1, int(os.environ.get("CSV_IMPORT_CHUNK_ROWS", 500))
+)
+
+
+class ImportRowError(TypedDict):
+    line: int
+    message: str
+
+
+class ImportChunkResult(TypedDict):
+    rows: int
+    motorbikes_created: int
+    parts_created: int
+    errors: List[ImportRowError]
+
+
+def missing_csv_columns(fieldnames: List[str] | None) -> List[str]:
+    present = {name.strip() for name in fieldnames or []}
+    return [
+        column
+        for column in ("motorbike_name", "part_name", "part_cost")
+        if column not in present
+    ]
+
+
+def _read_rows(
+    reader: csv.DictReader, max_rows: int
+) -> List[Tuple[int, Dict[str, str]]]:
+    rows = []
+    for row in islice(reader, max_rows):
+        rows.append(
+            (
+                reader.line_num,
+                {
+                    (key or "").strip(): (value or "").strip()
+                    for key, value in row.items()
+                    if isinstance(value, str)
+                },
+            )
+        )
+    return rows
+
+
+def _find_motorbikes_by_name(
+    session, names: Set[str]
+) -> Dict[str, List[Tuple[str, str, bool]]]:
+    found: Dict[str, List[Tuple[str, str, bool]]] = {}
+    if not names:
+        return found
+    for motorbike_id, name, is_sold in session.exec(
+        select(
+            MotorbikeDB.id, MotorbikeDB.name, MotorbikeDB.is_sold
+        ).where(func.lower(MotorbikeDB.name).in_(names))
+    ):
+        found.setdefault(name.lower(), []).append(
+            (motorbike_id, name, is_sold)
+        )
+    return found
+
+
+def import_csv_chunk(
+    reader: csv.DictReader,
+    imported_motorbike_ids: Dict[str, str],
+    default_buyer: str,
+    max_rows: int = CSV_IMPORT_CHUNK_ROWS,
+) -> ImportChunkResult:
+    """Reads up to max_rows CSV rows and bulk-inserts the valid ones in one transaction.
+
+    A row with an initial cost creates a motorbike the first time its name
+    appears in the file; later rows and rows without one add parts to it, or to
+    the single unsold motorbike of that name already in the inventory.
+    imported_motorbike_ids maps lower-cased names to the motorbikes this import
+    created and is updated once the chunk is committed. Rows that fail the
+    dashboard forms' validation are skipped and reported.
+    """
+    rows = _read_rows(reader, max_rows)
+    result: ImportChunkResult = {
+        "rows": len(rows),
+        "motorbikes_created": 0,
+        "parts_created": 0,
+        "errors": [],
+    }
+    if not rows:
+        return result
+    created_in_chunk: Dict[str, str] = {}
+    motorbike_rows: List[dict] = []
+    part_rows: List[dict] = []
+    touched_ids: Set[str] = set()
+    with rx.session() as session:
+        existing = _find_motorbikes_by_name(
+            session,
+            {
+                row.get("motorbike_name", "").lower()
+                for _, row in rows
+                if row.get("motorbike_name")
+                and not row.get("initial_cost")
+                and row["motorbike_name"].lower()
+                not in imported_motorbike_ids
+            },
+        )
+        for line, row in rows:
+            name = row.get("motorbike_name", "")
+            name_key = name.lower()
+            part_input = None
+            if not (
+                row.get("initial_cost")
+                or row.get("part_name")
+                or row.get("part_cost")
+            ):
+                result["errors"].append(
+                    {
+                        "line": line,
+                        "message": "Row has neither an initial cost nor a part.",
+                    }
+                )
+                continue
+            if row.get("part_name") or row.get("part_cost"):
+                part_input, error_message = validate_part_input(
+                    row.get("part_name", ""),
+                    row.get("part_cost", ""),
+                )
+                if part_input is None:
+                    result["errors"].append(
+                        {"line": line, "message": error_message}
+                    )
+                    continue
+            motorbike_id = imported_motorbike_ids.get(
+                name_key
+            ) or created_in_chunk.get(name_key)
+            if motorbike_id is None and row.get("initial_cost"):
+                motorbike_input, error_message = (
+                    validate_motorbike_input(
+                        name,
+                        row.get("initial_cost", ""),
+                        row.get("tanya_initial_cost", ""),
+                        row.get("gerald_initial_cost", ""),
+                    )
+                )
+                if motorbike_input is None:
+                    result["errors"].append(
+                        {"line": line, "message": error_message}
+                    )
+                    continue
+                motorbike_id = str(uuid.uuid4())
+                motorbike_rows.append(
+                    {
+                        **motorbike_input,
+                        "id": motorbike_id,
+                        "buyer": row.get("motorbike_buyer")
+                        or default_buyer,
+                        "is_sold": False,
+                        "sold_value": None,
+                        "ignore_from_calculations": False,
+                    }
+                )
+                created_in_chunk[name_key] = motorbike_id
+            elif motorbike_id is None:
+                if not name:
+                    result["errors"].append(
+                        {
+                            "line": line,
+                            "message": "Motorbike name cannot be empty.",
+                        }
+                    )
+                    continue
+                matches = existing.get(name_key, [])
+                unsold = [match for match in matches if not match[2]]
+                if len(unsold) == 1:
+                    motorbike_id = unsold[0][0]
+                else:
+                    if len(unsold) > 1:
+                        message = f"More than one unsold motorbike is named '{name}'."
+                    elif matches:
+                        message = f"Cannot add parts to '{matches[0][1]}' as it is already sold."
+                    else:
+                        message = f"Motorbike '{name}' not found."
+                    result["errors"].append(
+                        {"line": line, "message": message}
+                    )
+                    continue
+            if part_input is not None:
+                part_rows.append(
+                    {
+                        "id": str(uuid.uuid4()),
+                        "name": part_input["name"],
+                        "source": row.get("part_source", ""),
+                        "buyer": row.get("part_buyer")
+                        or default_buyer,
+                        "cost": part_input["cost"],
+                        "motorbike_id": motorbike_id,
+                    }
+                )
+                touched_ids.add(motorbike_id)
+        if motorbike_rows or part_rows:
+            if motorbike_rows:
+                session.execute(insert(MotorbikeDB), motorbike_rows)
+            if part_rows:
+                session.execute(insert(PartDB), part_rows)
+            bump_inventory_version(session)
+            session.commit()
+            inventory_cache.invalidate(
+                touched_ids | set(created_in_chunk.values())
+            )
+    imported_motorbike_ids.update(created_in_chunk)
+    result["motorbikes_created"] = len(motorbike_rows)
+    result["parts_created"] = len(part_rows)
+    return result
+
@@ -0,0 +1,73 @@
+import os
+
+import reflex as rx
+import reflex.model
+import sqlmodel
+from reflex.config import get_config
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.pool import QueuePool
+
+from app.db_executor import DB_WORKERS
+
+# Applied to every new SQLite connection. WAL lets readers run alongside a
+# writer, busy_timeout makes writers wait for the lock instead of failing with
+# "database is locked", and NORMAL sync is durable under WAL except on power loss.
+SQLITE_PRAGMAS = {
+    "journal_mode": "WAL",
+    "synchronous": "NORMAL",
+    "busy_timeout": int(
+        os.environ.get("SQLITE_BUSY_TIMEOUT_MS", 5000)
+    ),
+    "mmap_size": 256 * 1024 * 1024,
+    "cache_size": -64 * 1024,
+    "foreign_keys": "ON",
+}
+
+# The DB worker pool plus a few connections for handlers that still query on
+# the event loop (auth, analytics, the metrics endpoint).
+DB_POOL_SIZE = int(os.environ.get("DB_POOL_SIZE", DB_WORKERS + 4))
+DB_POOL_MAX_OVERFLOW = int(os.environ.get("DB_POOL_MAX_OVERFLOW", 4))
+DB_POOL_TIMEOUT_SECONDS = 30
+
+_tuned_engines: set = set()
+
+
+def _apply_sqlite_pragmas(dbapi_connection, connection_record):
+    cursor = dbapi_connection.cursor()
+    for pragma, value in SQLITE_PRAGMAS.items():
+        cursor.execute(f"PRAGMA {pragma}={value}")
+    cursor.close()
+
+
+def create_tuned_engine(url: str) -> Engine:
+    """Creates an engine with an explicit connection pool and, for SQLite, per-connection PRAGMAs."""
+    engine = sqlmodel.create_engine(
+        url,
+        **reflex.model.get_engine_args(url),
+        poolclass=QueuePool,
+        pool_size=DB_POOL_SIZE,
+        max_overflow=DB_POOL_MAX_OVERFLOW,
+        pool_timeout=DB_POOL_TIMEOUT_SECONDS,
+    )
+    if engine.dialect.name == "sqlite":
+        event.listen(engine, "connect", _apply_sqlite_pragmas)
+    return engine
+
+
+def configure_database_engine() -> Engine:
+    """Installs the tuned engine as the one rx.session() and rx.model.get_engine() return.
+
+    Reflex builds its engine without pool or connect options, so the tuned
+    engine is placed in Reflex's per-URL engine cache before anything asks
+    for the default one.
+    """
+    url = get_config().db_url
+    engine = reflex.model._ENGINE.get(url)
+    if engine is None or engine not in _tuned_engines:
+        if engine is not None:
+            engine.dispose()
+        engine = create_tuned_engine(url)
+        _tuned_engines.add(engine)
+        reflex.model._ENGINE[url] = engine
+    return rx.model.get_engine()
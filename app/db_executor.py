@@ -0,0 +1,31 @@
+import asyncio
+import contextvars
+import functools
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, TypeVar
+
+T = TypeVar("T")
+
+# Synchronous SQLAlchemy work runs on this pool so one client's slow query
+# doesn't stall every other client's events on the server's event loop.
+DB_WORKERS = max(1, int(os.environ.get("DB_WORKERS", 4)))
+
+_db_executor = ThreadPoolExecutor(
+    max_workers=DB_WORKERS, thread_name_prefix="db"
+)
+
+
+async def run_in_db_executor(
+    function: Callable[..., T], *args: Any
+) -> T:
+    """Runs blocking database work on the DB worker pool and awaits its result.
+
+    The caller's context vars are copied into the worker, as asyncio.to_thread
+    does, so per-event SQL instrumentation still sees the active event.
+    """
+    context = contextvars.copy_context()
+    return await asyncio.get_running_loop().run_in_executor(
+        _db_executor,
+        functools.partial(context.run, function, *args),
+    )
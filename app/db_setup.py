@@ -1,13 +1,21 @@
 import reflex as rx
 from sqlmodel import SQLModel, Field, Relationship, select
+from app.database import configure_database_engine
+from app.migrations import run_migrations
 from app.models import MotorbikeDB, PartDB, UserDB
+from app.queries import bump_inventory_version
 import bcrypt
 
 
 def create_db_and_tables():
     """Creates the database and all tables based on the defined models."""
-    engine = rx.model.get_engine()
+    engine = configure_database_engine()
     SQLModel.metadata.create_all(engine)
+    applied_versions = run_migrations(engine)
+    if applied_versions:
+        print(
+            f"Applied schema migrations: {applied_versions}"
+        )
     print("Database and tables created successfully.")
 
 
@@ -95,6 +103,7 @@ def populate_example_data():
                     part2_2,
                 ]
             )
+            bump_inventory_version(session)
             print(
                 "Example motorbike and part data populated."
             )
@@ -0,0 +1,78 @@
+import os
+import threading
+from typing import Dict, TypedDict
+
+from reflex.middleware import Middleware
+
+DELTA_METRICS_ENABLED = os.environ.get(
+    "DELTA_METRICS", ""
+).lower() in ("1", "true", "yes")
+
+
+class DeltaSizeStats(TypedDict):
+    events: int
+    total_bytes: int
+    max_bytes: int
+    last_bytes: int
+
+
+class DeltaSizeRecorder:
+    """In-process aggregate of serialized state delta sizes, keyed by event handler."""
+
+    def __init__(self):
+        self._stats: Dict[str, DeltaSizeStats] = {}
+        self._lock = threading.Lock()
+
+    def record(self, event_name: str, delta_bytes: int) -> None:
+        with self._lock:
+            stats = self._stats.setdefault(
+                event_name,
+                {
+                    "events": 0,
+                    "total_bytes": 0,
+                    "max_bytes": 0,
+                    "last_bytes": 0,
+                },
+            )
+            stats["events"] += 1
+            stats["total_bytes"] += delta_bytes
+            stats["max_bytes"] = max(
+                stats["max_bytes"], delta_bytes
+            )
+            stats["last_bytes"] = delta_bytes
+
+    def stats(self) -> Dict[str, DeltaSizeStats]:
+        with self._lock:
+            return {
+                event_name: dict(stats)
+                for event_name, stats in self._stats.items()
+            }
+
+    def reset(self) -> None:
+        with self._lock:
+            self._stats.clear()
+
+
+delta_size_recorder = DeltaSizeRecorder()
+
+
+def report_delta_size(event_name: str, delta_bytes: int) -> None:
+    delta_size_recorder.record(event_name, delta_bytes)
+    print(f"Delta for {event_name}: {delta_bytes} bytes")
+
+
+class DeltaSizeMiddleware(Middleware):
+    """Reports the size of the delta each event sends to the browser.
+
+    When EventMetricsMiddleware is installed it reports these sizes itself, from
+    the same encoding it measures, and this middleware is not needed.
+    """
+
+    async def preprocess(self, app, state, event):
+        return None
+
+    async def postprocess(self, app, state, event, update):
+        report_delta_size(
+            event.name, len(update.json().encode("utf-8"))
+        )
+        return update
@@ -0,0 +1,319 @@
+import contextvars
+import functools
+import json
+import os
+import threading
+import time
+from typing import Callable, Dict, Iterable, List, TypedDict
+
+from reflex.middleware import Middleware
+from sqlalchemy import event as sqlalchemy_event
+from sqlalchemy.engine import Engine
+
+from app.delta_metrics import report_delta_size
+
+EVENT_METRICS_ENABLED = os.environ.get(
+    "EVENT_METRICS", ""
+).lower() in ("1", "true", "yes")
+# Upper bounds of the wall-time histogram buckets, in milliseconds.
+LATENCY_BUCKETS_MS = (5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000)
+
+
+class EventMetricsRecord(TypedDict):
+    event: str
+    wall_ms: float
+    sql_statements: int
+    sql_ms: float
+    computed_var_ms: float
+    serialize_ms: float
+    delta_bytes: int
+
+
+class EventMetricsStats(TypedDict):
+    events: int
+    total_wall_ms: float
+    max_wall_ms: float
+    wall_ms_buckets: List[int]
+    sql_statements: int
+    total_sql_ms: float
+    total_computed_var_ms: float
+    total_serialize_ms: float
+    total_delta_bytes: int
+    max_delta_bytes: int
+
+
+class _ActiveEvent:
+    def __init__(self, event_name: str):
+        self.event_name = event_name
+        self.started = time.perf_counter()
+        self.sql_statements = 0
+        self.sql_seconds = 0.0
+        self.computed_var_seconds = 0.0
+        self.computed_var_depth = 0
+        self.serialize_seconds = 0.0
+        self.delta_bytes = 0
+
+
+_active_event: contextvars.ContextVar[_ActiveEvent | None] = (
+    contextvars.ContextVar("active_event_metrics", default=None)
+)
+
+
+class EventMetricsRecorder:
+    """In-process aggregate of per-event timings, SQL usage and delta sizes, keyed by event handler."""
+
+    def __init__(self):
+        self._stats: Dict[str, EventMetricsStats] = {}
+        self._lock = threading.Lock()
+
+    def record(self, record: EventMetricsRecord) -> None:
+        with self._lock:
+            stats = self._stats.setdefault(
+                record["event"],
+                {
+                    "events": 0,
+                    "total_wall_ms": 0.0,
+                    "max_wall_ms": 0.0,
+                    "wall_ms_buckets": [0] * len(LATENCY_BUCKETS_MS),
+                    "sql_statements": 0,
+                    "total_sql_ms": 0.0,
+                    "total_computed_var_ms": 0.0,
+                    "total_serialize_ms": 0.0,
+                    "total_delta_bytes": 0,
+                    "max_delta_bytes": 0,
+                },
+            )
+            stats["events"] += 1
+            stats["total_wall_ms"] += record["wall_ms"]
+            stats["max_wall_ms"] = max(
+                stats["max_wall_ms"], record["wall_ms"]
+            )
+            for bucket_index, upper_bound in enumerate(
+                LATENCY_BUCKETS_MS
+            ):
+                if record["wall_ms"] <= upper_bound:
+                    stats["wall_ms_buckets"][bucket_index] += 1
+            stats["sql_statements"] += record["sql_statements"]
+            stats["total_sql_ms"] += record["sql_ms"]
+            stats["total_computed_var_ms"] += record[
+                "computed_var_ms"
+            ]
+            stats["total_serialize_ms"] += record["serialize_ms"]
+            stats["total_delta_bytes"] += record["delta_bytes"]
+            stats["max_delta_bytes"] = max(
+                stats["max_delta_bytes"], record["delta_bytes"]
+            )
+
+    def stats(self) -> Dict[str, EventMetricsStats]:
+        with self._lock:
+            return {
+                event_name: {
+                    **stats,
+                    "wall_ms_buckets": list(
+                        stats["wall_ms_buckets"]
+                    ),
+                }
+                for event_name, stats in self._stats.items()
+            }
+
+    def reset(self) -> None:
+        with self._lock:
+            self._stats.clear()
+
+
+event_metrics_recorder = EventMetricsRecorder()
+
+
+def _before_cursor_execute(
+    conn, cursor, statement, parameters, context, executemany
+):
+    if _active_event.get() is not None:
+        conn.info.setdefault("event_metrics_started", []).append(
+            time.perf_counter()
+        )
+
+
+def _finish_statement(conn) -> None:
+    started = conn.info.get("event_metrics_started")
+    if not started:
+        return
+    started_at = started.pop()
+    active_event = _active_event.get()
+    if active_event is not None:
+        active_event.sql_statements += 1
+        active_event.sql_seconds += time.perf_counter() - started_at
+
+
+def _after_cursor_execute(
+    conn, cursor, statement, parameters, context, executemany
+):
+    _finish_statement(conn)
+
+
+def _handle_error(exception_context):
+    # A failed statement never reaches after_cursor_execute; pop its start
+    # time here so later statements on the connection pair up correctly.
+    if exception_context.connection is not None:
+        _finish_statement(exception_context.connection)
+
+
+def _timed_computed_var(fget):
+    @functools.wraps(fget)
+    def timed_fget(state):
+        active_event = _active_event.get()
+        if active_event is None:
+            return fget(state)
+        # Computed vars read each other; only the outermost one is timed so
+        # nested recomputation is not counted twice.
+        active_event.computed_var_depth += 1
+        started = time.perf_counter()
+        try:
+            return fget(state)
+        finally:
+            active_event.computed_var_depth -= 1
+            if active_event.computed_var_depth == 0:
+                active_event.computed_var_seconds += (
+                    time.perf_counter() - started
+                )
+
+    return timed_fget
+
+
+# Original computed vars of each timed state class, for uninstalling.
+_untimed_computed_vars: Dict[type, Dict[str, tuple]] = {}
+
+
+def install_computed_var_timing(
+    state_classes: Iterable[type],
+) -> Callable[[], None]:
+    """Times the computed vars of the given state classes into the active event.
+
+    Each computed var is replaced by a copy whose getter is timed, the same way
+    Reflex re-binds computed vars it copies from mixins. The copies keep the
+    original dependencies. Returns a function that puts the original vars back.
+    Classes that are already timed are left as they are.
+    """
+    installed: List[type] = []
+    for state_class in state_classes:
+        if state_class in _untimed_computed_vars:
+            continue
+        originals: Dict[str, tuple] = {}
+        for var_name, computed_var in list(
+            state_class.computed_vars.items()
+        ):
+            class_var = state_class.__dict__.get(var_name)
+            if class_var is None:
+                continue
+            deps = computed_var._deps(objclass=state_class)
+            originals[var_name] = (class_var, computed_var)
+            setattr(
+                state_class,
+                var_name,
+                class_var._replace(
+                    fget=_timed_computed_var(class_var.fget),
+                    deps=deps,
+                    auto_deps=False,
+                ),
+            )
+            timed_var = computed_var._replace(
+                fget=_timed_computed_var(computed_var.fget),
+                deps=deps,
+                auto_deps=False,
+            )
+            state_class.computed_vars[var_name] = timed_var
+            state_class.vars[var_name] = timed_var
+        _untimed_computed_vars[state_class] = originals
+        installed.append(state_class)
+
+    def uninstall() -> None:
+        for state_class in installed:
+            originals = _untimed_computed_vars.pop(state_class, {})
+            for var_name, (
+                class_var,
+                computed_var,
+            ) in originals.items():
+                setattr(state_class, var_name, class_var)
+                state_class.computed_vars[var_name] = computed_var
+                state_class.vars[var_name] = computed_var
+
+    return uninstall
+
+
+class EventMetricsMiddleware(Middleware):
+    """Records wall time, SQL statements, computed-var time and delta size for each event.
+
+    Only events handled by the given state classes are measured. Each finished
+    event is printed as one JSON line and added to event_metrics_recorder. With
+    report_delta_sizes, the delta of every event is also reported to
+    delta_size_recorder, so DeltaSizeMiddleware does not encode it a second time.
+    Computed-var timing is installed with install_computed_var_timing; call
+    uninstall() to restore the original computed vars.
+    """
+
+    def __init__(
+        self,
+        state_classes: Iterable[type],
+        report_delta_sizes: bool = False,
+    ):
+        self._report_delta_sizes = report_delta_sizes
+        state_classes = list(state_classes)
+        self._state_names = {
+            state_class.get_full_name() for state_class in state_classes
+        }
+        self._uninstall_computed_var_timing = (
+            install_computed_var_timing(state_classes)
+        )
+        if not sqlalchemy_event.contains(
+            Engine, "before_cursor_execute", _before_cursor_execute
+        ):
+            sqlalchemy_event.listen(
+                Engine, "before_cursor_execute", _before_cursor_execute
+            )
+            sqlalchemy_event.listen(
+                Engine, "after_cursor_execute", _after_cursor_execute
+            )
+            sqlalchemy_event.listen(
+                Engine, "handle_error", _handle_error
+            )
+
+    def uninstall(self) -> None:
+        self._uninstall_computed_var_timing()
+
+    async def preprocess(self, app, state, event):
+        state_name = event.name.rpartition(".")[0]
+        _active_event.set(
+            _ActiveEvent(event.name)
+            if state_name in self._state_names
+            else None
+        )
+        return None
+
+    async def postprocess(self, app, state, event, update):
+        active_event = _active_event.get()
+        if active_event is None and not self._report_delta_sizes:
+            return update
+        started = time.perf_counter()
+        delta_bytes = len(update.json().encode("utf-8"))
+        serialize_seconds = time.perf_counter() - started
+        if self._report_delta_sizes:
+            report_delta_size(event.name, delta_bytes)
+        if active_event is None:
+            return update
+        active_event.delta_bytes += delta_bytes
+        active_event.serialize_seconds += serialize_seconds
+        if update.final:
+            _active_event.set(None)
+            record: EventMetricsRecord = {
+                "event": active_event.event_name,
+                "wall_ms": (time.perf_counter() - active_event.started)
+                * 1000,
+                "sql_statements": active_event.sql_statements,
+                "sql_ms": active_event.sql_seconds * 1000,
+                "computed_var_ms": active_event.computed_var_seconds
+                * 1000,
+                "serialize_ms": active_event.serialize_seconds * 1000,
+                "delta_bytes": active_event.delta_bytes,
+            }
+            event_metrics_recorder.record(record)
+            print(json.dumps({"event_metrics": record}))
+        return update
@@ -0,0 +1,167 @@
+import csv
+import io
+import json
+import os
+from typing import Any, Callable, Dict, Iterator, List, Sequence, Tuple
+
+import reflex as rx
+from fastapi import HTTPException
+from sqlmodel import select
+from starlette.requests import Request
+from starlette.responses import StreamingResponse
+
+from app.analytics_engine import (
+    BikeAnalytics,
+    analytics_rows_statement,
+    bike_analytics_from_row,
+)
+from app.api_auth import require_bearer_token
+from app.models import MotorbikeDB, PartDB
+
+EXPORT_ROUTE = "/export/{dataset}"
+# The endpoint is only mounted when a token is configured, and every request
+# must send it as "Authorization: Bearer <token>".
+EXPORT_TOKEN = os.environ.get("EXPORT_TOKEN", "")
+EXPORT_ENDPOINT_ENABLED = bool(EXPORT_TOKEN)
+# Rows fetched from the database cursor, and written to the response, at a time.
+EXPORT_FETCH_ROWS = max(1, int(os.environ.get("EXPORT_FETCH_ROWS", 1000)))
+EXPORT_MEDIA_TYPES = {
+    "csv": "text/csv; charset=utf-8",
+    "ndjson": "application/x-ndjson",
+}
+
+MOTORBIKE_EXPORT_COLUMNS = (
+    MotorbikeDB.id,
+    MotorbikeDB.name,
+    MotorbikeDB.initial_cost,
+    MotorbikeDB.tanya_initial_cost,
+    MotorbikeDB.gerald_initial_cost,
+    MotorbikeDB.buyer,
+    MotorbikeDB.is_sold,
+    MotorbikeDB.sold_value,
+    MotorbikeDB.ignore_from_calculations,
+)
+PART_EXPORT_COLUMNS = (
+    PartDB.id,
+    PartDB.motorbike_id,
+    PartDB.name,
+    PartDB.source,
+    PartDB.buyer,
+    PartDB.cost,
+)
+
+# (column names, query builder, row converter) per dataset; the query
+# builder receives the request's query parameters.
+ExportDataset = Tuple[
+    Sequence[str],
+    Callable[[Dict[str, str]], Any],
+    Callable[[Any], Sequence[Any]],
+]
+
+EXPORT_DATASETS: Dict[str, ExportDataset] = {
+    "motorbikes": (
+        [column.key for column in MOTORBIKE_EXPORT_COLUMNS],
+        lambda params: select(*MOTORBIKE_EXPORT_COLUMNS).order_by(
+            MotorbikeDB.id
+        ),
+        tuple,
+    ),
+    "parts": (
+        [column.key for column in PART_EXPORT_COLUMNS],
+        lambda params: select(*PART_EXPORT_COLUMNS).order_by(
+            PartDB.id
+        ),
+        tuple,
+    ),
+    "analytics": (
+        list(BikeAnalytics.__annotations__),
+        lambda params: analytics_rows_statement(
+            params.get("sold_status", "all")
+        ),
+        lambda row: tuple(bike_analytics_from_row(row).values()),
+    ),
+}
+
+
+def _fetch_row_batches(statement) -> Iterator[List[Any]]:
+    with rx.session() as session:
+        result = session.exec(
+            statement.execution_options(yield_per=EXPORT_FETCH_ROWS)
+        )
+        for batch in result.partitions():
+            yield batch
+
+
+def _encode_csv(
+    columns: Sequence[str], batches: Iterator[List[Sequence[Any]]]
+) -> Iterator[bytes]:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(columns)
+    yield buffer.getvalue().encode()
+    for batch in batches:
+        buffer.seek(0)
+        buffer.truncate()
+        writer.writerows(batch)
+        yield buffer.getvalue().encode()
+
+
+def _encode_ndjson(
+    columns: Sequence[str], batches: Iterator[List[Sequence[Any]]]
+) -> Iterator[bytes]:
+    for batch in batches:
+        yield "".join(
+            json.dumps(dict(zip(columns, row))) + "\n"
+            for row in batch
+        ).encode()
+
+
+def stream_export(
+    dataset: str, export_format: str, params: Dict[str, str]
+) -> Iterator[bytes]:
+    """Yields an export as encoded chunks of EXPORT_FETCH_ROWS rows.
+
+    Rows come from a streaming cursor in batches, so memory use does not grow
+    with the table size and the first rows go out as soon as they are fetched.
+    """
+    columns, build_statement, convert_row = EXPORT_DATASETS[dataset]
+    batches = (
+        [convert_row(row) for row in batch]
+        for batch in _fetch_row_batches(build_statement(params))
+    )
+    if export_format == "ndjson":
+        return _encode_ndjson(columns, batches)
+    return _encode_csv(columns, batches)
+
+
+def add_export_endpoint(app: rx.App, token: str) -> None:
+    """Mounts the CSV/NDJSON export endpoint on the app's backend API, guarded by a bearer token."""
+    if not token:
+        raise ValueError("The export endpoint requires a token.")
+
+    def export(
+        request: Request, dataset: str, format: str = "csv"
+    ) -> StreamingResponse:
+        require_bearer_token(request, token)
+        if dataset not in EXPORT_DATASETS:
+            raise HTTPException(
+                status_code=404,
+                detail=f"Unknown export '{dataset}'. Available: {', '.join(EXPORT_DATASETS)}.",
+            )
+        if format not in EXPORT_MEDIA_TYPES:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Unsupported format '{format}'. Use csv or ndjson.",
+            )
+        # A plain iterator, so Starlette pulls each chunk in its thread pool.
+        return StreamingResponse(
+            stream_export(
+                dataset, format, dict(request.query_params)
+            ),
+            media_type=EXPORT_MEDIA_TYPES[format],
+            headers={
+                "Content-Disposition": f'attachment; filename="{dataset}.{format}"'
+            },
+        )
+
+    app.api.add_api_route(EXPORT_ROUTE, export, methods=["GET"])
@@ -0,0 +1,101 @@
+import threading
+from collections import OrderedDict
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    FrozenSet,
+    Hashable,
+    Iterable,
+    Optional as PyOptional,
+    Tuple,
+)
+
+
+class InventoryCache:
+    """Process-wide LRU cache of converted inventory data shared by all sessions.
+
+    Each entry records the motorbike ids it was built from; ``None`` means it
+    depends on the whole inventory and is dropped by any invalidation.
+    """
+
+    def __init__(self, max_entries: int = 64):
+        self.max_entries = max_entries
+        self._entries: OrderedDict[
+            Hashable, Tuple[Any, PyOptional[FrozenSet[str]]]
+        ] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def get_or_load(
+        self,
+        key: Hashable,
+        loader: Callable[[], Any],
+        depends_on: PyOptional[Iterable[str]] = None,
+    ) -> Any:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[0]
+            self.misses += 1
+        value = loader()
+        self.put(key, value, depends_on)
+        return value
+
+    def put(
+        self,
+        key: Hashable,
+        value: Any,
+        depends_on: PyOptional[Iterable[str]] = None,
+    ) -> None:
+        dependencies = (
+            frozenset(depends_on)
+            if depends_on is not None
+            else None
+        )
+        with self._lock:
+            self._entries[key] = (value, dependencies)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate(
+        self, motorbike_ids: PyOptional[Iterable[str]] = None
+    ) -> None:
+        """Drops entries built from the given bikes, or everything if no ids are given."""
+        changed_ids = (
+            frozenset(motorbike_ids)
+            if motorbike_ids is not None
+            else None
+        )
+        with self._lock:
+            stale_keys = [
+                key
+                for key, (_, dependencies) in self._entries.items()
+                if changed_ids is None
+                or dependencies is None
+                or not dependencies.isdisjoint(changed_ids)
+            ]
+            for key in stale_keys:
+                del self._entries[key]
+            self.invalidations += len(stale_keys)
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "invalidations": self.invalidations,
+            }
+
+
+inventory_cache = InventoryCache()
@@ -0,0 +1,63 @@
+from typing import Tuple, TypedDict
+
+
+class MotorbikeInput(TypedDict):
+    name: str
+    initial_cost: float
+    tanya_initial_cost: float
+    gerald_initial_cost: float
+
+
+class PartInput(TypedDict):
+    name: str
+    cost: float
+
+
+def validate_motorbike_input(
+    name: str,
+    initial_cost: str,
+    tanya_initial_cost: str,
+    gerald_initial_cost: str,
+) -> Tuple[MotorbikeInput | None, str | None]:
+    """Parses a new motorbike's fields; returns the values or the error message to show."""
+    name = name.strip()
+    if not name:
+        return None, "Motorbike name cannot be empty."
+    if not initial_cost:
+        return None, "Initial cost cannot be empty."
+    try:
+        initial_cost_value = float(initial_cost)
+        tanya_initial = float(tanya_initial_cost or 0)
+        gerald_initial = float(gerald_initial_cost or 0)
+    except ValueError:
+        return None, "Invalid initial cost format."
+    if (
+        initial_cost_value < 0
+        or tanya_initial < 0
+        or gerald_initial < 0
+    ):
+        return None, "Initial costs cannot be negative."
+    if abs((tanya_initial + gerald_initial) - initial_cost_value) > 0.01:
+        initial_cost_value = tanya_initial + gerald_initial
+    return {
+        "name": name,
+        "initial_cost": initial_cost_value,
+        "tanya_initial_cost": tanya_initial,
+        "gerald_initial_cost": gerald_initial,
+    }, None
+
+
+def validate_part_input(
+    name: str, cost: str
+) -> Tuple[PartInput | None, str | None]:
+    """Parses a new part's fields; returns the values or the error message to show."""
+    name = name.strip()
+    if not name:
+        return None, "Part name cannot be empty."
+    if not cost:
+        return None, "Part cost cannot be empty."
+    try:
+        cost_value = float(cost)
+    except ValueError:
+        return None, "Invalid part cost format."
+    return {"name": name, "cost": cost_value}, None
@@ -0,0 +1,166 @@
+import os
+from typing import List
+
+import reflex as rx
+from sqlalchemy import func
+from sqlmodel import select
+from starlette.requests import Request
+from starlette.responses import PlainTextResponse
+
+from app.api_auth import require_bearer_token
+from app.event_metrics import (
+    LATENCY_BUCKETS_MS,
+    event_metrics_recorder,
+)
+from app.inventory_cache import inventory_cache
+from app.models import MotorbikeDB, PartDB
+
+METRICS_ROUTE = "/metrics"
+# Like the export endpoint, only mounted when a token is configured; scrapers
+# must send it as "Authorization: Bearer <token>".
+METRICS_TOKEN = os.environ.get("METRICS_TOKEN", "")
+METRICS_ENDPOINT_ENABLED = bool(METRICS_TOKEN)
+METRICS_PREFIX = "motorbike_tracker"
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+def _label_value(value: str) -> str:
+    return (
+        value.replace("\\", "\\\\")
+        .replace('"', '\\"')
+        .replace("\n", "\\n")
+    )
+
+
+def _metric_header(
+    lines: List[str], name: str, metric_type: str, help_text: str
+) -> str:
+    full_name = f"{METRICS_PREFIX}_{name}"
+    lines.append(f"# HELP {full_name} {help_text}")
+    lines.append(f"# TYPE {full_name} {metric_type}")
+    return full_name
+
+
+def render_metrics(app: rx.App) -> str:
+    """Renders the current process metrics in the Prometheus text exposition format."""
+    lines: List[str] = []
+    event_stats = event_metrics_recorder.stats()
+    name = _metric_header(
+        lines,
+        "event_duration_seconds",
+        "histogram",
+        "Event handler wall time, including computed vars and delta serialization.",
+    )
+    for event_name, stats in sorted(event_stats.items()):
+        label = f'event="{_label_value(event_name)}"'
+        for upper_bound, count in zip(
+            LATENCY_BUCKETS_MS, stats["wall_ms_buckets"]
+        ):
+            lines.append(
+                f'{name}_bucket{{{label},le="{upper_bound / 1000:g}"}} {count}'
+            )
+        lines.append(
+            f'{name}_bucket{{{label},le="+Inf"}} {stats["events"]}'
+        )
+        lines.append(
+            f"{name}_sum{{{label}}} {stats['total_wall_ms'] / 1000}"
+        )
+        lines.append(f"{name}_count{{{label}}} {stats['events']}")
+    for metric, key, scale, help_text in (
+        (
+            "event_sql_statements_total",
+            "sql_statements",
+            1,
+            "SQL statements executed by event handlers.",
+        ),
+        (
+            "event_sql_seconds_total",
+            "total_sql_ms",
+            1000,
+            "Time spent in SQL statements by event handlers.",
+        ),
+        (
+            "event_computed_var_seconds_total",
+            "total_computed_var_ms",
+            1000,
+            "Time spent recomputing computed vars after events.",
+        ),
+        (
+            "event_delta_bytes_total",
+            "total_delta_bytes",
+            1,
+            "Serialized state delta bytes sent after events.",
+        ),
+    ):
+        name = _metric_header(lines, metric, "counter", help_text)
+        for event_name, stats in sorted(event_stats.items()):
+            lines.append(
+                f'{name}{{event="{_label_value(event_name)}"}} {stats[key] / scale:g}'
+            )
+    name = _metric_header(
+        lines,
+        "active_sessions",
+        "gauge",
+        "Browser tabs currently connected over the websocket.",
+    )
+    lines.append(
+        f"{name} {len(app.event_namespace.token_to_sid) if app.event_namespace else 0}"
+    )
+    with rx.session() as session:
+        motorbike_count = session.exec(
+            select(func.count(MotorbikeDB.id))
+        ).one()
+        part_count = session.exec(
+            select(func.count(PartDB.id))
+        ).one()
+    name = _metric_header(
+        lines, "inventory_motorbikes", "gauge", "Motorbikes in the inventory."
+    )
+    lines.append(f"{name} {motorbike_count}")
+    name = _metric_header(
+        lines, "inventory_parts", "gauge", "Parts in the inventory."
+    )
+    lines.append(f"{name} {part_count}")
+    cache_stats = inventory_cache.stats()
+    name = _metric_header(
+        lines,
+        "inventory_cache_entries",
+        "gauge",
+        "Entries held by the shared inventory cache.",
+    )
+    lines.append(f"{name} {cache_stats['entries']}")
+    for counter_name in ("hits", "misses", "evictions", "invalidations"):
+        name = _metric_header(
+            lines,
+            f"inventory_cache_{counter_name}_total",
+            "counter",
+            f"Shared inventory cache {counter_name}.",
+        )
+        lines.append(f"{name} {cache_stats[counter_name]}")
+    lookups = cache_stats["hits"] + cache_stats["misses"]
+    name = _metric_header(
+        lines,
+        "inventory_cache_hit_ratio",
+        "gauge",
+        "Share of shared inventory cache lookups served from memory.",
+    )
+    lines.append(
+        f"{name} {cache_stats['hits'] / lookups if lookups else 0:g}"
+    )
+    return "\n".join(lines) + "\n"
+
+
+def add_metrics_endpoint(app: rx.App, token: str) -> None:
+    """Mounts the Prometheus metrics endpoint on the app's backend API, guarded by a bearer token."""
+    if not token:
+        raise ValueError("The metrics endpoint requires a token.")
+
+    # A plain function, so FastAPI runs the count queries in its thread pool.
+    def metrics(request: Request) -> PlainTextResponse:
+        require_bearer_token(request, token)
+        return PlainTextResponse(
+            render_metrics(app),
+            media_type=PROMETHEUS_CONTENT_TYPE,
+        )
+
+    app.api.add_api_route(METRICS_ROUTE, metrics, methods=["GET"])
@@ -0,0 +1,51 @@
+from typing import List, Tuple
+from sqlalchemy import insert, select, text
+from sqlalchemy.engine import Engine
+from app.models import SchemaMigrationDB
+
+# Append-only list of (version, description, statements). Statements must be
+# idempotent because fresh databases already get the same objects from
+# SQLModel.metadata.create_all before migrations run.
+MIGRATIONS: List[Tuple[int, str, List[str]]] = [
+    (
+        1,
+        "Index part lookups, display order, bike names and unsold bikes",
+        [
+            "CREATE INDEX IF NOT EXISTS ix_partdb_motorbike_id ON partdb (motorbike_id)",
+            "CREATE INDEX IF NOT EXISTS ix_motorbikedb_name ON motorbikedb (name)",
+            "CREATE INDEX IF NOT EXISTS ix_motorbikedb_display_order ON motorbikedb (is_sold, lower(name), id)",
+            "CREATE INDEX IF NOT EXISTS ix_motorbikedb_unsold_name ON motorbikedb (lower(name), id) WHERE NOT is_sold",
+            "ANALYZE",
+        ],
+    ),
+    (
+        2,
+        "Drop the unused partial index over unsold bike names",
+        [
+            "DROP INDEX IF EXISTS ix_motorbikedb_unsold_name",
+        ],
+    ),
+]
+
+
+def run_migrations(engine: Engine) -> List[int]:
+    """Applies pending schema migrations in order and returns the versions applied."""
+    applied_now: List[int] = []
+    with engine.begin() as connection:
+        already_applied = set(
+            connection.execute(
+                select(SchemaMigrationDB.version)
+            ).scalars()
+        )
+        for version, description, statements in MIGRATIONS:
+            if version in already_applied:
+                continue
+            for statement in statements:
+                connection.execute(text(statement))
+            connection.execute(
+                insert(SchemaMigrationDB).values(
+                    version=version, description=description
+                )
+            )
+            applied_now.append(version)
+    return applied_now
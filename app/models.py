@@ -5,6 +5,7 @@ from typing import (
     TYPE_CHECKING,
     Optional as PyOptional,
 )
+from sqlalchemy import Index, text
 from sqlmodel import Field, Relationship
 
 
@@ -34,7 +35,9 @@ class PartDB(rx.Model, table=True):
     source: str
     buyer: str
     cost: float
-    motorbike_id: str = Field(foreign_key="motorbikedb.id")
+    motorbike_id: str = Field(
+        foreign_key="motorbikedb.id", index=True
+    )
     motorbike: "MotorbikeDB" = Relationship(
         back_populates="parts"
     )
@@ -42,12 +45,20 @@ class PartDB(rx.Model, table=True):
 
 class MotorbikeDB(rx.Model, table=True):
     __tablename__ = "motorbikedb"
+    __table_args__ = (
+        Index(
+            "ix_motorbikedb_display_order",
+            "is_sold",
+            text("lower(name)"),
+            "id",
+        ),
+    )
     id: str = Field(
         default_factory=generate_uuid_str,
         primary_key=True,
         index=True,
     )
-    name: str
+    name: str = Field(index=True)
     initial_cost: float
     tanya_initial_cost: float = Field(default=0.0)
     gerald_initial_cost: float = Field(default=0.0)
@@ -60,4 +71,15 @@ class MotorbikeDB(rx.Model, table=True):
         sa_relationship_kwargs={
             "cascade": "all, delete-orphan"
         },
-    )
\ No newline at end of file
+    )
+
+
+class InventoryVersionDB(rx.Model, table=True):
+    __tablename__ = "inventoryversiondb"
+    version: int = Field(default=0)
+
+
+class SchemaMigrationDB(rx.Model, table=True):
+    __tablename__ = "schemamigrationdb"
+    version: int = Field(primary_key=True)
+    description: str
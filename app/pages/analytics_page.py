@@ -1,6 +1,5 @@
 import reflex as rx
 from app.states.analytics_state import AnalyticsState, BikeAnalytics
-from app.states.motorbike_state import MotorbikeState
 from app.components.layout import page_layout
 
 
@@ -226,7 +225,6 @@ def analytics_page() -> rx.Component:
         "Business Analytics",
         content,
         on_mount=[
-            MotorbikeState.load_all_data,
             AnalyticsState.set_filter_sold_status("all"),
         ],
     )
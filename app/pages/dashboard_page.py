@@ -2,8 +2,10 @@ import reflex as rx
 from app.states.motorbike_state import MotorbikeState
 from app.components.motorbike_form import motorbike_form
 from app.components.part_form import part_form
+from app.components.batch_part_form import batch_part_form
 from app.components.motorbikes_display import motorbikes_display
 from app.components.summary_display import summary_display
+from app.components.inventory_import import inventory_import
 from app.components.layout import page_layout
 
 
@@ -20,6 +22,8 @@ def dashboard_page() -> rx.Component:
             ),
             class_name="md:flex md:space-x-4 mb-8",
         ),
+        rx.el.div(batch_part_form(), class_name="mb-8"),
+        rx.el.div(inventory_import(), class_name="mb-8"),
         rx.el.div(summary_display(), class_name="my-8"),
         rx.el.div(motorbikes_display()),
         class_name="max-w-5xl mx-auto p-4 sm:p-6 lg:p-8",
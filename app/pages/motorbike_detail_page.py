@@ -1,6 +1,11 @@
 import reflex as rx
-from app.states.motorbike_state import MotorbikeState, Part
+from app.states.motorbike_state import (
+    MotorbikeDetailState,
+    MotorbikeState,
+    Part,
+)
 from app.components.part_form import part_form
+from app.components.batch_part_form import batch_part_form
 from app.components.edit_motorbike_dialog import edit_motorbike_dialog
 from app.components.edit_part_dialog import edit_part_dialog
 from app.components.layout import page_layout
@@ -33,7 +38,7 @@ def render_detail_part_row(
                     motorbike_id, part["id"]
                 ),
                 class_name="text-indigo-600 hover:text-indigo-900 text-xs px-2 py-1 border border-indigo-300 rounded",
-                disabled=MotorbikeState.selected_motorbike_for_detail[
+                disabled=MotorbikeDetailState.detail_motorbike[
                     "is_sold"
                 ],
             ),
@@ -43,7 +48,7 @@ def render_detail_part_row(
                     motorbike_id, part["id"]
                 ),
                 class_name="text-red-600 hover:text-red-900 ml-2 text-xs px-2 py-1 border border-red-300 rounded",
-                disabled=MotorbikeState.selected_motorbike_for_detail[
+                disabled=MotorbikeDetailState.detail_motorbike[
                     "is_sold"
                 ],
             ),
@@ -58,13 +63,13 @@ def motorbike_detail_content() -> rx.Component:
         rx.el.div(
             rx.el.div(
                 rx.el.h2(
-                    MotorbikeState.selected_motorbike_for_detail[
+                    MotorbikeDetailState.detail_motorbike[
                         "name"
                     ],
                     class_name="text-2xl font-bold text-gray-800",
                 ),
                 rx.cond(
-                    MotorbikeState.selected_motorbike_for_detail[
+                    MotorbikeDetailState.detail_motorbike[
                         "is_sold"
                     ],
                     rx.el.span(
@@ -74,7 +79,7 @@ def motorbike_detail_content() -> rx.Component:
                     rx.fragment(),
                 ),
                 rx.cond(
-                    MotorbikeState.selected_motorbike_for_detail[
+                    MotorbikeDetailState.detail_motorbike[
                         "ignore_from_calculations"
                     ],
                     rx.el.span(
@@ -88,7 +93,7 @@ def motorbike_detail_content() -> rx.Component:
             rx.el.button(
                 "Edit Motorbike Details",
                 on_click=lambda: MotorbikeState.open_edit_motorbike_dialog(
-                    MotorbikeState.selected_motorbike_for_detail[
+                    MotorbikeDetailState.detail_motorbike[
                         "id"
                     ]
                 ),
@@ -97,18 +102,18 @@ def motorbike_detail_content() -> rx.Component:
             class_name="flex items-center justify-between mb-2",
         ),
         rx.el.p(
-            f"Initial Cost: ${MotorbikeState.selected_motorbike_for_detail['initial_cost']:.2f}",
+            f"Initial Cost: ${MotorbikeDetailState.detail_motorbike['initial_cost']:.2f}",
             class_name="text-gray-600 mb-1",
         ),
         rx.cond(
-            MotorbikeState.selected_motorbike_for_detail[
+            MotorbikeDetailState.detail_motorbike[
                 "bike_buyer"
             ]
             != None,
             rx.el.p(
                 "Bought by: ",
                 rx.el.span(
-                    MotorbikeState.selected_motorbike_for_detail[
+                    MotorbikeDetailState.detail_motorbike[
                         "bike_buyer"
                     ],
                     class_name="font-semibold",
@@ -118,21 +123,21 @@ def motorbike_detail_content() -> rx.Component:
             rx.fragment(),
         ),
         rx.cond(
-            MotorbikeState.selected_motorbike_for_detail[
+            MotorbikeDetailState.detail_motorbike[
                 "is_sold"
             ],
             rx.el.p(
-                f"Sold Value: ${MotorbikeState.selected_motorbike_for_detail['sold_value']:.2f}",
+                f"Sold Value: ${MotorbikeDetailState.detail_motorbike['sold_value']:.2f}",
                 class_name="text-green-600 font-semibold mb-1",
             ),
             rx.fragment(),
         ),
         rx.cond(
-            MotorbikeState.selected_motorbike_for_detail[
+            MotorbikeDetailState.detail_motorbike[
                 "is_sold"
             ],
             rx.el.p(
-                f"Profit: ${rx.cond(MotorbikeState.selected_motorbike_for_detail['sold_value'] != None, MotorbikeState.selected_motorbike_for_detail['sold_value'], 0) - MotorbikeState.selected_motorbike_for_detail['total_motorbike_cost']:.2f}",
+                f"Profit: ${rx.cond(MotorbikeDetailState.detail_motorbike['sold_value'] != None, MotorbikeDetailState.detail_motorbike['sold_value'], 0) - MotorbikeDetailState.detail_motorbike['total_motorbike_cost']:.2f}",
                 class_name="text-blue-600 font-semibold mb-4",
             ),
             rx.fragment(),
@@ -142,7 +147,7 @@ def motorbike_detail_content() -> rx.Component:
             class_name="text-xl font-semibold text-gray-700 mt-6 mb-3",
         ),
         rx.cond(
-            MotorbikeState.selected_motorbike_for_detail[
+            MotorbikeDetailState.detail_motorbike[
                 "is_sold"
             ],
             rx.el.p(
@@ -178,18 +183,18 @@ def motorbike_detail_content() -> rx.Component:
             ),
             rx.el.tbody(
                 rx.foreach(
-                    MotorbikeState.selected_motorbike_for_detail[
+                    MotorbikeDetailState.detail_motorbike[
                         "parts"
                     ],
                     lambda part: render_detail_part_row(
-                        MotorbikeState.selected_motorbike_for_detail[
+                        MotorbikeDetailState.detail_motorbike[
                             "id"
                         ],
                         part,
                     ),
                 ),
                 rx.cond(
-                    MotorbikeState.selected_motorbike_for_detail[
+                    MotorbikeDetailState.detail_motorbike[
                         "parts"
                     ].length()
                     == 0,
@@ -210,7 +215,7 @@ def motorbike_detail_content() -> rx.Component:
             rx.el.p(
                 "Total Parts Cost: ",
                 rx.el.span(
-                    f"${MotorbikeState.selected_motorbike_for_detail['total_parts_cost']:.2f}",
+                    f"${MotorbikeDetailState.detail_motorbike['total_parts_cost']:.2f}",
                     class_name="font-semibold",
                 ),
                 class_name="text-md font-medium text-gray-700 mt-4 text-right",
@@ -218,7 +223,7 @@ def motorbike_detail_content() -> rx.Component:
             rx.el.p(
                 "Tanya's Parts Cost: ",
                 rx.el.span(
-                    f"${MotorbikeState.selected_motorbike_for_detail['tanya_parts_cost']:.2f}",
+                    f"${MotorbikeDetailState.detail_motorbike['tanya_parts_cost']:.2f}",
                     class_name="font-semibold text-blue-600",
                 ),
                 class_name="text-sm font-medium text-gray-700 mt-1 text-right",
@@ -226,7 +231,7 @@ def motorbike_detail_content() -> rx.Component:
             rx.el.p(
                 "Gerald's Parts Cost: ",
                 rx.el.span(
-                    f"${MotorbikeState.selected_motorbike_for_detail['gerald_parts_cost']:.2f}",
+                    f"${MotorbikeDetailState.detail_motorbike['gerald_parts_cost']:.2f}",
                     class_name="font-semibold text-green-600",
                 ),
                 class_name="text-sm font-medium text-gray-700 mt-1 text-right",
@@ -234,7 +239,7 @@ def motorbike_detail_content() -> rx.Component:
             rx.el.p(
                 "Total Motorbike Cost: ",
                 rx.el.span(
-                    f"${MotorbikeState.selected_motorbike_for_detail['total_motorbike_cost']:.2f}",
+                    f"${MotorbikeDetailState.detail_motorbike['total_motorbike_cost']:.2f}",
                     class_name="font-bold text-lg",
                 ),
                 class_name="text-lg font-bold text-gray-800 mt-1 text-right",
@@ -242,16 +247,33 @@ def motorbike_detail_content() -> rx.Component:
             class_name="mt-4",
         ),
         rx.cond(
-            MotorbikeState.selected_motorbike_for_detail[
+            MotorbikeDetailState.detail_motorbike[
                 "is_sold"
             ],
             rx.fragment(),
             rx.el.div(
                 part_form(
-                    fixed_motorbike_id=MotorbikeState.selected_motorbike_for_detail[
+                    fixed_motorbike_id=MotorbikeDetailState.detail_motorbike[
                         "id"
                     ],
-                    motorbike_name=MotorbikeState.selected_motorbike_for_detail[
+                    motorbike_name=MotorbikeDetailState.detail_motorbike[
+                        "name"
+                    ],
+                ),
+                class_name="mt-8",
+            ),
+        ),
+        rx.cond(
+            MotorbikeDetailState.detail_motorbike[
+                "is_sold"
+            ],
+            rx.fragment(),
+            rx.el.div(
+                batch_part_form(
+                    fixed_motorbike_id=MotorbikeDetailState.detail_motorbike[
+                        "id"
+                    ],
+                    motorbike_name=MotorbikeDetailState.detail_motorbike[
                         "name"
                     ],
                 ),
@@ -266,7 +288,7 @@ def motorbike_detail_page() -> rx.Component:
         edit_motorbike_dialog(),
         edit_part_dialog(),
         rx.cond(
-            MotorbikeState.selected_motorbike_for_detail != None,
+            MotorbikeDetailState.detail_motorbike != None,
             motorbike_detail_content(),
             rx.el.p(
                 "Loading motorbike details or motorbike not found...",
@@ -278,5 +300,5 @@ def motorbike_detail_page() -> rx.Component:
     return page_layout(
         "Motorbike Details",
         content,
-        on_mount=[MotorbikeState.load_all_data],
+        on_mount=[MotorbikeDetailState.load_detail_motorbike],
     )
\ No newline at end of file
@@ -1,32 +1,61 @@
 import reflex as rx
 from app.states.motorbike_state import MotorbikeState
 from app.components.motorbikes_list_item import motorbikes_list_item
+from app.components.bulk_motorbike_actions import (
+    bulk_motorbike_actions,
+)
 from app.components.edit_motorbike_dialog import edit_motorbike_dialog
 from app.components.edit_part_dialog import edit_part_dialog
 from app.components.layout import page_layout
 
 
+def pagination_controls() -> rx.Component:
+    return rx.el.div(
+        rx.el.button(
+            "Previous",
+            on_click=MotorbikeState.previous_motorbikes_page,
+            disabled=MotorbikeState.motorbikes_page_number <= 1,
+            class_name="py-1 px-3 border border-gray-300 rounded-md text-sm text-gray-700 bg-white hover:bg-gray-50 disabled:opacity-50",
+        ),
+        rx.el.span(
+            f"Page {MotorbikeState.motorbikes_page_number}",
+            class_name="text-sm text-gray-600",
+        ),
+        rx.el.button(
+            "Next",
+            on_click=MotorbikeState.next_motorbikes_page,
+            disabled=~MotorbikeState.motorbikes_page_has_next,
+            class_name="py-1 px-3 border border-gray-300 rounded-md text-sm text-gray-700 bg-white hover:bg-gray-50 disabled:opacity-50",
+        ),
+        class_name="flex items-center justify-center space-x-4 mt-6",
+    )
+
+
 def motorbikes_page() -> rx.Component:
     content = rx.fragment(
         edit_motorbike_dialog(),
         edit_part_dialog(),
         rx.cond(
-            MotorbikeState.sorted_motorbikes_for_display.length() == 0,
+            MotorbikeState.motorbikes_page_items.length() == 0,
             rx.el.p(
                 "No motorbikes have been added yet. Go to the dashboard to add one.",
                 class_name="text-gray-600 text-center py-10",
             ),
-            rx.el.div(
-                rx.foreach(
-                    MotorbikeState.sorted_motorbikes_for_display,
-                    motorbikes_list_item,
+            rx.fragment(
+                bulk_motorbike_actions(),
+                rx.el.div(
+                    rx.foreach(
+                        MotorbikeState.motorbikes_page_items,
+                        motorbikes_list_item,
+                    ),
+                    class_name="grid grid-cols-1 md:grid-cols-2 lg:grid-cols-3 gap-6",
                 ),
-                class_name="grid grid-cols-1 md:grid-cols-2 lg:grid-cols-3 gap-6",
+                pagination_controls(),
             ),
         ),
     )
     return page_layout(
         "All Motorbikes",
         content,
-        on_mount=[MotorbikeState.load_all_data],
+        on_mount=[MotorbikeState.load_motorbikes_page],
     )
\ No newline at end of file
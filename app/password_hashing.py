@@ -0,0 +1,51 @@
+import asyncio
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+import bcrypt
+
+# bcrypt releases the GIL while hashing, so a small thread pool keeps the event
+# loop free and caps how many CPU cores a burst of logins can take.
+PASSWORD_HASH_WORKERS = max(
+    1,
+    int(
+        os.environ.get(
+            "PASSWORD_HASH_WORKERS",
+            min(4, os.cpu_count() or 1),
+        )
+    ),
+)
+
+_password_hash_executor = ThreadPoolExecutor(
+    max_workers=PASSWORD_HASH_WORKERS,
+    thread_name_prefix="password-hash",
+)
+
+
+def _hash_password(password: str) -> str:
+    return bcrypt.hashpw(
+        password.encode("utf-8"), bcrypt.gensalt()
+    ).decode("utf-8")
+
+
+def _verify_password(password: str, password_hash: str) -> bool:
+    return bcrypt.checkpw(
+        password.encode("utf-8"), password_hash.encode("utf-8")
+    )
+
+
+async def hash_password(password: str) -> str:
+    """Hashes a password with bcrypt on the password worker pool."""
+    return await asyncio.get_running_loop().run_in_executor(
+        _password_hash_executor, _hash_password, password
+    )
+
+
+async def verify_password(password: str, password_hash: str) -> bool:
+    """Checks a password against its bcrypt hash on the password worker pool."""
+    return await asyncio.get_running_loop().run_in_executor(
+        _password_hash_executor,
+        _verify_password,
+        password,
+        password_hash,
+    )
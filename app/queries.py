@@ -0,0 +1,169 @@
+from typing import (
+    Dict,
+    Iterable,
+    List,
+    Optional as PyOptional,
+    Tuple,
+    TypedDict,
+)
+from sqlalchemy import case, func, tuple_, update
+from sqlalchemy.orm import joinedload
+from sqlmodel import Session, select
+from app.models import InventoryVersionDB, MotorbikeDB, PartDB
+
+INVENTORY_VERSION_ROW_ID = 1
+
+MotorbikePageCursor = Tuple[bool, str, str]
+
+
+class CostRollup(TypedDict):
+    total_parts_cost: float
+    tanya_parts_cost: float
+    gerald_parts_cost: float
+    total_motorbike_cost: float
+    part_count: int
+
+
+def _buyer_cost_sum(buyer_name: str):
+    return func.coalesce(
+        func.sum(
+            case(
+                (
+                    func.lower(PartDB.buyer) == buyer_name,
+                    PartDB.cost,
+                ),
+                else_=0.0,
+            )
+        ),
+        0.0,
+    )
+
+
+def fetch_cost_rollups(
+    session: Session,
+    motorbike_ids: Iterable[str] | None = None,
+) -> Dict[str, CostRollup]:
+    """Computes per-bike part counts, part costs and total costs with one GROUP BY query."""
+    total_parts_cost = func.coalesce(func.sum(PartDB.cost), 0.0)
+    statement = (
+        select(
+            MotorbikeDB.id,
+            total_parts_cost,
+            _buyer_cost_sum("tanya"),
+            _buyer_cost_sum("gerald"),
+            MotorbikeDB.initial_cost + total_parts_cost,
+            func.count(PartDB.id),
+        )
+        .outerjoin(PartDB, PartDB.motorbike_id == MotorbikeDB.id)
+        .group_by(MotorbikeDB.id)
+    )
+    if motorbike_ids is not None:
+        statement = statement.where(
+            MotorbikeDB.id.in_(list(motorbike_ids))
+        )
+    return {
+        motorbike_id: {
+            "total_parts_cost": total_parts,
+            "tanya_parts_cost": tanya_parts,
+            "gerald_parts_cost": gerald_parts,
+            "total_motorbike_cost": total_motorbike,
+            "part_count": part_count,
+        }
+        for (
+            motorbike_id,
+            total_parts,
+            tanya_parts,
+            gerald_parts,
+            total_motorbike,
+            part_count,
+        ) in session.exec(statement).all()
+    }
+
+
+def part_cost_rollup_subquery():
+    """Per-bike part cost sums (total, Tanya, Gerald) as a subquery keyed by motorbike_id."""
+    return (
+        select(
+            PartDB.motorbike_id.label("motorbike_id"),
+            func.coalesce(func.sum(PartDB.cost), 0.0).label(
+                "total_parts_cost"
+            ),
+            _buyer_cost_sum("tanya").label("tanya_parts_cost"),
+            _buyer_cost_sum("gerald").label("gerald_parts_cost"),
+        )
+        .group_by(PartDB.motorbike_id)
+        .subquery()
+    )
+
+
+def get_inventory_version(session: Session) -> int:
+    """Returns the current inventory data version (0 if nothing was written yet)."""
+    version = session.exec(
+        select(InventoryVersionDB.version).where(
+            InventoryVersionDB.id == INVENTORY_VERSION_ROW_ID
+        )
+    ).first()
+    return version or 0
+
+
+def bump_inventory_version(session: Session) -> int:
+    """Increments the inventory data version inside the caller's transaction."""
+    result = session.execute(
+        update(InventoryVersionDB)
+        .where(InventoryVersionDB.id == INVENTORY_VERSION_ROW_ID)
+        .values(version=InventoryVersionDB.version + 1)
+    )
+    if result.rowcount == 0:
+        session.add(
+            InventoryVersionDB(
+                id=INVENTORY_VERSION_ROW_ID, version=1
+            )
+        )
+        session.flush()
+    return get_inventory_version(session)
+
+
+def fetch_motorbike_page(
+    session: Session,
+    page_size: int,
+    after: MotorbikePageCursor | None = None,
+) -> Tuple[List[MotorbikeDB], MotorbikePageCursor | None]:
+    """Returns one page of bikes (unsold first, then by name) and the cursor of the next page.
+
+    Uses keyset pagination over ix_motorbikedb_display_order, so the cost of a
+    page does not depend on how far into the inventory it is.
+    """
+    sort_name = func.lower(MotorbikeDB.name)
+    statement = (
+        select(MotorbikeDB, sort_name)
+        .order_by(
+            MotorbikeDB.is_sold, sort_name, MotorbikeDB.id
+        )
+        .limit(page_size + 1)
+    )
+    if after is not None:
+        statement = statement.where(
+            tuple_(MotorbikeDB.is_sold, sort_name, MotorbikeDB.id)
+            > tuple_(*after)
+        )
+    rows = session.exec(statement).all()
+    page = [bike_db for bike_db, _ in rows[:page_size]]
+    if len(rows) <= page_size:
+        return page, None
+    last_bike, last_sort_name = rows[page_size - 1]
+    return page, (last_bike.is_sold, last_sort_name, last_bike.id)
+
+
+def fetch_motorbike_with_parts(
+    session: Session, motorbike_id: str
+) -> PyOptional[MotorbikeDB]:
+    """Loads one bike and its parts by primary key in a single joined query."""
+    return (
+        session.exec(
+            select(MotorbikeDB)
+            .where(MotorbikeDB.id == motorbike_id)
+            .options(joinedload(MotorbikeDB.parts))
+        )
+        .unique()
+        .first()
+    )
@@ -1,7 +1,8 @@
 import reflex as rx
-import bcrypt
+from sqlalchemy.exc import IntegrityError
 from sqlmodel import select
 from app.models import UserDB
+from app.password_hashing import hash_password, verify_password
 
 
 class AuthState(rx.State):
@@ -9,7 +10,7 @@ class AuthState(rx.State):
     current_user_email: str | None = None
 
     @rx.event
-    def sign_up(self, form_data: dict):
+    async def sign_up(self, form_data: dict):
         email = form_data.get("email", "").strip().lower()
         password = form_data.get("password", "")
         if not email or not password:
@@ -22,25 +23,33 @@ class AuthState(rx.State):
             existing_user = session.exec(
                 select(UserDB).where(UserDB.email == email)
             ).first()
-            if existing_user:
-                yield rx.toast(
-                    "Email already in use.", duration=3000
-                )
-                return
-            hashed_password = bcrypt.hashpw(
-                password.encode("utf-8"), bcrypt.gensalt()
-            ).decode("utf-8")
+        if existing_user:
+            yield rx.toast(
+                "Email already in use.", duration=3000
+            )
+            return
+        # Hash with no session open, so waiting logins don't hold pooled connections.
+        hashed_password = await hash_password(password)
+        with rx.session() as session:
             new_user = UserDB(
                 email=email, password_hash=hashed_password
             )
             session.add(new_user)
-            session.commit()
-            self.in_session = True
-            self.current_user_email = email
-            return rx.redirect("/")
+            try:
+                session.commit()
+            except IntegrityError:
+                # Another sign-up took the email while this password was hashed.
+                session.rollback()
+                yield rx.toast(
+                    "Email already in use.", duration=3000
+                )
+                return
+        self.in_session = True
+        self.current_user_email = email
+        yield rx.redirect("/")
 
     @rx.event
-    def sign_in(self, form_data: dict):
+    async def sign_in(self, form_data: dict):
         email = form_data.get("email", "").strip().lower()
         password = form_data.get("password", "")
         if not email or not password:
@@ -53,20 +62,19 @@ class AuthState(rx.State):
             user = session.exec(
                 select(UserDB).where(UserDB.email == email)
             ).first()
-            if user and bcrypt.checkpw(
-                password.encode("utf-8"),
-                user.password_hash.encode("utf-8"),
-            ):
-                self.in_session = True
-                self.current_user_email = user.email
-                return rx.redirect("/")
-            else:
-                self.in_session = False
-                self.current_user_email = None
-                yield rx.toast(
-                    "Invalid email or password.",
-                    duration=3000,
-                )
+        if user and await verify_password(
+            password, user.password_hash
+        ):
+            self.in_session = True
+            self.current_user_email = user.email
+            yield rx.redirect("/")
+        else:
+            self.in_session = False
+            self.current_user_email = None
+            yield rx.toast(
+                "Invalid email or password.",
+                duration=3000,
+            )
 
     @rx.event
     def sign_out(self):
@@ -0,0 +1,127 @@
+import csv
+import io
+from typing import Dict, List
+
+import reflex as rx
+from sqlalchemy.exc import SQLAlchemyError
+
+from app.csv_import import (
+    ImportRowError,
+    import_csv_chunk,
+    missing_csv_columns,
+)
+from app.db_executor import run_in_db_executor
+from app.states.motorbike_state import MotorbikeState
+
+INVENTORY_IMPORT_UPLOAD_ID = "inventory_csv_upload"
+MAX_REPORTED_IMPORT_ERRORS = 50
+
+
+class InventoryImportState(rx.State):
+    """Progress of the dashboard's bulk CSV import of motorbikes and parts."""
+
+    import_in_progress: bool = False
+    import_file_name: str = ""
+    import_rows_processed: int = 0
+    import_motorbikes_created: int = 0
+    import_parts_created: int = 0
+    import_error_count: int = 0
+    import_errors: List[ImportRowError] = []
+
+    def _reset_progress(self, file_name: str) -> None:
+        self.import_file_name = file_name
+        self.import_rows_processed = 0
+        self.import_motorbikes_created = 0
+        self.import_parts_created = 0
+        self.import_error_count = 0
+        self.import_errors = []
+
+    @rx.event
+    async def import_inventory_csv(
+        self, files: list[rx.UploadFile]
+    ):
+        """Streams the uploaded CSV through chunked bulk inserts, yielding progress after each chunk.
+
+        The dashboard snapshot is refreshed once, after the last chunk, instead
+        of after every row.
+        """
+        if self.import_in_progress or not files:
+            return
+        motorbike_state = await self.get_state(MotorbikeState)
+        default_buyer = (
+            motorbike_state.buyers[0] if motorbike_state.buyers else ""
+        )
+        self.import_in_progress = True
+        self._reset_progress(files[0].name or "")
+        yield
+        try:
+            for upload in files:
+                self.import_file_name = upload.name or ""
+                reader = csv.DictReader(
+                    io.TextIOWrapper(
+                        upload.file, encoding="utf-8-sig", newline=""
+                    )
+                )
+                missing_columns = missing_csv_columns(
+                    reader.fieldnames
+                )
+                if missing_columns:
+                    yield rx.toast(
+                        f"'{self.import_file_name}' is missing the columns: {', '.join(missing_columns)}.",
+                        duration=5000,
+                    )
+                    continue
+                imported_motorbike_ids: Dict[str, str] = {}
+                while True:
+                    result = await run_in_db_executor(
+                        import_csv_chunk,
+                        reader,
+                        imported_motorbike_ids,
+                        default_buyer,
+                    )
+                    if not result["rows"]:
+                        break
+                    self.import_rows_processed += result["rows"]
+                    self.import_motorbikes_created += result[
+                        "motorbikes_created"
+                    ]
+                    self.import_parts_created += result[
+                        "parts_created"
+                    ]
+                    self.import_error_count += len(result["errors"])
+                    if (
+                        len(self.import_errors)
+                        < MAX_REPORTED_IMPORT_ERRORS
+                    ):
+                        self.import_errors = (
+                            self.import_errors + result["errors"]
+                        )[:MAX_REPORTED_IMPORT_ERRORS]
+                    yield
+        except (UnicodeDecodeError, csv.Error) as e:
+            print(
+                f"Error reading CSV import '{self.import_file_name}': {type(e).__name__}: {e}"
+            )
+            yield rx.toast(
+                f"Could not read '{self.import_file_name}' as a UTF-8 CSV file: {str(e)[:100]}",
+                duration=5000,
+            )
+        except SQLAlchemyError as e:
+            # Each chunk commits on its own, so everything counted so far is saved.
+            print(
+                f"Database error importing '{self.import_file_name}' after {self.import_rows_processed} rows: {type(e).__name__}: {e}"
+            )
+            yield rx.toast(
+                f"Import of '{self.import_file_name}' stopped by a database error; the first {self.import_rows_processed} rows were saved"
+                f" ({self.import_motorbikes_created} motorbikes and {self.import_parts_created} parts): {str(e)[:100]}",
+                duration=5000,
+            )
+        finally:
+            self.import_in_progress = False
+            await motorbike_state._refresh_inventory()
+        yield rx.clear_selected_files(INVENTORY_IMPORT_UPLOAD_ID)
+        yield rx.toast(
+            f"Imported {self.import_motorbikes_created} motorbikes and {self.import_parts_created} parts"
+            f" from {self.import_rows_processed} rows"
+            f" ({self.import_error_count} rows skipped).",
+            duration=5000,
+        )
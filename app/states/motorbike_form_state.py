@@ -0,0 +1,272 @@
+import reflex as rx
+from typing import Dict, List, TypedDict
+
+DEFAULT_BUYERS: List[str] = ["Tanya", "Gerald"]
+
+
+class NewMotorbikeFormState(rx.State):
+    new_motorbike_name: str = ""
+    new_motorbike_initial_cost: str = ""
+    new_motorbike_tanya_initial_cost: str = ""
+    new_motorbike_gerald_initial_cost: str = ""
+    new_motorbike_buyer: str = DEFAULT_BUYERS[0]
+
+    def _reset_form(self):
+        self.new_motorbike_name = ""
+        self.new_motorbike_initial_cost = ""
+        self.new_motorbike_tanya_initial_cost = ""
+        self.new_motorbike_gerald_initial_cost = ""
+        self.new_motorbike_buyer = DEFAULT_BUYERS[0]
+
+    @rx.event
+    def set_new_motorbike_buyer(self, buyer: str):
+        self.new_motorbike_buyer = buyer
+
+    @rx.event
+    def set_new_motorbike_name(self, value: str):
+        self.new_motorbike_name = value
+
+    @rx.event
+    def set_new_motorbike_initial_cost(self, value: str):
+        self.new_motorbike_initial_cost = value
+
+    @rx.event
+    def set_new_motorbike_tanya_initial_cost(self, value: str):
+        self.new_motorbike_tanya_initial_cost = value
+
+    @rx.event
+    def set_new_motorbike_gerald_initial_cost(self, value: str):
+        self.new_motorbike_gerald_initial_cost = value
+
+
+class NewPartFormState(rx.State):
+    new_part_name: str = ""
+    new_part_source: str = ""
+    new_part_buyer: str = DEFAULT_BUYERS[0]
+    new_part_cost: str = ""
+
+    def _reset_form(self):
+        self.new_part_name = ""
+        self.new_part_source = ""
+        self.new_part_buyer = DEFAULT_BUYERS[0]
+        self.new_part_cost = ""
+
+    @rx.event
+    def set_new_part_buyer(self, buyer: str):
+        self.new_part_buyer = buyer
+
+    @rx.event
+    def set_new_part_name(self, value: str):
+        self.new_part_name = value
+
+    @rx.event
+    def set_new_part_source(self, value: str):
+        self.new_part_source = value
+
+    @rx.event
+    def set_new_part_cost(self, value: str):
+        self.new_part_cost = value
+
+
+class BatchPartFormState(rx.State):
+    """Rows queued in the batch part form.
+
+    Only the row ids live here; the inputs are uncontrolled and named
+    ``<field>_<row id>``, so typing sends no events and the values arrive
+    with the submitted form data.
+    """
+
+    batch_part_row_ids: List[int] = [0]
+    _next_batch_part_row_id: int = 1
+
+    def _reset_form(self):
+        self.batch_part_row_ids = [self._next_batch_part_row_id]
+        self._next_batch_part_row_id += 1
+
+    @rx.event
+    def add_batch_part_row(self):
+        self.batch_part_row_ids.append(
+            self._next_batch_part_row_id
+        )
+        self._next_batch_part_row_id += 1
+
+    @rx.event
+    def remove_batch_part_row(self, row_id: int):
+        # A double click or stale event may name a row that is already gone.
+        if (
+            row_id in self.batch_part_row_ids
+            and len(self.batch_part_row_ids) > 1
+        ):
+            self.batch_part_row_ids.remove(row_id)
+
+
+class EditMotorbikeFormState(rx.State):
+    show_edit_motorbike_dialog: bool = False
+    editing_motorbike_id: str | None = None
+    edit_motorbike_form_name: str = ""
+    edit_motorbike_form_initial_cost: str = ""
+    edit_motorbike_form_tanya_initial_cost: str = ""
+    edit_motorbike_form_gerald_initial_cost: str = ""
+    edit_motorbike_form_buyer: str = DEFAULT_BUYERS[0]
+    edit_motorbike_form_is_sold: bool = False
+    edit_motorbike_form_sold_value: str = ""
+    edit_motorbike_form_ignore_from_calculations: bool = (
+        False
+    )
+
+    @rx.event
+    def set_edit_motorbike_form_buyer(self, buyer: str):
+        self.edit_motorbike_form_buyer = buyer
+
+    @rx.event
+    def set_edit_motorbike_form_name(self, value: str):
+        self.edit_motorbike_form_name = value
+
+    @rx.event
+    def set_edit_motorbike_form_initial_cost(
+        self, value: str
+    ):
+        self.edit_motorbike_form_initial_cost = value
+
+    @rx.event
+    def set_edit_motorbike_form_tanya_initial_cost(
+        self, value: str
+    ):
+        self.edit_motorbike_form_tanya_initial_cost = value
+
+    @rx.event
+    def set_edit_motorbike_form_gerald_initial_cost(
+        self, value: str
+    ):
+        self.edit_motorbike_form_gerald_initial_cost = value
+
+    @rx.event
+    def set_edit_motorbike_form_sold_value(
+        self, value: str | int | float
+    ):
+        self.edit_motorbike_form_sold_value = str(value)
+
+    @rx.event
+    def set_edit_motorbike_form_ignore_from_calculations(
+        self, value: bool
+    ):
+        self.edit_motorbike_form_ignore_from_calculations = (
+            value
+        )
+
+    @rx.event
+    def set_edit_motorbike_form_is_sold(self, value: bool):
+        self.edit_motorbike_form_is_sold = value
+        if not value:
+            self.edit_motorbike_form_sold_value = ""
+
+    @rx.event
+    def close_edit_motorbike_dialog(self):
+        self.show_edit_motorbike_dialog = False
+        self.editing_motorbike_id = None
+        self.edit_motorbike_form_name = ""
+        self.edit_motorbike_form_initial_cost = ""
+        self.edit_motorbike_form_tanya_initial_cost = ""
+        self.edit_motorbike_form_gerald_initial_cost = ""
+        self.edit_motorbike_form_buyer = DEFAULT_BUYERS[0]
+        self.edit_motorbike_form_is_sold = False
+        self.edit_motorbike_form_sold_value = ""
+        self.edit_motorbike_form_ignore_from_calculations = (
+            False
+        )
+
+    @rx.event
+    def set_show_edit_motorbike_dialog(self, value: bool):
+        self.show_edit_motorbike_dialog = value
+        if not value:
+            yield EditMotorbikeFormState.close_edit_motorbike_dialog
+
+
+class EditPartFormState(rx.State):
+    show_edit_part_dialog: bool = False
+    editing_part_motorbike_id: str | None = None
+    editing_part_id: str | None = None
+    edit_part_form_name: str = ""
+    edit_part_form_source: str = ""
+    edit_part_form_buyer: str = DEFAULT_BUYERS[0]
+    edit_part_form_cost: str = ""
+
+    @rx.event
+    def set_edit_part_form_name(self, value: str):
+        self.edit_part_form_name = value
+
+    @rx.event
+    def set_edit_part_form_source(self, value: str):
+        self.edit_part_form_source = value
+
+    @rx.event
+    def set_edit_part_form_buyer(self, value: str):
+        self.edit_part_form_buyer = value
+
+    @rx.event
+    def set_edit_part_form_cost(
+        self, value: str | int | float
+    ):
+        self.edit_part_form_cost = str(value)
+
+    @rx.event
+    def close_edit_part_dialog(self):
+        self.show_edit_part_dialog = False
+        self.editing_part_motorbike_id = None
+        self.editing_part_id = None
+        self.edit_part_form_name = ""
+        self.edit_part_form_source = ""
+        self.edit_part_form_buyer = DEFAULT_BUYERS[0]
+        self.edit_part_form_cost = ""
+
+    @rx.event
+    def set_show_edit_part_dialog(self, value: bool):
+        self.show_edit_part_dialog = value
+        if not value:
+            yield EditPartFormState.close_edit_part_dialog
+
+
+class SelectedMotorbike(TypedDict):
+    name: str
+    # Current sold value as the bulk sold dialog's input text; "" when unset.
+    sold_value: str
+
+
+class MotorbikeSelectionState(rx.State):
+    """Motorbikes ticked on the All Motorbikes grid for bulk actions, by id."""
+
+    selected_motorbikes: Dict[str, SelectedMotorbike] = {}
+    show_bulk_sold_dialog: bool = False
+
+    def _clear_selection(self):
+        self.selected_motorbikes = {}
+        self.show_bulk_sold_dialog = False
+
+    @rx.var
+    def selected_motorbike_count(self) -> int:
+        return len(self.selected_motorbikes)
+
+    @rx.event
+    def toggle_motorbike_selection(
+        self,
+        motorbike_id: str,
+        motorbike_name: str,
+        sold_value: float | None = None,
+    ):
+        if motorbike_id in self.selected_motorbikes:
+            self.selected_motorbikes.pop(motorbike_id)
+        else:
+            self.selected_motorbikes[motorbike_id] = {
+                "name": motorbike_name,
+                "sold_value": (
+                    "" if sold_value is None else str(sold_value)
+                ),
+            }
+
+    @rx.event
+    def clear_motorbike_selection(self):
+        self._clear_selection()
+
+    @rx.event
+    def set_show_bulk_sold_dialog(self, value: bool):
+        self.show_bulk_sold_dialog = value
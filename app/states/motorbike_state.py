@@ -1,15 +1,59 @@
 import reflex as rx
 from typing import (
     TypedDict,
+    Dict,
+    Iterator,
     List,
     cast,
     Optional as PyOptional,
+    Tuple,
 )
+import bisect
 import datetime
 import uuid
+from reflex.event import EventSpec
+from app.db_executor import run_in_db_executor
+from app.inventory_cache import inventory_cache
+from app.inventory_validation import (
+    validate_motorbike_input,
+    validate_part_input,
+)
 from app.models import MotorbikeDB, PartDB
+from app.queries import (
+    CostRollup,
+    MotorbikePageCursor,
+    bump_inventory_version,
+    fetch_cost_rollups,
+    fetch_motorbike_page,
+    fetch_motorbike_with_parts,
+    get_inventory_version,
+)
+from app.states.motorbike_form_state import (
+    DEFAULT_BUYERS,
+    BatchPartFormState,
+    EditMotorbikeFormState,
+    EditPartFormState,
+    MotorbikeSelectionState,
+    NewMotorbikeFormState,
+    NewPartFormState,
+)
+from sqlalchemy import case, delete, insert, update
 from sqlmodel import select
 
+MOTORBIKES_PAGE_SIZE = 24
+MOTORBIKE_SHARD_COUNT = 32
+MIN_MOTORBIKE_SHARD_SIZE = 8
+
+
+def motorbike_shard_name(shard_index: int) -> str:
+    return f"motorbikes_shard_{shard_index}"
+
+
+MOTORBIKE_SHARD_NAMES = [
+    motorbike_shard_name(shard_index)
+    for shard_index in range(MOTORBIKE_SHARD_COUNT)
+]
+
 
 class Part(TypedDict):
     id: str
@@ -19,14 +63,13 @@ class Part(TypedDict):
     cost: float
 
 
-class Motorbike(TypedDict):
+class MotorbikeSummary(TypedDict):
     id: str
     name: str
     initial_cost: float
     tanya_initial_cost: float
     gerald_initial_cost: float
     bike_buyer: str | None
-    parts: List[Part]
     total_parts_cost: float
     tanya_parts_cost: float
     gerald_parts_cost: float
@@ -34,44 +77,50 @@ class Motorbike(TypedDict):
     is_sold: bool
     sold_value: float | None
     ignore_from_calculations: bool
+    part_count: int
+
+
+class Motorbike(MotorbikeSummary):
+    parts: List[Part]
+
+
+class MotorbikeOption(TypedDict):
+    id: str
+    name: str
+
+
+class PortfolioSnapshot(TypedDict):
+    total_cost: float
+    projected_sale: float
+    actual_profit: float
 
 
 class MotorbikeState(rx.State):
-    motorbikes: List[Motorbike] = []
-    buyers: List[str] = ["Tanya", "Gerald"]
-    new_motorbike_name: str = ""
-    new_motorbike_initial_cost: str = ""
-    new_motorbike_tanya_initial_cost: str = ""
-    new_motorbike_gerald_initial_cost: str = ""
-    new_motorbike_buyer: str = "Tanya"
+    """Inventory state for the dashboard, grid and mutation handlers.
+
+    The dashboard list is split into MOTORBIKE_SHARD_COUNT contiguous shard
+    vars (``motorbikes_shard_0`` ...), so changing one bike only resends the
+    shard holding it rather than the whole inventory.
+    """
+
+    expanded_motorbike_parts: Dict[str, List[Part]] = {}
+    unsold_motorbikes: List[MotorbikeOption] = []
+    buyers: List[str] = DEFAULT_BUYERS
     part_form_selected_motorbike_id: str = ""
-    new_part_name: str = ""
-    new_part_source: str = ""
-    new_part_buyer: str = "Tanya"
-    new_part_cost: str = ""
-    show_edit_motorbike_dialog: bool = False
-    editing_motorbike_id: str | None = None
-    edit_motorbike_form_name: str = ""
-    edit_motorbike_form_initial_cost: str = ""
-    edit_motorbike_form_tanya_initial_cost: str = ""
-    edit_motorbike_form_gerald_initial_cost: str = ""
-    edit_motorbike_form_buyer: str = "Tanya"
-    edit_motorbike_form_is_sold: bool = False
-    edit_motorbike_form_sold_value: str = ""
-    edit_motorbike_form_ignore_from_calculations: bool = (
-        False
-    )
-    show_edit_part_dialog: bool = False
-    editing_part_motorbike_id: str | None = None
-    editing_part_id: str | None = None
-    edit_part_form_name: str = ""
-    edit_part_form_source: str = ""
-    edit_part_form_buyer: str = "Tanya"
-    edit_part_form_cost: str = ""
-
-    def _convert_part_db_to_dict(
-        self, part_db: PartDB
-    ) -> Part:
+    _loaded_inventory_version: int = -1
+    _motorbike_positions: Dict[str, Tuple[int, int]] = {}
+    _motorbikes_shard_size: int = MIN_MOTORBIKE_SHARD_SIZE
+    _motorbikes_last_shard: int = 0
+    motorbikes_page_items: List[MotorbikeSummary] = []
+    motorbikes_page_number: int = 1
+    motorbikes_page_has_next: bool = False
+    _motorbikes_page_cursors: List[MotorbikePageCursor | None] = [
+        None
+    ]
+    _motorbikes_next_page_cursor: MotorbikePageCursor | None = None
+
+    @staticmethod
+    def _convert_part_db_to_dict(part_db: PartDB) -> Part:
         return {
             "id": part_db.id,
             "name": part_db.name,
@@ -80,138 +129,461 @@ class MotorbikeState(rx.State):
             "cost": part_db.cost,
         }
 
-    def _convert_motorbike_db_to_dict(
-        self, bike_db: MotorbikeDB
-    ) -> Motorbike:
-        parts_list = [
-            self._convert_part_db_to_dict(p)
-            for p in bike_db.parts
-        ]
-        total_parts_cost = sum(
-            (p["cost"] for p in parts_list)
-        )
-        tanya_parts_cost = sum(
-            (
-                p["cost"]
-                for p in parts_list
-                if p["buyer"].lower() == "tanya"
-            )
-        )
-        gerald_parts_cost = sum(
-            (
-                p["cost"]
-                for p in parts_list
-                if p["buyer"].lower() == "gerald"
-            )
-        )
-        motorbike_dict: Motorbike = {
+    @staticmethod
+    def _convert_motorbike_db_to_summary(
+        bike_db: MotorbikeDB, rollup: CostRollup
+    ) -> MotorbikeSummary:
+        return {
             "id": bike_db.id,
             "name": bike_db.name,
             "initial_cost": bike_db.initial_cost,
             "tanya_initial_cost": bike_db.tanya_initial_cost,
             "gerald_initial_cost": bike_db.gerald_initial_cost,
             "bike_buyer": bike_db.buyer,
-            "parts": parts_list,
-            "total_parts_cost": total_parts_cost,
-            "tanya_parts_cost": tanya_parts_cost,
-            "gerald_parts_cost": gerald_parts_cost,
-            "total_motorbike_cost": bike_db.initial_cost
-            + total_parts_cost,
+            "total_parts_cost": rollup["total_parts_cost"],
+            "tanya_parts_cost": rollup["tanya_parts_cost"],
+            "gerald_parts_cost": rollup["gerald_parts_cost"],
+            "total_motorbike_cost": rollup[
+                "total_motorbike_cost"
+            ],
             "is_sold": bike_db.is_sold,
             "sold_value": bike_db.sold_value,
             "ignore_from_calculations": bike_db.ignore_from_calculations,
+            "part_count": rollup["part_count"],
         }
+
+    @staticmethod
+    def _convert_motorbike_db_to_dict(
+        bike_db: MotorbikeDB, rollup: CostRollup
+    ) -> Motorbike:
+        parts_list = [
+            MotorbikeState._convert_part_db_to_dict(p)
+            for p in bike_db.parts
+        ]
+        motorbike_dict = cast(
+            Motorbike,
+            MotorbikeState._convert_motorbike_db_to_summary(
+                bike_db, rollup
+            ),
+        )
+        motorbike_dict["parts"] = parts_list
         return motorbike_dict
 
-    @rx.var
-    def total_cost(self) -> float:
-        return sum(
-            (
-                bike["total_motorbike_cost"]
-                for bike in self.motorbikes
-                if not bike["ignore_from_calculations"]
-            )
+    @staticmethod
+    def _summarize_motorbike(
+        bike_dict: Motorbike,
+    ) -> MotorbikeSummary:
+        return cast(
+            MotorbikeSummary,
+            {
+                key: value
+                for key, value in bike_dict.items()
+                if key != "parts"
+            },
         )
 
-    @rx.var
-    def projected_sale(self) -> float:
-        cost_of_unsold_bikes = sum(
-            (
-                bike["total_motorbike_cost"]
-                for bike in self.motorbikes
-                if not bike["is_sold"]
-                and (not bike["ignore_from_calculations"])
+    @staticmethod
+    def _load_motorbike_dict(
+        session, bike_db: MotorbikeDB
+    ) -> Motorbike:
+        rollups = fetch_cost_rollups(session, [bike_db.id])
+        return MotorbikeState._convert_motorbike_db_to_dict(
+            bike_db, rollups[bike_db.id]
+        )
+
+    @staticmethod
+    def _fetch_motorbike(
+        session, motorbike_id: str
+    ) -> Motorbike | None:
+        bike_db = fetch_motorbike_with_parts(
+            session, motorbike_id
+        )
+        if bike_db is None:
+            return None
+        return MotorbikeState._load_motorbike_dict(
+            session, bike_db
+        )
+
+    @staticmethod
+    def _load_motorbike_snapshot(
+        motorbike_id: str,
+    ) -> Motorbike | None:
+        with rx.session() as session:
+            current_version = get_inventory_version(session)
+            return inventory_cache.get_or_load(
+                ("motorbike", current_version, motorbike_id),
+                lambda: MotorbikeState._fetch_motorbike(
+                    session, motorbike_id
+                ),
+                depends_on=[motorbike_id],
+            )
+
+    @staticmethod
+    def _fetch_motorbike_summaries(
+        session, motorbike_ids: List[str]
+    ) -> Dict[str, MotorbikeSummary]:
+        db_motorbikes = session.exec(
+            select(MotorbikeDB).where(
+                MotorbikeDB.id.in_(motorbike_ids)
+            )
+        ).all()
+        rollups = fetch_cost_rollups(session, motorbike_ids)
+        return {
+            bike_db.id: MotorbikeState._convert_motorbike_db_to_summary(
+                bike_db, rollups[bike_db.id]
+            )
+            for bike_db in db_motorbikes
+        }
+
+    @staticmethod
+    def _fetch_all_motorbikes(session) -> List[MotorbikeSummary]:
+        db_motorbikes = session.exec(select(MotorbikeDB)).all()
+        rollups = fetch_cost_rollups(session)
+        return [
+            MotorbikeState._convert_motorbike_db_to_summary(
+                bike_db, rollups[bike_db.id]
             )
+            for bike_db in db_motorbikes
+        ]
+
+    @staticmethod
+    def _load_inventory_snapshot(
+        session, inventory_version: int
+    ) -> List[MotorbikeSummary]:
+        return inventory_cache.get_or_load(
+            ("motorbikes", inventory_version),
+            lambda: MotorbikeState._fetch_all_motorbikes(session),
         )
-        return cost_of_unsold_bikes * 2
 
-    @rx.var
-    def actual_profit(self) -> float:
-        profit = 0.0
-        for bike in self.motorbikes:
-            if (
-                bike["is_sold"]
-                and bike["sold_value"] is not None
-                and (not bike["ignore_from_calculations"])
-            ):
-                profit += (
-                    bike["sold_value"]
-                    - bike["total_motorbike_cost"]
+    @staticmethod
+    def _fetch_motorbike_page(
+        session, after: MotorbikePageCursor | None
+    ) -> tuple[
+        List[MotorbikeSummary], MotorbikePageCursor | None
+    ]:
+        db_motorbikes, next_cursor = fetch_motorbike_page(
+            session, MOTORBIKES_PAGE_SIZE, after
+        )
+        rollups = fetch_cost_rollups(
+            session, [bike_db.id for bike_db in db_motorbikes]
+        )
+        return (
+            [
+                MotorbikeState._convert_motorbike_db_to_summary(
+                    bike_db, rollups[bike_db.id]
                 )
-        return profit
+                for bike_db in db_motorbikes
+            ],
+            next_cursor,
+        )
 
-    @rx.var
-    def has_motorbikes(self) -> bool:
-        return len(self.motorbikes) > 0
+    def _motorbike_shard(
+        self, shard_index: int
+    ) -> List[MotorbikeSummary]:
+        return getattr(self, motorbike_shard_name(shard_index))
 
-    @rx.var
-    def selected_motorbike_for_detail(
-        self,
-    ) -> Motorbike | None:
-        motorbike_id_from_url = self.router.page.params.get(
-            "route_arg_motorbike_id", ""
+    def _iter_motorbikes(self) -> Iterator[MotorbikeSummary]:
+        for shard_index in range(MOTORBIKE_SHARD_COUNT):
+            yield from self._motorbike_shard(shard_index)
+
+    def _set_motorbikes(
+        self, motorbikes: List[MotorbikeSummary]
+    ) -> None:
+        shard_size = max(
+            MIN_MOTORBIKE_SHARD_SIZE,
+            -(-len(motorbikes) // MOTORBIKE_SHARD_COUNT),
+        )
+        for shard_index, shard_name in enumerate(
+            MOTORBIKE_SHARD_NAMES
+        ):
+            setattr(
+                self,
+                shard_name,
+                motorbikes[
+                    shard_index
+                    * shard_size : (shard_index + 1)
+                    * shard_size
+                ],
+            )
+        self._motorbikes_shard_size = shard_size
+        self._motorbikes_last_shard = max(
+            0, (len(motorbikes) - 1) // shard_size
         )
-        if not motorbike_id_from_url:
+        self._motorbike_positions = {
+            bike["id"]: (shard_index, position)
+            for shard_index in range(MOTORBIKE_SHARD_COUNT)
+            for position, bike in enumerate(
+                self._motorbike_shard(shard_index)
+            )
+        }
+        self._refresh_unsold_motorbikes()
+
+    def _find_motorbike(
+        self, motorbike_id: str
+    ) -> MotorbikeSummary | None:
+        position = self._motorbike_positions.get(motorbike_id)
+        if position is None:
             return None
-        for bike in self.motorbikes:
-            if bike["id"] == motorbike_id_from_url:
-                return bike
-        return None
+        shard_index, shard_position = position
+        return self._motorbike_shard(shard_index)[shard_position]
+
+    def _append_motorbike(
+        self, bike_summary: MotorbikeSummary
+    ) -> None:
+        shard_index = self._motorbikes_last_shard
+        if (
+            len(self._motorbike_shard(shard_index))
+            >= self._motorbikes_shard_size
+            and shard_index < MOTORBIKE_SHARD_COUNT - 1
+        ):
+            shard_index += 1
+            self._motorbikes_last_shard = shard_index
+        shard = self._motorbike_shard(shard_index)
+        self._motorbike_positions[bike_summary["id"]] = (
+            shard_index,
+            len(shard),
+        )
+        shard.append(bike_summary)
+        if not bike_summary["is_sold"]:
+            self.unsold_motorbikes.append(
+                {"id": bike_summary["id"], "name": bike_summary["name"]}
+            )
+
+    def _replace_motorbike(
+        self, bike_summary: MotorbikeSummary
+    ) -> None:
+        for page_position, page_bike in enumerate(
+            self.motorbikes_page_items
+        ):
+            if page_bike["id"] == bike_summary["id"]:
+                self.motorbikes_page_items[page_position] = (
+                    bike_summary
+                )
+                break
+        position = self._motorbike_positions.get(
+            bike_summary["id"]
+        )
+        if position is not None:
+            shard_index, shard_position = position
+            shard = self._motorbike_shard(shard_index)
+            previous_summary = shard[shard_position]
+            shard[shard_position] = bike_summary
+            self._update_unsold_motorbike(
+                previous_summary, bike_summary
+            )
+
+    def _remove_motorbike(self, motorbike_id: str) -> bool:
+        self.expanded_motorbike_parts.pop(motorbike_id, None)
+        if any(
+            page_bike["id"] == motorbike_id
+            for page_bike in self.motorbikes_page_items
+        ):
+            self.motorbikes_page_items = [
+                page_bike
+                for page_bike in self.motorbikes_page_items
+                if page_bike["id"] != motorbike_id
+            ]
+        position = self._motorbike_positions.get(motorbike_id)
+        if position is None:
+            return False
+        shard_index, shard_position = position
+        shard = self._motorbike_shard(shard_index)
+        if not shard[shard_position]["is_sold"]:
+            self.unsold_motorbikes.pop(
+                self._unsold_motorbike_index(motorbike_id)
+            )
+        del self._motorbike_positions[motorbike_id]
+        shard.pop(shard_position)
+        for later_position in range(shard_position, len(shard)):
+            self._motorbike_positions[
+                shard[later_position]["id"]
+            ] = (shard_index, later_position)
+        return True
+
+    def _unsold_motorbike_index(self, motorbike_id: str) -> int:
+        """Where the bike's entry is, or belongs, in unsold_motorbikes.
+
+        The entries follow inventory order, so this is a binary search on
+        their shard positions rather than a scan.
+        """
+        positions = self._motorbike_positions
+        return bisect.bisect_left(
+            self.unsold_motorbikes,
+            positions[motorbike_id],
+            key=lambda option: positions[option["id"]],
+        )
 
-    @rx.var
-    def sorted_motorbikes_for_display(
+    def _update_unsold_motorbike(
         self,
-    ) -> List[Motorbike]:
-        return sorted(
-            self.motorbikes,
-            key=lambda bike: (
-                bike["is_sold"],
-                bike["name"].lower(),
-            ),
+        previous_summary: MotorbikeSummary,
+        bike_summary: MotorbikeSummary,
+    ) -> None:
+        if previous_summary["is_sold"] == bike_summary["is_sold"] and (
+            bike_summary["is_sold"]
+            or previous_summary["name"] == bike_summary["name"]
+        ):
+            return
+        option_index = self._unsold_motorbike_index(
+            bike_summary["id"]
         )
+        option: MotorbikeOption = {
+            "id": bike_summary["id"],
+            "name": bike_summary["name"],
+        }
+        if bike_summary["is_sold"]:
+            self.unsold_motorbikes.pop(option_index)
+        elif previous_summary["is_sold"]:
+            self.unsold_motorbikes.insert(option_index, option)
+        else:
+            self.unsold_motorbikes[option_index] = option
 
-    @rx.var
-    def unsold_motorbikes(self) -> List[Motorbike]:
-        return [
-            bike
-            for bike in self.motorbikes
+    def _refresh_unsold_motorbikes(self) -> None:
+        unsold_motorbikes: List[MotorbikeOption] = [
+            {"id": bike["id"], "name": bike["name"]}
+            for bike in self._iter_motorbikes()
             if not bike["is_sold"]
         ]
+        if unsold_motorbikes != self.unsold_motorbikes:
+            self.unsold_motorbikes = unsold_motorbikes
 
-    @rx.event
-    def load_all_data(self):
-        temp_motorbikes = []
+    @staticmethod
+    def _record_inventory_write(
+        session, motorbike_id: str
+    ) -> int:
+        new_version = bump_inventory_version(session)
+        inventory_cache.invalidate([motorbike_id])
+        return new_version
+
+    def _mark_inventory_written(self, new_version: int) -> None:
+        if new_version == self._loaded_inventory_version + 1:
+            self._loaded_inventory_version = new_version
+
+    async def _sync_motorbike_detail(
+        self, bike_dict: Motorbike
+    ) -> None:
+        detail_state = await self.get_state(MotorbikeDetailState)
+        if detail_state.detail_motorbike_id == bike_dict["id"]:
+            detail_state.detail_motorbike = bike_dict
+
+    async def _clear_motorbike_detail(
+        self, motorbike_id: str
+    ) -> None:
+        detail_state = await self.get_state(MotorbikeDetailState)
+        if detail_state.detail_motorbike_id == motorbike_id:
+            detail_state.detail_motorbike = None
+
+    async def _apply_motorbike_update(
+        self, bike_dict: Motorbike
+    ) -> None:
+        self._replace_motorbike(
+            self._summarize_motorbike(bike_dict)
+        )
+        if bike_dict["id"] in self.expanded_motorbike_parts:
+            self.expanded_motorbike_parts[bike_dict["id"]] = (
+                bike_dict["parts"]
+            )
+        await self._sync_motorbike_detail(bike_dict)
+
+    @rx.var(deps=MOTORBIKE_SHARD_NAMES, auto_deps=False)
+    def _motorbikes(self) -> List[MotorbikeSummary]:
+        return list(self._iter_motorbikes())
+
+    @rx.var(deps=["_motorbikes"], auto_deps=False)
+    def _portfolio(self) -> PortfolioSnapshot:
+        return self._compute_portfolio(self._motorbikes)
+
+    @staticmethod
+    def _compute_portfolio(
+        motorbikes: List[MotorbikeSummary],
+    ) -> PortfolioSnapshot:
+        total_cost = 0.0
+        cost_of_unsold_bikes = 0.0
+        actual_profit = 0.0
+        for bike in motorbikes:
+            if bike["ignore_from_calculations"]:
+                continue
+            bike_cost = bike["total_motorbike_cost"]
+            total_cost += bike_cost
+            if not bike["is_sold"]:
+                cost_of_unsold_bikes += bike_cost
+            elif bike["sold_value"] is not None:
+                actual_profit += bike["sold_value"] - bike_cost
+        return {
+            "total_cost": total_cost,
+            "projected_sale": cost_of_unsold_bikes * 2,
+            "actual_profit": actual_profit,
+        }
+
+    @rx.var(deps=["_portfolio"], auto_deps=False)
+    def total_cost(self) -> float:
+        return self._portfolio["total_cost"]
+
+    @rx.var(deps=["_portfolio"], auto_deps=False)
+    def projected_sale(self) -> float:
+        return self._portfolio["projected_sale"]
+
+    @rx.var(deps=["_portfolio"], auto_deps=False)
+    def actual_profit(self) -> float:
+        return self._portfolio["actual_profit"]
+
+    @rx.var(deps=["_motorbikes"], auto_deps=False)
+    def has_motorbikes(self) -> bool:
+        return len(self._motorbikes) > 0
+
+    @staticmethod
+    def _load_current_inventory(
+        loaded_inventory_version: int,
+    ) -> Tuple[int, List[MotorbikeSummary] | None]:
         with rx.session() as session:
-            db_motorbikes = session.exec(
-                select(MotorbikeDB)
-            ).all()
-            for bike_db in db_motorbikes:
-                temp_motorbikes.append(
-                    self._convert_motorbike_db_to_dict(
-                        bike_db
-                    )
-                )
-        self.motorbikes = temp_motorbikes
+            current_version = get_inventory_version(session)
+            if current_version == loaded_inventory_version:
+                return current_version, None
+            return (
+                current_version,
+                MotorbikeState._load_inventory_snapshot(
+                    session, current_version
+                ),
+            )
+
+    @staticmethod
+    def _load_motorbike_snapshots(
+        motorbike_ids: List[str],
+    ) -> Dict[str, Motorbike | None]:
+        return {
+            motorbike_id: MotorbikeState._load_motorbike_snapshot(
+                motorbike_id
+            )
+            for motorbike_id in motorbike_ids
+        }
+
+    async def _reload_expanded_motorbike_parts(self) -> None:
+        snapshots = await run_in_db_executor(
+            self._load_motorbike_snapshots,
+            list(self.expanded_motorbike_parts),
+        )
+        for motorbike_id, bike in snapshots.items():
+            if bike is None:
+                self.expanded_motorbike_parts.pop(motorbike_id)
+            else:
+                self.expanded_motorbike_parts[motorbike_id] = bike[
+                    "parts"
+                ]
+
+    @rx.event
+    async def load_all_data(self):
+        await self._refresh_inventory()
+
+    async def _refresh_inventory(self) -> None:
+        current_version, shared_motorbikes = (
+            await run_in_db_executor(
+                self._load_current_inventory,
+                self._loaded_inventory_version,
+            )
+        )
+        if shared_motorbikes is not None:
+            self._set_motorbikes(list(shared_motorbikes))
+            self._loaded_inventory_version = current_version
+            await self._reload_expanded_motorbike_parts()
         if self.unsold_motorbikes and (
             not self.part_form_selected_motorbike_id
         ):
@@ -221,69 +593,109 @@ class MotorbikeState(rx.State):
         elif not self.unsold_motorbikes:
             self.part_form_selected_motorbike_id = ""
 
+    @staticmethod
+    def _load_motorbike_page(
+        after: MotorbikePageCursor | None,
+    ) -> tuple[
+        List[MotorbikeSummary], MotorbikePageCursor | None
+    ]:
+        with rx.session() as session:
+            current_version = get_inventory_version(session)
+            return inventory_cache.get_or_load(
+                ("motorbikes_page", current_version, after),
+                lambda: MotorbikeState._fetch_motorbike_page(
+                    session, after
+                ),
+            )
+
+    async def _show_motorbikes_page(self, page_number: int):
+        after = self._motorbikes_page_cursors[page_number - 1]
+        page_items, next_cursor = await run_in_db_executor(
+            self._load_motorbike_page, after
+        )
+        self.motorbikes_page_items = list(page_items)
+        self.motorbikes_page_number = page_number
+        self.motorbikes_page_has_next = next_cursor is not None
+        self._motorbikes_next_page_cursor = next_cursor
+
+    @rx.event
+    async def load_motorbikes_page(self):
+        self._motorbikes_page_cursors = [None]
+        await self._show_motorbikes_page(1)
+
+    @rx.event
+    async def next_motorbikes_page(self):
+        if self._motorbikes_next_page_cursor is None:
+            return
+        self._motorbikes_page_cursors = self._motorbikes_page_cursors[
+            : self.motorbikes_page_number
+        ] + [self._motorbikes_next_page_cursor]
+        await self._show_motorbikes_page(
+            self.motorbikes_page_number + 1
+        )
+
+    @rx.event
+    async def previous_motorbikes_page(self):
+        if self.motorbikes_page_number <= 1:
+            return
+        await self._show_motorbikes_page(
+            self.motorbikes_page_number - 1
+        )
+
     @rx.event
-    def add_motorbike(self, form_data: dict):
-        name = form_data.get("name", "").strip()
-        initial_cost_str = form_data.get("initial_cost", "")
-        tanya_initial_str = form_data.get("tanya_initial_cost", "")
-        gerald_initial_str = form_data.get("gerald_initial_cost", "")
+    async def add_motorbike(self, form_data: dict):
         buyer = form_data.get("buyer", self.buyers[0])
-        if not name:
-            return rx.toast(
-                "Motorbike name cannot be empty.",
-                duration=3000,
-            )
-        if not initial_cost_str:
-            return rx.toast(
-                "Initial cost cannot be empty.",
-                duration=3000,
-            )
-        try:
-            initial_cost = float(initial_cost_str)
-            tanya_initial = float(tanya_initial_str or 0)
-            gerald_initial = float(gerald_initial_str or 0)
-            if initial_cost < 0 or tanya_initial < 0 or gerald_initial < 0:
-                return rx.toast(
-                    "Initial costs cannot be negative.",
-                    duration=3000,
-                )
-        except ValueError:
-            return rx.toast(
-                "Invalid initial cost format.",
-                duration=3000,
-            )
-        if abs((tanya_initial + gerald_initial) - initial_cost) > 0.01:
-            initial_cost = tanya_initial + gerald_initial
+        motorbike_input, error_message = validate_motorbike_input(
+            form_data.get("name", ""),
+            form_data.get("initial_cost", ""),
+            form_data.get("tanya_initial_cost", ""),
+            form_data.get("gerald_initial_cost", ""),
+        )
+        if motorbike_input is None:
+            return rx.toast(error_message, duration=3000)
+        name = motorbike_input["name"]
         new_id = str(uuid.uuid4())
         motorbike_db = MotorbikeDB(
             id=new_id,
             name=name,
-            initial_cost=initial_cost,
-            tanya_initial_cost=tanya_initial,
-            gerald_initial_cost=gerald_initial,
+            initial_cost=motorbike_input["initial_cost"],
+            tanya_initial_cost=motorbike_input[
+                "tanya_initial_cost"
+            ],
+            gerald_initial_cost=motorbike_input[
+                "gerald_initial_cost"
+            ],
             buyer=buyer,
             is_sold=False,
             sold_value=None,
             ignore_from_calculations=False,
         )
-        try:
+
+        def insert_motorbike() -> Tuple[int, Motorbike]:
             with rx.session() as session:
                 session.add(motorbike_db)
+                new_version = self._record_inventory_write(
+                    session, new_id
+                )
                 session.commit()
                 session.refresh(motorbike_db)
-            new_motorbike_dict = (
-                self._convert_motorbike_db_to_dict(
-                    motorbike_db
+                return new_version, self._load_motorbike_dict(
+                    session, motorbike_db
                 )
+
+        try:
+            new_version, new_motorbike_dict = (
+                await run_in_db_executor(insert_motorbike)
             )
-            self.motorbikes.append(new_motorbike_dict)
-            self.motorbikes = list(self.motorbikes)
-            self.new_motorbike_name = ""
-            self.new_motorbike_initial_cost = ""
-            self.new_motorbike_tanya_initial_cost = ""
-            self.new_motorbike_gerald_initial_cost = ""
-            self.new_motorbike_buyer = self.buyers[0]
-            if len(self.motorbikes) == 1 and (
+            self._mark_inventory_written(new_version)
+            self._append_motorbike(
+                self._summarize_motorbike(new_motorbike_dict)
+            )
+            new_motorbike_form = await self.get_state(
+                NewMotorbikeFormState
+            )
+            new_motorbike_form._reset_form()
+            if len(self._motorbike_positions) == 1 and (
                 not self.part_form_selected_motorbike_id
             ):
                 self.part_form_selected_motorbike_id = (
@@ -302,7 +714,7 @@ class MotorbikeState(rx.State):
             )
 
     @rx.event
-    def add_part(
+    async def add_part(
         self,
         form_data: dict,
         specific_motorbike_id: str | None = None,
@@ -317,80 +729,179 @@ class MotorbikeState(rx.State):
                 "Please select or specify a motorbike.",
                 duration=3000,
             )
-        part_name = form_data.get("name", "").strip()
-        cost_str = form_data.get("cost", "")
-        if not part_name:
-            return rx.toast(
-                "Part name cannot be empty.", duration=3000
-            )
-        if not cost_str:
-            return rx.toast(
-                "Part cost cannot be empty.", duration=3000
+        part_input, error_message = validate_part_input(
+            form_data.get("name", ""), form_data.get("cost", "")
+        )
+        if part_input is None:
+            return rx.toast(error_message, duration=3000)
+        part_name = part_input["name"]
+        cost = part_input["cost"]
+        if cost < 0:
+            rx.toast(
+                "Part cost is negative, possible error",
+                duration=3000,
             )
-        try:
-            cost = float(cost_str)
-            if cost < 0:
-                rx.toast(
-                    "Part cost is negative, possible error",
-                    duration=3000,
+        part_buyer = form_data.get(
+            "buyer",
+            self.buyers[0] if self.buyers else "",
+        )
+
+        def insert_part() -> EventSpec | Tuple[int, Motorbike]:
+            with rx.session() as session:
+                bike_db = session.get(
+                    MotorbikeDB, motorbike_id_to_use
                 )
-        except ValueError:
+                if not bike_db:
+                    return rx.toast(
+                        f"Motorbike with ID {motorbike_id_to_use} not found.",
+                        duration=3000,
+                    )
+                if bike_db.is_sold:
+                    return rx.toast(
+                        f"Cannot add parts to '{bike_db.name}' as it is already sold.",
+                        duration=4000,
+                    )
+                part_db = PartDB(
+                    id=str(uuid.uuid4()),
+                    name=part_name,
+                    source=form_data.get("source", ""),
+                    buyer=part_buyer,
+                    cost=cost,
+                    motorbike_id=bike_db.id,
+                )
+                session.add(part_db)
+                new_version = self._record_inventory_write(
+                    session, bike_db.id
+                )
+                session.commit()
+                session.refresh(bike_db)
+                return new_version, self._load_motorbike_dict(
+                    session, bike_db
+                )
+
+        result = await run_in_db_executor(insert_part)
+        if isinstance(result, EventSpec):
+            return result
+        new_version, updated_bike_dict = result
+        self._mark_inventory_written(new_version)
+        await self._apply_motorbike_update(updated_bike_dict)
+        new_part_form = await self.get_state(NewPartFormState)
+        new_part_form._reset_form()
+        return rx.toast(
+            f"Part '{part_name}' added to {updated_bike_dict['name']}.",
+            duration=3000,
+        )
+
+    @rx.event
+    async def add_parts_batch(
+        self,
+        form_data: dict,
+        specific_motorbike_id: str | None = None,
+    ):
+        """Adds every queued batch part row to one bike in a single transaction.
+
+        The rows are validated up front and nothing is saved if any of them is
+        invalid. The bike is reloaded once after the insert, for one rollup and
+        one state update however many parts were added.
+        """
+        motorbike_id_to_use = (
+            specific_motorbike_id
+            if specific_motorbike_id
+            else form_data.get("motorbike_id")
+        )
+        if not motorbike_id_to_use:
             return rx.toast(
-                "Invalid part cost format.", duration=3000
+                "Please select or specify a motorbike.",
+                duration=3000,
             )
-        with rx.session() as session:
-            bike_db = session.get(
-                MotorbikeDB, motorbike_id_to_use
+        batch_form = await self.get_state(BatchPartFormState)
+        default_buyer = self.buyers[0] if self.buyers else ""
+        part_rows = []
+        for row_number, row_id in enumerate(
+            batch_form.batch_part_row_ids, start=1
+        ):
+            name = form_data.get(f"name_{row_id}", "")
+            cost = form_data.get(f"cost_{row_id}", "")
+            source = form_data.get(f"source_{row_id}", "")
+            if not (name.strip() or cost or source.strip()):
+                continue
+            part_input, error_message = validate_part_input(
+                name, cost
             )
-            if not bike_db:
+            if part_input is None:
                 return rx.toast(
-                    f"Motorbike with ID {motorbike_id_to_use} not found.",
+                    f"Row {row_number}: {error_message}",
                     duration=3000,
                 )
-            if bike_db.is_sold:
-                return rx.toast(
-                    f"Cannot add parts to '{bike_db.name}' as it is already sold.",
-                    duration=4000,
-                )
-            new_part_id = str(uuid.uuid4())
-            part_db = PartDB(
-                id=new_part_id,
-                name=part_name,
-                source=form_data.get("source", ""),
-                buyer=form_data.get(
-                    "buyer",
-                    self.buyers[0] if self.buyers else "",
-                ),
-                cost=cost,
-                motorbike_id=bike_db.id,
+            part_rows.append(
+                {
+                    "id": str(uuid.uuid4()),
+                    "name": part_input["name"],
+                    "source": source,
+                    "buyer": form_data.get(
+                        f"buyer_{row_id}", default_buyer
+                    ),
+                    "cost": part_input["cost"],
+                    "motorbike_id": motorbike_id_to_use,
+                }
             )
-            session.add(part_db)
-            session.commit()
-            session.refresh(bike_db)
-            updated_bike_dict = (
-                self._convert_motorbike_db_to_dict(bike_db)
+        if not part_rows:
+            return rx.toast(
+                "Enter at least one part to add.", duration=3000
             )
-            for i, bike_in_list in enumerate(
-                self.motorbikes
-            ):
-                if (
-                    bike_in_list["id"]
-                    == motorbike_id_to_use
-                ):
-                    self.motorbikes[i] = updated_bike_dict
-                    break
-            self.motorbikes = list(self.motorbikes)
-        self.new_part_name = ""
-        self.new_part_source = ""
-        self.new_part_buyer = (
-            self.buyers[0] if self.buyers else ""
-        )
-        self.new_part_cost = ""
+
+        def insert_parts() -> EventSpec | Tuple[int, Motorbike]:
+            with rx.session() as session:
+                bike_db = session.get(
+                    MotorbikeDB, motorbike_id_to_use
+                )
+                if not bike_db:
+                    return rx.toast(
+                        f"Motorbike with ID {motorbike_id_to_use} not found.",
+                        duration=3000,
+                    )
+                if bike_db.is_sold:
+                    return rx.toast(
+                        f"Cannot add parts to '{bike_db.name}' as it is already sold.",
+                        duration=4000,
+                    )
+                session.execute(insert(PartDB), part_rows)
+                new_version = self._record_inventory_write(
+                    session, bike_db.id
+                )
+                session.commit()
+                return new_version, self._fetch_motorbike(
+                    session, motorbike_id_to_use
+                )
+
+        result = await run_in_db_executor(insert_parts)
+        if isinstance(result, EventSpec):
+            return result
+        new_version, updated_bike_dict = result
+        self._mark_inventory_written(new_version)
+        await self._apply_motorbike_update(updated_bike_dict)
+        batch_form._reset_form()
         return rx.toast(
-            f"Part '{part_name}' added to {bike_db.name}.",
+            f"Added {len(part_rows)} parts to {updated_bike_dict['name']}.",
             duration=3000,
         )
 
+    @rx.event
+    async def toggle_motorbike_parts(self, motorbike_id: str):
+        if motorbike_id in self.expanded_motorbike_parts:
+            self.expanded_motorbike_parts.pop(motorbike_id)
+            return
+        bike = await run_in_db_executor(
+            self._load_motorbike_snapshot, motorbike_id
+        )
+        if bike is None:
+            return rx.toast(
+                "Motorbike not found.", duration=3000
+            )
+        self.expanded_motorbike_parts[motorbike_id] = bike[
+            "parts"
+        ]
+
     @rx.event
     def set_part_form_selected_motorbike_id(
         self, motorbike_id: str
@@ -398,140 +909,94 @@ class MotorbikeState(rx.State):
         self.part_form_selected_motorbike_id = motorbike_id
 
     @rx.event
-    def set_new_part_buyer(self, buyer: str):
-        self.new_part_buyer = buyer
-
-    @rx.event
-    def set_new_motorbike_buyer(self, buyer: str):
-        self.new_motorbike_buyer = buyer
-
-    @rx.event
-    def set_edit_motorbike_form_buyer(self, buyer: str):
-        self.edit_motorbike_form_buyer = buyer
-
-    @rx.event
-    def set_edit_motorbike_form_name(self, value: str):
-        self.edit_motorbike_form_name = value
-
-    @rx.event
-    def set_edit_motorbike_form_initial_cost(
-        self, value: str
-    ):
-        self.edit_motorbike_form_initial_cost = value
-
-    @rx.event
-    def set_edit_motorbike_form_tanya_initial_cost(
-        self, value: str
-    ):
-        self.edit_motorbike_form_tanya_initial_cost = value
-
-    @rx.event
-    def set_edit_motorbike_form_gerald_initial_cost(
-        self, value: str
-    ):
-        self.edit_motorbike_form_gerald_initial_cost = value
-
-    @rx.event
-    def set_edit_motorbike_form_sold_value(
-        self, value: str | int | float
-    ):
-        self.edit_motorbike_form_sold_value = str(value)
-
-    @rx.event
-    def set_edit_motorbike_form_ignore_from_calculations(
-        self, value: bool
-    ):
-        self.edit_motorbike_form_ignore_from_calculations = (
-            value
+    async def open_edit_motorbike_dialog(self, motorbike_id: str):
+        bike = self._find_motorbike(
+            motorbike_id
+        ) or await run_in_db_executor(
+            self._load_motorbike_snapshot, motorbike_id
         )
-
-    @rx.event
-    def open_edit_motorbike_dialog(self, motorbike_id: str):
-        for bike in self.motorbikes:
-            if bike["id"] == motorbike_id:
-                self.editing_motorbike_id = bike["id"]
-                self.edit_motorbike_form_name = bike["name"]
-                self.edit_motorbike_form_initial_cost = str(
-                    bike["initial_cost"]
-                )
-                self.edit_motorbike_form_tanya_initial_cost = str(
-                    bike.get("tanya_initial_cost", 0.0)
-                )
-                self.edit_motorbike_form_gerald_initial_cost = str(
-                    bike.get("gerald_initial_cost", 0.0)
-                )
-                self.edit_motorbike_form_buyer = (
-                    bike["bike_buyer"]
-                    if bike["bike_buyer"]
-                    else self.buyers[0]
-                )
-                self.edit_motorbike_form_is_sold = bike[
-                    "is_sold"
-                ]
-                self.edit_motorbike_form_sold_value = (
-                    str(bike["sold_value"])
-                    if bike["sold_value"] is not None
-                    else ""
-                )
-                self.edit_motorbike_form_ignore_from_calculations = bike[
-                    "ignore_from_calculations"
-                ]
-                self.show_edit_motorbike_dialog = True
-                return
-        return rx.toast(
-            "Motorbike not found for editing.",
-            duration=3000,
+        if bike is None:
+            return rx.toast(
+                "Motorbike not found for editing.",
+                duration=3000,
+            )
+        edit_form = await self.get_state(EditMotorbikeFormState)
+        edit_form.editing_motorbike_id = bike["id"]
+        edit_form.edit_motorbike_form_name = bike["name"]
+        edit_form.edit_motorbike_form_initial_cost = str(
+            bike["initial_cost"]
         )
+        edit_form.edit_motorbike_form_tanya_initial_cost = str(
+            bike.get("tanya_initial_cost", 0.0)
+        )
+        edit_form.edit_motorbike_form_gerald_initial_cost = str(
+            bike.get("gerald_initial_cost", 0.0)
+        )
+        edit_form.edit_motorbike_form_buyer = (
+            bike["bike_buyer"]
+            if bike["bike_buyer"]
+            else self.buyers[0]
+        )
+        edit_form.edit_motorbike_form_is_sold = bike["is_sold"]
+        edit_form.edit_motorbike_form_sold_value = (
+            str(bike["sold_value"])
+            if bike["sold_value"] is not None
+            else ""
+        )
+        edit_form.edit_motorbike_form_ignore_from_calculations = bike[
+            "ignore_from_calculations"
+        ]
+        edit_form.show_edit_motorbike_dialog = True
 
     @rx.event
-    def set_edit_motorbike_form_is_sold(self, value: bool):
-        self.edit_motorbike_form_is_sold = value
-        if not value:
-            self.edit_motorbike_form_sold_value = ""
-
-    @rx.event
-    def save_edited_motorbike(self):
-        if self.editing_motorbike_id is None:
-            return rx.toast(
+    async def save_edited_motorbike(self):
+        edit_form = await self.get_state(EditMotorbikeFormState)
+        if edit_form.editing_motorbike_id is None:
+            yield rx.toast(
                 "No motorbike selected for editing.",
                 duration=3000,
             )
-        name = self.edit_motorbike_form_name.strip()
+            return
+        name = edit_form.edit_motorbike_form_name.strip()
         initial_cost_str = (
-            self.edit_motorbike_form_initial_cost
+            edit_form.edit_motorbike_form_initial_cost
         )
-        tanya_initial_str = self.edit_motorbike_form_tanya_initial_cost
-        gerald_initial_str = self.edit_motorbike_form_gerald_initial_cost
-        buyer = self.edit_motorbike_form_buyer
+        tanya_initial_str = edit_form.edit_motorbike_form_tanya_initial_cost
+        gerald_initial_str = edit_form.edit_motorbike_form_gerald_initial_cost
+        buyer = edit_form.edit_motorbike_form_buyer
         if not name:
-            return rx.toast(
+            yield rx.toast(
                 "Motorbike name cannot be empty.",
                 duration=3000,
             )
+            return
         if not initial_cost_str:
-            return rx.toast(
+            yield rx.toast(
                 "Initial cost cannot be empty.",
                 duration=3000,
             )
+            return
         try:
             initial_cost = float(initial_cost_str)
             if initial_cost < 0:
-                return rx.toast(
+                yield rx.toast(
                     "Initial cost cannot be negative.",
                     duration=3000,
                 )
+                return
             tanya_initial = float(tanya_initial_str or 0)
             gerald_initial = float(gerald_initial_str or 0)
         except ValueError:
-            return rx.toast(
+            yield rx.toast(
                 "Invalid initial cost format.",
                 duration=3000,
             )
-        is_sold_val = self.edit_motorbike_form_is_sold
+            return
+        is_sold_val = edit_form.edit_motorbike_form_is_sold
         sold_value_val: float | None = None
         if is_sold_val:
             sold_value_input_str = str(
-                self.edit_motorbike_form_sold_value
+                edit_form.edit_motorbike_form_sold_value
             )
             if sold_value_input_str.strip():
                 try:
@@ -539,348 +1004,480 @@ class MotorbikeState(rx.State):
                         sold_value_input_str.strip()
                     )
                     if sold_value_val < 0:
-                        return rx.toast(
+                        yield rx.toast(
                             "Sold value cannot be negative.",
                             duration=3000,
                         )
+                        return
                 except ValueError:
-                    return rx.toast(
+                    yield rx.toast(
                         "Invalid sold value format.",
                         duration=3000,
                     )
-        with rx.session() as session:
-            bike_db = session.get(
-                MotorbikeDB, self.editing_motorbike_id
-            )
-            if not bike_db:
-                yield MotorbikeState.close_edit_motorbike_dialog
-                return rx.toast(
-                    "Motorbike not found in database for update.",
-                    duration=3000,
+                    return
+        editing_motorbike_id = edit_form.editing_motorbike_id
+        ignore_from_calculations = (
+            edit_form.edit_motorbike_form_ignore_from_calculations
+        )
+
+        def update_motorbike() -> Tuple[int, Motorbike] | None:
+            with rx.session() as session:
+                bike_db = session.get(
+                    MotorbikeDB, editing_motorbike_id
                 )
-            bike_db.name = name
-            bike_db.initial_cost = initial_cost
-            bike_db.tanya_initial_cost = tanya_initial
-            bike_db.gerald_initial_cost = gerald_initial
-            bike_db.buyer = buyer
-            bike_db.is_sold = is_sold_val
-            bike_db.sold_value = sold_value_val
-            bike_db.ignore_from_calculations = (
-                self.edit_motorbike_form_ignore_from_calculations
-            )
-            session.add(bike_db)
-            session.commit()
-            session.refresh(bike_db)
-            updated_bike_dict = (
-                self._convert_motorbike_db_to_dict(bike_db)
+                if not bike_db:
+                    return None
+                bike_db.name = name
+                bike_db.initial_cost = initial_cost
+                bike_db.tanya_initial_cost = tanya_initial
+                bike_db.gerald_initial_cost = gerald_initial
+                bike_db.buyer = buyer
+                bike_db.is_sold = is_sold_val
+                bike_db.sold_value = sold_value_val
+                bike_db.ignore_from_calculations = (
+                    ignore_from_calculations
+                )
+                session.add(bike_db)
+                new_version = self._record_inventory_write(
+                    session, bike_db.id
+                )
+                session.commit()
+                session.refresh(bike_db)
+                return new_version, self._load_motorbike_dict(
+                    session, bike_db
+                )
+
+        result = await run_in_db_executor(update_motorbike)
+        if result is None:
+            yield EditMotorbikeFormState.close_edit_motorbike_dialog
+            yield rx.toast(
+                "Motorbike not found in database for update.",
+                duration=3000,
             )
-            for i, bike_in_list in enumerate(
-                self.motorbikes
-            ):
-                if (
-                    bike_in_list["id"]
-                    == self.editing_motorbike_id
-                ):
-                    self.motorbikes[i] = updated_bike_dict
-                    break
-            self.motorbikes = list(self.motorbikes)
-        yield MotorbikeState.close_edit_motorbike_dialog
-        return rx.toast(
+            return
+        new_version, updated_bike_dict = result
+        self._mark_inventory_written(new_version)
+        await self._apply_motorbike_update(updated_bike_dict)
+        yield EditMotorbikeFormState.close_edit_motorbike_dialog
+        yield rx.toast(
             "Motorbike details updated.", duration=3000
         )
 
     @rx.event
-    def close_edit_motorbike_dialog(self):
-        self.show_edit_motorbike_dialog = False
-        self.editing_motorbike_id = None
-        self.edit_motorbike_form_name = ""
-        self.edit_motorbike_form_initial_cost = ""
-        self.edit_motorbike_form_tanya_initial_cost = ""
-        self.edit_motorbike_form_gerald_initial_cost = ""
-        self.edit_motorbike_form_buyer = self.buyers[0]
-        self.edit_motorbike_form_is_sold = False
-        self.edit_motorbike_form_sold_value = ""
-        self.edit_motorbike_form_ignore_from_calculations = (
-            False
-        )
-
-    @rx.event
-    def delete_motorbike(self, motorbike_id: str):
-        with rx.session() as session:
-            bike_db = session.get(MotorbikeDB, motorbike_id)
-            if bike_db:
+    async def delete_motorbike(self, motorbike_id: str):
+        def remove_motorbike() -> int | None:
+            with rx.session() as session:
+                bike_db = session.get(MotorbikeDB, motorbike_id)
+                if not bike_db:
+                    return None
                 session.delete(bike_db)
+                new_version = self._record_inventory_write(
+                    session, motorbike_id
+                )
                 session.commit()
+                return new_version
+
+        new_version = await run_in_db_executor(remove_motorbike)
+        if new_version is None:
+            return rx.toast(
+                "Motorbike not found in database for deletion.",
+                duration=3000,
+            )
+        self._mark_inventory_written(new_version)
+        await self._clear_motorbike_detail(motorbike_id)
+        if self._remove_motorbike(motorbike_id) and (
+            self.part_form_selected_motorbike_id == motorbike_id
+        ):
+            if self.unsold_motorbikes:
+                self.part_form_selected_motorbike_id = (
+                    self.unsold_motorbikes[0]["id"]
+                )
             else:
-                return rx.toast(
-                    "Motorbike not found in database for deletion.",
-                    duration=3000,
+                self.part_form_selected_motorbike_id = ""
+        return rx.toast("Motorbike deleted.", duration=3000)
+
+    @staticmethod
+    def _update_motorbikes(
+        motorbike_ids: List[str], values: dict
+    ) -> Tuple[int, Dict[str, MotorbikeSummary]]:
+        with rx.session() as session:
+            session.execute(
+                update(MotorbikeDB)
+                .where(MotorbikeDB.id.in_(motorbike_ids))
+                .values(**values)
+            )
+            new_version = bump_inventory_version(session)
+            inventory_cache.invalidate(motorbike_ids)
+            session.commit()
+            return (
+                new_version,
+                MotorbikeState._fetch_motorbike_summaries(
+                    session, motorbike_ids
+                ),
+            )
+
+    @staticmethod
+    def _delete_motorbikes(
+        motorbike_ids: List[str],
+    ) -> Tuple[int, int]:
+        with rx.session() as session:
+            session.execute(
+                delete(PartDB).where(
+                    PartDB.motorbike_id.in_(motorbike_ids)
                 )
-        original_length = len(self.motorbikes)
-        self.motorbikes = [
-            bike
-            for bike in self.motorbikes
-            if bike["id"] != motorbike_id
-        ]
-        if len(self.motorbikes) < original_length:
+            )
+            result = session.execute(
+                delete(MotorbikeDB).where(
+                    MotorbikeDB.id.in_(motorbike_ids)
+                )
+            )
+            new_version = bump_inventory_version(session)
+            inventory_cache.invalidate(motorbike_ids)
+            session.commit()
+            return new_version, result.rowcount
+
+    async def _apply_bulk_motorbike_write(
+        self,
+        new_version: int,
+        updated_motorbikes: Dict[str, MotorbikeSummary],
+        deleted_motorbike_ids: List[str],
+    ) -> None:
+        self._mark_inventory_written(new_version)
+        for bike_summary in updated_motorbikes.values():
+            self._replace_motorbike(bike_summary)
+        for motorbike_id in deleted_motorbike_ids:
+            self._remove_motorbike(motorbike_id)
+        detail_state = await self.get_state(MotorbikeDetailState)
+        if detail_state.detail_motorbike_id in deleted_motorbike_ids:
+            detail_state.detail_motorbike = None
+        elif (
+            detail_state.detail_motorbike is not None
+            and detail_state.detail_motorbike_id
+            in updated_motorbikes
+        ):
+            detail_state.detail_motorbike = cast(
+                Motorbike,
+                {
+                    **detail_state.detail_motorbike,
+                    **updated_motorbikes[
+                        detail_state.detail_motorbike_id
+                    ],
+                },
+            )
+        if self.part_form_selected_motorbike_id and not any(
+            bike["id"] == self.part_form_selected_motorbike_id
+            for bike in self.unsold_motorbikes
+        ):
+            self.part_form_selected_motorbike_id = (
+                self.unsold_motorbikes[0]["id"]
+                if self.unsold_motorbikes
+                else ""
+            )
+        # Sold bikes move behind unsold ones, so re-read the page in order.
+        if self.motorbikes_page_items:
+            await self._show_motorbikes_page(
+                self.motorbikes_page_number
+            )
             if (
-                self.part_form_selected_motorbike_id
-                == motorbike_id
+                not self.motorbikes_page_items
+                and self.motorbikes_page_number > 1
             ):
-                if self.unsold_motorbikes:
-                    self.part_form_selected_motorbike_id = (
-                        self.unsold_motorbikes[0]["id"]
-                    )
-                else:
-                    self.part_form_selected_motorbike_id = (
-                        ""
+                self._motorbikes_page_cursors = [None]
+                await self._show_motorbikes_page(1)
+        selection = await self.get_state(MotorbikeSelectionState)
+        selection._clear_selection()
+
+    @rx.event
+    async def bulk_mark_motorbikes_sold(self, form_data: dict):
+        """Marks every selected bike sold, with its own sold value, in one UPDATE."""
+        selection = await self.get_state(MotorbikeSelectionState)
+        motorbike_ids = list(selection.selected_motorbikes)
+        if not motorbike_ids:
+            return rx.toast("No motorbikes selected.", duration=3000)
+        sold_values: Dict[str, float] = {}
+        for motorbike_id in motorbike_ids:
+            sold_value_str = str(
+                form_data.get(f"sold_value_{motorbike_id}", "")
+            ).strip()
+            if not sold_value_str:
+                continue
+            try:
+                sold_value = float(sold_value_str)
+            except ValueError:
+                return rx.toast(
+                    f"Invalid sold value format for '{selection.selected_motorbikes[motorbike_id]['name']}'.",
+                    duration=3000,
+                )
+            if sold_value < 0:
+                return rx.toast(
+                    "Sold value cannot be negative.",
+                    duration=3000,
+                )
+            sold_values[motorbike_id] = sold_value
+        new_version, updated_motorbikes = await run_in_db_executor(
+            self._update_motorbikes,
+            motorbike_ids,
+            {
+                "is_sold": True,
+                # Bikes left blank keep the sold value they already have.
+                "sold_value": (
+                    case(
+                        sold_values,
+                        value=MotorbikeDB.id,
+                        else_=MotorbikeDB.sold_value,
                     )
-            return rx.toast(
-                "Motorbike deleted.", duration=3000
-            )
+                    if sold_values
+                    else MotorbikeDB.sold_value
+                ),
+            },
+        )
+        await self._apply_bulk_motorbike_write(
+            new_version, updated_motorbikes, []
+        )
         return rx.toast(
-            "Motorbike not found for deletion (post-DB).",
+            f"{len(updated_motorbikes)} motorbikes marked as sold.",
             duration=3000,
         )
 
     @rx.event
-    def open_edit_part_dialog(
-        self, motorbike_id: str, part_id: str
-    ):
-        for bike in self.motorbikes:
-            if bike["id"] == motorbike_id:
-                if bike["is_sold"]:
-                    return rx.toast(
-                        f"Cannot edit parts of '{bike['name']}' as it is sold.",
-                        duration=4000,
-                    )
-                for part_item in bike["parts"]:
-                    if part_item["id"] == part_id:
-                        self.editing_part_motorbike_id = (
-                            motorbike_id
-                        )
-                        self.editing_part_id = part_id
-                        self.edit_part_form_name = (
-                            part_item["name"]
-                        )
-                        self.edit_part_form_source = (
-                            part_item["source"]
-                        )
-                        self.edit_part_form_buyer = (
-                            part_item["buyer"]
-                        )
-                        self.edit_part_form_cost = str(
-                            part_item["cost"]
-                        )
-                        self.show_edit_part_dialog = True
-                        return
+    async def bulk_set_ignore_from_calculations(self, ignore: bool):
+        selection = await self.get_state(MotorbikeSelectionState)
+        motorbike_ids = list(selection.selected_motorbikes)
+        if not motorbike_ids:
+            return rx.toast("No motorbikes selected.", duration=3000)
+        new_version, updated_motorbikes = await run_in_db_executor(
+            self._update_motorbikes,
+            motorbike_ids,
+            {"ignore_from_calculations": ignore},
+        )
+        await self._apply_bulk_motorbike_write(
+            new_version, updated_motorbikes, []
+        )
         return rx.toast(
-            "Part or motorbike not found for editing.",
+            f"{len(updated_motorbikes)} motorbikes {'excluded from' if ignore else 'included in'} calculations.",
             duration=3000,
         )
 
     @rx.event
-    def save_edited_part(self):
-        if (
-            not self.editing_part_motorbike_id
-            or not self.editing_part_id
-        ):
+    async def bulk_delete_motorbikes(self):
+        selection = await self.get_state(MotorbikeSelectionState)
+        motorbike_ids = list(selection.selected_motorbikes)
+        if not motorbike_ids:
+            return rx.toast("No motorbikes selected.", duration=3000)
+        new_version, deleted_count = await run_in_db_executor(
+            self._delete_motorbikes, motorbike_ids
+        )
+        await self._apply_bulk_motorbike_write(
+            new_version, {}, motorbike_ids
+        )
+        return rx.toast(
+            f"{deleted_count} motorbikes deleted.", duration=3000
+        )
+
+    @rx.event
+    async def open_edit_part_dialog(
+        self, motorbike_id: str, part_id: str
+    ):
+        bike = self._find_motorbike(motorbike_id)
+        parts = self.expanded_motorbike_parts.get(motorbike_id)
+        if bike is None or parts is None:
+            bike_dict = await run_in_db_executor(
+                self._load_motorbike_snapshot, motorbike_id
+            )
+            bike = bike_dict
+            parts = bike_dict["parts"] if bike_dict else []
+        part_item = next(
+            (part for part in parts if part["id"] == part_id),
+            None,
+        )
+        if bike is not None and bike["is_sold"]:
             return rx.toast(
+                f"Cannot edit parts of '{bike['name']}' as it is sold.",
+                duration=4000,
+            )
+        if part_item is None:
+            return rx.toast(
+                "Part or motorbike not found for editing.",
+                duration=3000,
+            )
+        edit_form = await self.get_state(EditPartFormState)
+        edit_form.editing_part_motorbike_id = motorbike_id
+        edit_form.editing_part_id = part_id
+        edit_form.edit_part_form_name = part_item["name"]
+        edit_form.edit_part_form_source = part_item["source"]
+        edit_form.edit_part_form_buyer = part_item["buyer"]
+        edit_form.edit_part_form_cost = str(part_item["cost"])
+        edit_form.show_edit_part_dialog = True
+
+    @rx.event
+    async def save_edited_part(self):
+        edit_form = await self.get_state(EditPartFormState)
+        editing_part_motorbike_id = (
+            edit_form.editing_part_motorbike_id
+        )
+        editing_part_id = edit_form.editing_part_id
+        if not editing_part_motorbike_id or not editing_part_id:
+            yield rx.toast(
                 "No part selected for editing.",
                 duration=3000,
             )
-        name = self.edit_part_form_name.strip()
-        cost_str = self.edit_part_form_cost
+            return
+        name = edit_form.edit_part_form_name.strip()
+        cost_str = edit_form.edit_part_form_cost
         if not name:
-            return rx.toast(
+            yield rx.toast(
                 "Part name cannot be empty.", duration=3000
             )
+            return
         if not cost_str:
-            return rx.toast(
+            yield rx.toast(
                 "Part cost cannot be empty.", duration=3000
             )
+            return
         try:
             cost = float(cost_str)
             if cost < 0:
-                return rx.toast(
+                yield rx.toast(
                     "Part cost cannot be negative.",
                     duration=3000,
                 )
+                return
         except ValueError:
-            return rx.toast(
+            yield rx.toast(
                 "Invalid part cost format.", duration=3000
             )
-        with rx.session() as session:
-            part_db = session.get(
-                PartDB, self.editing_part_id
-            )
-            if (
-                not part_db
-                or part_db.motorbike_id
-                != self.editing_part_motorbike_id
-            ):
-                yield MotorbikeState.close_edit_part_dialog
-                return rx.toast(
-                    "Part not found in database for update.",
-                    duration=3000,
+            return
+        source = edit_form.edit_part_form_source
+        part_buyer = edit_form.edit_part_form_buyer
+
+        def update_part() -> EventSpec | Tuple[int, Motorbike]:
+            with rx.session() as session:
+                part_db = session.get(PartDB, editing_part_id)
+                if (
+                    not part_db
+                    or part_db.motorbike_id
+                    != editing_part_motorbike_id
+                ):
+                    return rx.toast(
+                        "Part not found in database for update.",
+                        duration=3000,
+                    )
+                motorbike_db = session.get(
+                    MotorbikeDB, editing_part_motorbike_id
                 )
-            motorbike_db = session.get(
-                MotorbikeDB, self.editing_part_motorbike_id
-            )
-            if not motorbike_db or motorbike_db.is_sold:
-                yield MotorbikeState.close_edit_part_dialog
-                return rx.toast(
-                    "Cannot edit parts of a sold motorbike or motorbike not found.",
-                    duration=4000,
+                if not motorbike_db or motorbike_db.is_sold:
+                    return rx.toast(
+                        "Cannot edit parts of a sold motorbike or motorbike not found.",
+                        duration=4000,
+                    )
+                part_db.name = name
+                part_db.source = source
+                part_db.buyer = part_buyer
+                part_db.cost = cost
+                session.add(part_db)
+                new_version = self._record_inventory_write(
+                    session, motorbike_db.id
                 )
-            part_db.name = name
-            part_db.source = self.edit_part_form_source
-            part_db.buyer = self.edit_part_form_buyer
-            part_db.cost = cost
-            session.add(part_db)
-            session.commit()
-            session.refresh(motorbike_db)
-            updated_bike_dict = (
-                self._convert_motorbike_db_to_dict(
-                    motorbike_db
+                session.commit()
+                session.refresh(motorbike_db)
+                return new_version, self._load_motorbike_dict(
+                    session, motorbike_db
                 )
-            )
-            for i, bike_in_list in enumerate(
-                self.motorbikes
-            ):
-                if (
-                    bike_in_list["id"]
-                    == self.editing_part_motorbike_id
-                ):
-                    self.motorbikes[i] = updated_bike_dict
-                    break
-            self.motorbikes = list(self.motorbikes)
-        yield MotorbikeState.close_edit_part_dialog
-        return rx.toast(
-            "Part details updated.", duration=3000
-        )
 
-    @rx.event
-    def close_edit_part_dialog(self):
-        self.show_edit_part_dialog = False
-        self.editing_part_motorbike_id = None
-        self.editing_part_id = None
-        self.edit_part_form_name = ""
-        self.edit_part_form_source = ""
-        self.edit_part_form_buyer = (
-            self.buyers[0] if self.buyers else ""
+        result = await run_in_db_executor(update_part)
+        if isinstance(result, EventSpec):
+            yield EditPartFormState.close_edit_part_dialog
+            yield result
+            return
+        new_version, updated_bike_dict = result
+        self._mark_inventory_written(new_version)
+        await self._apply_motorbike_update(updated_bike_dict)
+        yield EditPartFormState.close_edit_part_dialog
+        yield rx.toast(
+            "Part details updated.", duration=3000
         )
-        self.edit_part_form_cost = ""
 
     @rx.event
-    def delete_part(self, motorbike_id: str, part_id: str):
-        toast_message = (
-            "Part or motorbike not found for deletion."
-        )
-        with rx.session() as session:
-            motorbike_db_check = session.get(
-                MotorbikeDB, motorbike_id
-            )
-            if (
-                motorbike_db_check
-                and motorbike_db_check.is_sold
-            ):
-                return rx.toast(
-                    f"Cannot delete parts from '{motorbike_db_check.name}' as it is already sold.",
-                    duration=4000,
-                )
-            part_db = session.get(PartDB, part_id)
-            if (
-                part_db
-                and part_db.motorbike_id == motorbike_id
-            ):
-                session.delete(part_db)
-                session.commit()
-                toast_message = "Part deleted."
-                motorbike_db_to_refresh = session.get(
+    async def delete_part(self, motorbike_id: str, part_id: str):
+        def remove_part() -> Tuple[
+            EventSpec, int | None, Motorbike | None
+        ]:
+            with rx.session() as session:
+                motorbike_db_check = session.get(
                     MotorbikeDB, motorbike_id
                 )
-                if motorbike_db_to_refresh:
-                    session.refresh(motorbike_db_to_refresh)
-                    updated_bike_dict = (
-                        self._convert_motorbike_db_to_dict(
-                            motorbike_db_to_refresh
-                        )
+                if (
+                    motorbike_db_check
+                    and motorbike_db_check.is_sold
+                ):
+                    return (
+                        rx.toast(
+                            f"Cannot delete parts from '{motorbike_db_check.name}' as it is already sold.",
+                            duration=4000,
+                        ),
+                        None,
+                        None,
+                    )
+                part_db = session.get(PartDB, part_id)
+                if not part_db:
+                    toast_message = "Part not found in database."
+                elif part_db.motorbike_id != motorbike_id:
+                    toast_message = "Part does not belong to the specified motorbike."
+                else:
+                    session.delete(part_db)
+                    new_version = self._record_inventory_write(
+                        session, motorbike_id
                     )
-                    for i, bike_in_list in enumerate(
-                        self.motorbikes
-                    ):
-                        if (
-                            bike_in_list["id"]
-                            == motorbike_id
-                        ):
-                            self.motorbikes[i] = (
-                                updated_bike_dict
+                    session.commit()
+                    updated_bike_dict = None
+                    motorbike_db_to_refresh = session.get(
+                        MotorbikeDB, motorbike_id
+                    )
+                    if motorbike_db_to_refresh:
+                        session.refresh(motorbike_db_to_refresh)
+                        updated_bike_dict = (
+                            self._load_motorbike_dict(
+                                session, motorbike_db_to_refresh
                             )
-                            break
-                    self.motorbikes = list(self.motorbikes)
-            elif not part_db:
-                toast_message = (
-                    "Part not found in database."
-                )
-            else:
-                toast_message = "Part does not belong to the specified motorbike."
-        return rx.toast(toast_message, duration=3000)
-
-    @rx.event
-    def set_new_motorbike_name(self, value: str):
-        self.new_motorbike_name = value
-
-    @rx.event
-    def set_new_motorbike_initial_cost(self, value: str):
-        self.new_motorbike_initial_cost = value
-
-    @rx.event
-    def set_new_motorbike_tanya_initial_cost(self, value: str):
-        self.new_motorbike_tanya_initial_cost = value
-
-    @rx.event
-    def set_new_motorbike_gerald_initial_cost(self, value: str):
-        self.new_motorbike_gerald_initial_cost = value
-
-    @rx.event
-    def set_new_part_name(self, value: str):
-        self.new_part_name = value
-
-    @rx.event
-    def set_new_part_source(self, value: str):
-        self.new_part_source = value
+                        )
+                    return (
+                        rx.toast("Part deleted.", duration=3000),
+                        new_version,
+                        updated_bike_dict,
+                    )
+            return (
+                rx.toast(toast_message, duration=3000),
+                None,
+                None,
+            )
 
-    @rx.event
-    def set_new_part_cost(self, value: str):
-        self.new_part_cost = value
+        toast, new_version, updated_bike_dict = (
+            await run_in_db_executor(remove_part)
+        )
+        if new_version is not None:
+            self._mark_inventory_written(new_version)
+        if updated_bike_dict is not None:
+            await self._apply_motorbike_update(updated_bike_dict)
+        return toast
 
-    @rx.event
-    def set_edit_part_form_name(self, value: str):
-        self.edit_part_form_name = value
 
-    @rx.event
-    def set_edit_part_form_source(self, value: str):
-        self.edit_part_form_source = value
+class MotorbikeDetailState(rx.State):
+    detail_motorbike_id: str = ""
+    detail_motorbike: Motorbike | None = None
 
     @rx.event
-    def set_edit_part_form_buyer(self, value: str):
-        self.edit_part_form_buyer = value
-
-    @rx.event
-    def set_edit_part_form_cost(
-        self, value: str | int | float
-    ):
-        self.edit_part_form_cost = str(value)
+    async def load_detail_motorbike(self):
+        self.detail_motorbike_id = self.router.page.params.get(
+            "route_arg_motorbike_id", ""
+        )
+        if not self.detail_motorbike_id:
+            self.detail_motorbike = None
+            return
+        self.detail_motorbike = await run_in_db_executor(
+            MotorbikeState._load_motorbike_snapshot,
+            self.detail_motorbike_id,
+        )
 
-    @rx.event
-    def set_show_edit_motorbike_dialog(self, value: bool):
-        self.show_edit_motorbike_dialog = value
-        if not value:
-            yield MotorbikeState.close_edit_motorbike_dialog
 
-    @rx.event
-    def set_show_edit_part_dialog(self, value: bool):
-        self.show_edit_part_dialog = value
-        if not value:
-            yield MotorbikeState.close_edit_part_dialog
\ No newline at end of file
+for shard_name in MOTORBIKE_SHARD_NAMES:
+    MotorbikeState.add_var(shard_name, List[MotorbikeSummary], [])
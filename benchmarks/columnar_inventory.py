@@ -0,0 +1,106 @@
+from typing import Any, Dict, Mapping, Sequence
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+NUMPY_AVAILABLE = np is not None
+
+
+class ColumnarInventory:
+    """The inventory's numeric fields as NumPy arrays, with boolean masks for sold and ignored bikes.
+
+    Built from motorbike summaries; computes the dashboard portfolio figures and
+    the analytics partner totals with vectorized operations instead of loops.
+    """
+
+    def __init__(self, motorbikes: Sequence[Mapping[str, Any]]):
+        if np is None:
+            raise RuntimeError(
+                "The columnar inventory requires numpy."
+            )
+        count = len(motorbikes)
+        self.total_cost = np.fromiter(
+            (bike["total_motorbike_cost"] for bike in motorbikes),
+            dtype=np.float64,
+            count=count,
+        )
+        self.sold_value = np.fromiter(
+            (
+                np.nan
+                if bike["sold_value"] is None
+                else bike["sold_value"]
+                for bike in motorbikes
+            ),
+            dtype=np.float64,
+            count=count,
+        )
+        self.tanya_investment = np.fromiter(
+            (
+                bike["tanya_parts_cost"] + bike["tanya_initial_cost"]
+                for bike in motorbikes
+            ),
+            dtype=np.float64,
+            count=count,
+        )
+        self.gerald_investment = np.fromiter(
+            (
+                bike["gerald_parts_cost"]
+                + bike["gerald_initial_cost"]
+                for bike in motorbikes
+            ),
+            dtype=np.float64,
+            count=count,
+        )
+        self.is_sold = np.fromiter(
+            (bike["is_sold"] for bike in motorbikes),
+            dtype=bool,
+            count=count,
+        )
+        self.is_ignored = np.fromiter(
+            (
+                bike["ignore_from_calculations"]
+                for bike in motorbikes
+            ),
+            dtype=bool,
+            count=count,
+        )
+
+    def _profit(self, mask):
+        has_sale = mask & self.is_sold & ~np.isnan(self.sold_value)
+        return float(
+            (self.sold_value[has_sale] - self.total_cost[has_sale]).sum()
+        )
+
+    def portfolio(self) -> Dict[str, float]:
+        counted = ~self.is_ignored
+        unsold = counted & ~self.is_sold
+        return {
+            "total_cost": float(self.total_cost[counted].sum()),
+            "projected_sale": float(self.total_cost[unsold].sum())
+            * 2,
+            "actual_profit": self._profit(counted),
+        }
+
+    def analytics_summary(
+        self, filter_sold_status: str
+    ) -> Dict[str, float]:
+        mask = ~self.is_ignored
+        if filter_sold_status == "sold":
+            mask = mask & self.is_sold
+        elif filter_sold_status == "unsold":
+            mask = mask & ~self.is_sold
+        elif filter_sold_status != "all":
+            mask = np.zeros_like(mask)
+        profit_share = self._profit(mask) / 2
+        return {
+            "total_tanya_investment": float(
+                self.tanya_investment[mask].sum()
+            ),
+            "total_gerald_investment": float(
+                self.gerald_investment[mask].sum()
+            ),
+            "total_tanya_profit_share": profit_share,
+            "total_gerald_profit_share": profit_share,
+        }
@@ -0,0 +1,220 @@
+"""Compares a NumPy columnar inventory with the app's portfolio and analytics paths.
+
+Dashboard figures are timed against MotorbikeState._compute_portfolio, the
+Python loop behind the summary cards. Analytics partner totals are timed
+against load_analytics_report, the SQL aggregates behind the analytics page,
+which run on a throwaway SQLite file.
+
+    python -m benchmarks.columnar_portfolio --sizes 1000 100000 1000000
+"""
+
+import argparse
+import json
+import os
+import random
+import statistics
+import tempfile
+import time
+import uuid
+from typing import Callable, Dict, List
+
+import reflex as rx
+from sqlalchemy import insert
+from sqlmodel import Session, create_engine
+
+from app.analytics_engine import load_analytics_report
+from app.models import MotorbikeDB, PartDB
+from app.states.motorbike_state import MotorbikeState, MotorbikeSummary
+from benchmarks.columnar_inventory import NUMPY_AVAILABLE, ColumnarInventory
+
+
+def generate_summaries(
+    count: int, sold_ratio: float, seed: int
+) -> List[MotorbikeSummary]:
+    rng = random.Random(seed)
+    motorbikes: List[MotorbikeSummary] = []
+    for index in range(count):
+        tanya_initial = round(rng.uniform(100, 2000), 2)
+        gerald_initial = round(rng.uniform(100, 2000), 2)
+        tanya_parts = round(rng.uniform(0, 500), 2)
+        gerald_parts = round(rng.uniform(0, 500), 2)
+        initial_cost = tanya_initial + gerald_initial
+        is_sold = rng.random() < sold_ratio
+        motorbikes.append(
+            {
+                "id": str(uuid.UUID(int=rng.getrandbits(128))),
+                "name": f"Bike {index:07d}",
+                "initial_cost": initial_cost,
+                "tanya_initial_cost": tanya_initial,
+                "gerald_initial_cost": gerald_initial,
+                "bike_buyer": rng.choice(["Tanya", "Gerald"]),
+                "total_parts_cost": tanya_parts + gerald_parts,
+                "tanya_parts_cost": tanya_parts,
+                "gerald_parts_cost": gerald_parts,
+                "total_motorbike_cost": initial_cost
+                + tanya_parts
+                + gerald_parts,
+                "is_sold": is_sold,
+                "sold_value": (
+                    round(rng.uniform(500, 8000), 2)
+                    if is_sold and rng.random() < 0.9
+                    else None
+                ),
+                "ignore_from_calculations": rng.random() < 0.05,
+                "part_count": 2,
+            }
+        )
+    return motorbikes
+
+
+def write_inventory(
+    session: Session, motorbikes: List[MotorbikeSummary]
+) -> None:
+    bike_rows = []
+    part_rows = []
+    for bike in motorbikes:
+        bike_rows.append(
+            {
+                "id": bike["id"],
+                "name": bike["name"],
+                "initial_cost": bike["initial_cost"],
+                "tanya_initial_cost": bike["tanya_initial_cost"],
+                "gerald_initial_cost": bike["gerald_initial_cost"],
+                "buyer": bike["bike_buyer"],
+                "is_sold": bike["is_sold"],
+                "sold_value": bike["sold_value"],
+                "ignore_from_calculations": bike[
+                    "ignore_from_calculations"
+                ],
+            }
+        )
+        for buyer, cost in (
+            ("Tanya", bike["tanya_parts_cost"]),
+            ("Gerald", bike["gerald_parts_cost"]),
+        ):
+            part_rows.append(
+                {
+                    "id": str(uuid.uuid4()),
+                    "name": f"{buyer} part",
+                    "source": "benchmark",
+                    "buyer": buyer,
+                    "cost": cost,
+                    "motorbike_id": bike["id"],
+                }
+            )
+    session.execute(insert(MotorbikeDB), bike_rows)
+    session.execute(insert(PartDB), part_rows)
+    session.commit()
+
+
+def time_call(
+    function: Callable[[], object], repeat: int
+) -> Dict[str, float]:
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        function()
+        timings.append(time.perf_counter() - started)
+    return {
+        "median_ms": statistics.median(timings) * 1000,
+        "min_ms": min(timings) * 1000,
+    }
+
+
+def max_difference(
+    expected: Dict[str, float], actual: Dict[str, float]
+) -> float:
+    return max(abs(expected[key] - actual[key]) for key in expected)
+
+
+def run_size(
+    count: int, repeat: int, sold_ratio: float, with_sql: bool
+) -> Dict[str, object]:
+    motorbikes = generate_summaries(count, sold_ratio, seed=count)
+    columnar = ColumnarInventory(motorbikes)
+    result: Dict[str, object] = {
+        "bikes": count,
+        "python_portfolio": time_call(
+            lambda: MotorbikeState._compute_portfolio(motorbikes),
+            repeat,
+        ),
+        "columnar_build": time_call(
+            lambda: ColumnarInventory(motorbikes), repeat
+        ),
+        "columnar_portfolio": time_call(
+            columnar.portfolio, repeat
+        ),
+        "columnar_analytics": time_call(
+            lambda: columnar.analytics_summary("all"), repeat
+        ),
+        "portfolio_max_difference": max_difference(
+            dict(MotorbikeState._compute_portfolio(motorbikes)),
+            columnar.portfolio(),
+        ),
+    }
+    if with_sql:
+        with tempfile.TemporaryDirectory() as directory:
+            engine = create_engine(
+                f"sqlite:///{os.path.join(directory, 'benchmark.db')}"
+            )
+            rx.Model.metadata.create_all(engine)
+            with Session(engine) as session:
+                write_inventory(session, motorbikes)
+                result["sql_analytics"] = time_call(
+                    lambda: load_analytics_report(session, "all"),
+                    repeat,
+                )
+                result["analytics_max_difference"] = max_difference(
+                    dict(
+                        load_analytics_report(session, "all")[
+                            "summary"
+                        ]
+                    ),
+                    columnar.analytics_summary("all"),
+                )
+            engine.dispose()
+    return result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--sizes",
+        type=int,
+        nargs="+",
+        default=[1_000, 100_000, 1_000_000],
+    )
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--sold-ratio", type=float, default=0.4)
+    parser.add_argument(
+        "--skip-sql",
+        action="store_true",
+        help="Only time the in-memory paths.",
+    )
+    parser.add_argument(
+        "--output", help="Write the results as JSON to this file."
+    )
+    args = parser.parse_args()
+    if not NUMPY_AVAILABLE:
+        raise SystemExit("numpy is not installed.")
+    results = []
+    for count in args.sizes:
+        result = run_size(
+            count, args.repeat, args.sold_ratio, not args.skip_sql
+        )
+        results.append(result)
+        print(
+            f"{count:>9} bikes: "
+            + ", ".join(
+                f"{name} {timing['median_ms']:.2f} ms"
+                for name, timing in result.items()
+                if isinstance(timing, dict)
+            )
+        )
+    if args.output:
+        with open(args.output, "w") as output_file:
+            json.dump(results, output_file, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,183 @@
+"""Measures event latency with many simulated clients on one event loop.
+
+Every client loads the dashboard and then keeps adding parts, while an
+observer client sends a cheap event every few milliseconds. Each part added
+changes the inventory version, so the next client's load_all_data goes back to
+SQL. The run is repeated with the database work done inline on the event loop,
+as the handlers did before they used the DB worker pool, for comparison.
+
+    python -m benchmarks.concurrent_clients --bikes 2000 --clients 16 --output results.json
+"""
+
+import argparse
+import asyncio
+import contextlib
+import json
+import os
+import tempfile
+import time
+from typing import Any, Dict, List
+from unittest import mock
+
+import reflex as rx
+from sqlmodel import select
+
+import app.states.motorbike_state as motorbike_state_module
+from app.db_setup import create_db_and_tables
+from app.models import MotorbikeDB
+from app.states.motorbike_state import MotorbikeState
+from benchmarks.inventory_hot_paths import (
+    HandlerRunner,
+    StatementCounter,
+)
+from benchmarks.login_storm import latency_summary
+from benchmarks.synthetic_data import (
+    SyntheticInventoryConfig,
+    write_inventory,
+)
+
+
+async def run_inline(function, *args):
+    return function(*args)
+
+
+async def run_clients(
+    counter: StatementCounter,
+    motorbike_ids: List[str],
+    clients: int,
+    rounds: int,
+    interval_ms: float,
+) -> Dict[str, Any]:
+    client_latencies_ms: List[float] = []
+    observer_latencies_ms: List[float] = []
+    clients_done = asyncio.Event()
+
+    async def client(client_index: int):
+        runner = HandlerRunner(counter)
+        for round_index in range(rounds):
+            for handler, payload in (
+                ("load_all_data", {}),
+                (
+                    "add_part",
+                    {
+                        "form_data": {
+                            "name": f"Part {client_index}-{round_index}",
+                            "cost": "10",
+                        },
+                        "specific_motorbike_id": motorbike_ids[
+                            (client_index + round_index)
+                            % len(motorbike_ids)
+                        ],
+                    },
+                ),
+            ):
+                started = time.perf_counter()
+                await runner.process(MotorbikeState, handler, payload)
+                client_latencies_ms.append(
+                    (time.perf_counter() - started) * 1000
+                )
+
+    async def observe():
+        observer = HandlerRunner(counter)
+        while not clients_done.is_set():
+            due = time.perf_counter() + interval_ms / 1000
+            await asyncio.sleep(interval_ms / 1000)
+            await observer.process(
+                MotorbikeState,
+                "set_part_form_selected_motorbike_id",
+                {"motorbike_id": ""},
+            )
+            observer_latencies_ms.append(
+                (time.perf_counter() - due) * 1000
+            )
+
+    async def run_all_clients():
+        started = time.perf_counter()
+        await asyncio.gather(
+            *(client(index) for index in range(clients))
+        )
+        clients_done.set()
+        return (time.perf_counter() - started) * 1000
+
+    _, total_ms = await asyncio.gather(observe(), run_all_clients())
+    return {
+        "total_ms": total_ms,
+        "client_events": latency_summary(client_latencies_ms),
+        "observer": latency_summary(observer_latencies_ms),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--bikes", type=int, default=2_000)
+    parser.add_argument("--parts-per-bike", type=int, default=5)
+    parser.add_argument("--clients", type=int, default=16)
+    parser.add_argument("--rounds", type=int, default=3)
+    parser.add_argument("--interval-ms", type=float, default=5)
+    parser.add_argument(
+        "--output", help="Write the results as JSON to this file."
+    )
+    args = parser.parse_args()
+    with tempfile.TemporaryDirectory() as directory:
+        os.environ["DB_URL"] = (
+            f"sqlite:///{os.path.join(directory, 'benchmark.db')}"
+        )
+        create_db_and_tables()
+        engine = rx.model.get_engine()
+        with rx.session() as session:
+            write_inventory(
+                session,
+                SyntheticInventoryConfig(
+                    bikes=args.bikes,
+                    parts_per_bike=args.parts_per_bike,
+                    sold_ratio=0,
+                ),
+            )
+            motorbike_ids = list(
+                session.exec(select(MotorbikeDB.id)).all()
+            )
+        counter = StatementCounter(engine)
+        results: Dict[str, Any] = {
+            "bikes": args.bikes,
+            "clients": args.clients,
+            "rounds": args.rounds,
+        }
+        for name, executor in (
+            ("inline_db", run_inline),
+            ("db_worker_pool", None),
+        ):
+            patch = (
+                mock.patch.object(
+                    motorbike_state_module,
+                    "run_in_db_executor",
+                    executor,
+                )
+                if executor is not None
+                else contextlib.nullcontext()
+            )
+            with patch:
+                results[name] = asyncio.run(
+                    run_clients(
+                        counter,
+                        motorbike_ids,
+                        args.clients,
+                        args.rounds,
+                        args.interval_ms,
+                    )
+                )
+            for group in ("client_events", "observer"):
+                observed = results[name][group]
+                print(
+                    f"{name:<16} {group:<14}"
+                    f" median {observed['median_ms']:>8.2f} ms,"
+                    f" p99 {observed['p99_ms']:>8.2f} ms,"
+                    f" max {observed['max_ms']:>8.2f} ms"
+                )
+        engine.dispose()
+    if args.output:
+        with open(args.output, "w") as output_file:
+            json.dump(results, output_file, indent=2)
+
+
+if __name__ == "__main__":
+    main()
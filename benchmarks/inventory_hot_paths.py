@@ -0,0 +1,489 @@
+"""Times the inventory hot paths against a synthetic inventory.
+
+Each run builds a throwaway SQLite file with benchmarks.synthetic_data, then
+drives the real event handlers through State._process, the same path the
+websocket uses, so SQL, computed vars and delta serialization are included.
+Every result records wall time, the number of SQL statements and the delta
+size in bytes.
+
+    python -m benchmarks.inventory_hot_paths --bikes 1000 --parts-per-bike 5 --output results.json
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import tempfile
+import time
+from typing import Any, Callable, Dict, List
+
+import reflex as rx
+from reflex.event import Event
+from reflex.state import State
+from sqlalchemy import event as sqlalchemy_event
+from sqlmodel import select
+
+from app.db_setup import create_db_and_tables
+from app.inventory_cache import inventory_cache
+from app.models import MotorbikeDB
+from app.queries import (
+    fetch_cost_rollups,
+    fetch_motorbike_with_parts,
+)
+from app.states.analytics_state import AnalyticsState
+from app.states.motorbike_form_state import (
+    BatchPartFormState,
+    EditMotorbikeFormState,
+    EditPartFormState,
+    MotorbikeSelectionState,
+)
+from app.states.motorbike_state import (
+    MOTORBIKE_SHARD_NAMES,
+    MotorbikeDetailState,
+    MotorbikeState,
+)
+from benchmarks.synthetic_data import (
+    SyntheticInventoryConfig,
+    parse_buyer_mix,
+    write_inventory,
+)
+
+# Rows submitted per add_parts_batch call, and bikes ticked per bulk action.
+BATCH_PART_ROWS = 5
+BULK_SELECTION_SIZE = 10
+
+
+class StatementCounter:
+    def __init__(self, engine):
+        self.count = 0
+        sqlalchemy_event.listen(
+            engine, "before_cursor_execute", self._on_execute
+        )
+
+    def _on_execute(self, *args, **kwargs):
+        self.count += 1
+
+
+class HandlerRunner:
+    """Runs event handlers on one client's state tree and measures each call."""
+
+    def __init__(self, counter: StatementCounter):
+        self.counter = counter
+        self.root = State(_reflex_internal_init=True)
+
+    def substate(self, state_cls):
+        return self.root.get_substate(
+            state_cls.get_full_name().split(".")[1:]
+        )
+
+    async def process(self, state_cls, handler: str, payload) -> int:
+        delta_bytes = 0
+        async for update in self.root._process(
+            Event(
+                token="benchmark",
+                name=f"{state_cls.get_full_name()}.{handler}",
+                payload=payload,
+            )
+        ):
+            delta_bytes += len(update.json().encode())
+        return delta_bytes
+
+    def run(
+        self, state_cls, handler: str, **payload
+    ) -> Dict[str, float]:
+        statements_before = self.counter.count
+        started = time.perf_counter()
+        delta_bytes = asyncio.run(
+            self.process(state_cls, handler, payload)
+        )
+        return {
+            "wall_ms": (time.perf_counter() - started) * 1000,
+            "sql_statements": self.counter.count
+            - statements_before,
+            "delta_bytes": delta_bytes,
+        }
+
+
+def summarize(samples: List[Dict[str, float]]) -> Dict[str, Any]:
+    wall_times = [sample["wall_ms"] for sample in samples]
+    return {
+        "runs": len(samples),
+        "median_ms": statistics.median(wall_times),
+        "min_ms": min(wall_times),
+        "max_ms": max(wall_times),
+        "sql_statements": statistics.median(
+            sample["sql_statements"] for sample in samples
+        ),
+        "delta_bytes": statistics.median(
+            sample["delta_bytes"] for sample in samples
+        ),
+    }
+
+
+def time_function(
+    function: Callable[[], object],
+    counter: StatementCounter,
+    repeat: int,
+) -> Dict[str, Any]:
+    samples = []
+    for _ in range(repeat):
+        statements_before = counter.count
+        started = time.perf_counter()
+        function()
+        samples.append(
+            {
+                "wall_ms": (time.perf_counter() - started) * 1000,
+                "sql_statements": counter.count
+                - statements_before,
+                "delta_bytes": 0,
+            }
+        )
+    return summarize(samples)
+
+
+def benchmark_reads(
+    counter: StatementCounter, repeat: int
+) -> Dict[str, Any]:
+    results: Dict[str, Any] = {}
+
+    def cold_load():
+        inventory_cache.invalidate()
+        return HandlerRunner(counter).run(
+            MotorbikeState, "load_all_data"
+        )
+
+    results["load_all_data_cold"] = summarize(
+        [cold_load() for _ in range(repeat)]
+    )
+    results["load_all_data_warm"] = summarize(
+        [
+            HandlerRunner(counter).run(
+                MotorbikeState, "load_all_data"
+            )
+            for _ in range(repeat)
+        ]
+    )
+    with rx.session() as session:
+        motorbike_ids = session.exec(
+            select(MotorbikeDB.id).limit(100)
+        ).all()
+        bikes = [
+            fetch_motorbike_with_parts(session, motorbike_id)
+            for motorbike_id in motorbike_ids
+        ]
+        rollups = fetch_cost_rollups(session, motorbike_ids)
+        results["convert_motorbike_db_to_dict_x100"] = (
+            time_function(
+                lambda: [
+                    MotorbikeState._convert_motorbike_db_to_dict(
+                        bike, rollups[bike.id]
+                    )
+                    for bike in bikes
+                ],
+                counter,
+                repeat,
+            )
+        )
+    runner = HandlerRunner(counter)
+    runner.run(MotorbikeState, "load_all_data")
+    motorbike_state = runner.substate(MotorbikeState)
+    motorbikes = list(motorbike_state._iter_motorbikes())
+
+    def recompute_portfolio_vars():
+        # Dirtying one shard invalidates _motorbikes, _portfolio and the
+        # three summary vars, as any inventory mutation does.
+        motorbike_state.dirty_vars.add(MOTORBIKE_SHARD_NAMES[0])
+        motorbike_state._mark_dirty_computed_vars()
+        portfolio = (
+            motorbike_state.total_cost,
+            motorbike_state.projected_sale,
+            motorbike_state.actual_profit,
+        )
+        motorbike_state._clean()
+        return portfolio
+
+    results["portfolio_vars"] = time_function(
+        recompute_portfolio_vars, counter, repeat
+    )
+    results["compute_portfolio"] = time_function(
+        lambda: MotorbikeState._compute_portfolio(motorbikes),
+        counter,
+        repeat,
+    )
+    for filter_sold_status in ("all", "sold", "unsold"):
+
+        def load_analytics():
+            inventory_cache.invalidate()
+            return HandlerRunner(counter).run(
+                AnalyticsState,
+                "set_filter_sold_status",
+                status=filter_sold_status,
+            )
+
+        results[f"bike_analytics_data_{filter_sold_status}"] = (
+            summarize([load_analytics() for _ in range(repeat)])
+        )
+    return results
+
+
+def benchmark_mutations(
+    counter: StatementCounter, repeat: int
+) -> Dict[str, Any]:
+    runner = HandlerRunner(counter)
+    runner.run(MotorbikeState, "load_all_data")
+    motorbike_state = runner.substate(MotorbikeState)
+    with rx.session() as session:
+        unsold_bikes = session.exec(
+            select(MotorbikeDB.id, MotorbikeDB.name)
+            .where(~MotorbikeDB.is_sold)
+            .order_by(MotorbikeDB.id)
+            .limit(repeat * (BULK_SELECTION_SIZE + 1))
+        ).all()
+    unsold_ids = [bike_id for bike_id, _ in unsold_bikes[:repeat]]
+    # Separate bikes for the bulk actions, which end by deleting them.
+    bulk_selections = [
+        unsold_bikes[start : start + BULK_SELECTION_SIZE]
+        for start in range(
+            repeat, len(unsold_bikes), BULK_SELECTION_SIZE
+        )
+    ]
+    samples: Dict[str, List[Dict[str, float]]] = {
+        name: []
+        for name in (
+            "add_motorbike",
+            "add_part",
+            "toggle_motorbike_parts",
+            "open_edit_motorbike_dialog",
+            "save_edited_motorbike",
+            "open_edit_part_dialog",
+            "save_edited_part",
+            "delete_part",
+            "delete_motorbike",
+            "load_detail_motorbike",
+            "add_parts_batch",
+            "bulk_set_ignore_from_calculations",
+            "bulk_mark_motorbikes_sold",
+            "bulk_delete_motorbikes",
+        )
+    }
+    added_ids = []
+    for index in range(repeat):
+        samples["add_motorbike"].append(
+            runner.run(
+                MotorbikeState,
+                "add_motorbike",
+                form_data={
+                    "name": f"Benchmark bike {index}",
+                    "initial_cost": "1000",
+                    "tanya_initial_cost": "500",
+                    "gerald_initial_cost": "500",
+                    "buyer": "Tanya",
+                },
+            )
+        )
+        added_ids.append(
+            next(
+                bike["id"]
+                for bike in motorbike_state._iter_motorbikes()
+                if bike["name"] == f"Benchmark bike {index}"
+            )
+        )
+    for motorbike_id in unsold_ids:
+        samples["add_part"].append(
+            runner.run(
+                MotorbikeState,
+                "add_part",
+                form_data={
+                    "name": "Benchmark part",
+                    "source": "benchmark",
+                    "buyer": "Gerald",
+                    "cost": "42.5",
+                },
+                specific_motorbike_id=motorbike_id,
+            )
+        )
+        samples["toggle_motorbike_parts"].append(
+            runner.run(
+                MotorbikeState,
+                "toggle_motorbike_parts",
+                motorbike_id=motorbike_id,
+            )
+        )
+        samples["open_edit_motorbike_dialog"].append(
+            runner.run(
+                MotorbikeState,
+                "open_edit_motorbike_dialog",
+                motorbike_id=motorbike_id,
+            )
+        )
+        runner.substate(
+            EditMotorbikeFormState
+        ).edit_motorbike_form_name += " (edited)"
+        samples["save_edited_motorbike"].append(
+            runner.run(MotorbikeState, "save_edited_motorbike")
+        )
+        part_id = motorbike_state.expanded_motorbike_parts[
+            motorbike_id
+        ][-1]["id"]
+        samples["open_edit_part_dialog"].append(
+            runner.run(
+                MotorbikeState,
+                "open_edit_part_dialog",
+                motorbike_id=motorbike_id,
+                part_id=part_id,
+            )
+        )
+        runner.substate(EditPartFormState).edit_part_form_cost = (
+            "99.5"
+        )
+        samples["save_edited_part"].append(
+            runner.run(MotorbikeState, "save_edited_part")
+        )
+        samples["delete_part"].append(
+            runner.run(
+                MotorbikeState,
+                "delete_part",
+                motorbike_id=motorbike_id,
+                part_id=part_id,
+            )
+        )
+        detail_state = runner.substate(MotorbikeDetailState)
+        detail_state.router.page.params[
+            "route_arg_motorbike_id"
+        ] = motorbike_id
+        samples["load_detail_motorbike"].append(
+            runner.run(
+                MotorbikeDetailState, "load_detail_motorbike"
+            )
+        )
+        row_ids = list(range(BATCH_PART_ROWS))
+        runner.substate(BatchPartFormState).batch_part_row_ids = row_ids
+        form_data = {}
+        for row_id in row_ids:
+            form_data[f"name_{row_id}"] = f"Batch part {row_id}"
+            form_data[f"source_{row_id}"] = "benchmark"
+            form_data[f"buyer_{row_id}"] = "Tanya"
+            form_data[f"cost_{row_id}"] = "12.5"
+        samples["add_parts_batch"].append(
+            runner.run(
+                MotorbikeState,
+                "add_parts_batch",
+                form_data=form_data,
+                specific_motorbike_id=motorbike_id,
+            )
+        )
+
+    def select_motorbikes(bikes) -> None:
+        for bike_id, bike_name in bikes:
+            runner.run(
+                MotorbikeSelectionState,
+                "toggle_motorbike_selection",
+                motorbike_id=bike_id,
+                motorbike_name=bike_name,
+            )
+
+    for bikes in bulk_selections:
+        for ignore in (True, False):
+            select_motorbikes(bikes)
+            samples["bulk_set_ignore_from_calculations"].append(
+                runner.run(
+                    MotorbikeState,
+                    "bulk_set_ignore_from_calculations",
+                    ignore=ignore,
+                )
+            )
+        select_motorbikes(bikes)
+        samples["bulk_mark_motorbikes_sold"].append(
+            runner.run(
+                MotorbikeState,
+                "bulk_mark_motorbikes_sold",
+                form_data={
+                    f"sold_value_{bike_id}": "2500"
+                    for bike_id, _ in bikes
+                },
+            )
+        )
+        select_motorbikes(bikes)
+        samples["bulk_delete_motorbikes"].append(
+            runner.run(MotorbikeState, "bulk_delete_motorbikes")
+        )
+    for motorbike_id in added_ids:
+        samples["delete_motorbike"].append(
+            runner.run(
+                MotorbikeState,
+                "delete_motorbike",
+                motorbike_id=motorbike_id,
+            )
+        )
+    return {
+        name: summarize(handler_samples)
+        for name, handler_samples in samples.items()
+        if handler_samples
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--bikes", type=int, default=1_000)
+    parser.add_argument("--parts-per-bike", type=int, default=5)
+    parser.add_argument("--sold-ratio", type=float, default=0.4)
+    parser.add_argument(
+        "--buyer-mix",
+        nargs="+",
+        metavar="BUYER=WEIGHT",
+        help="Relative buyer weights, e.g. Tanya=2 Gerald=1.",
+    )
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument(
+        "--output", help="Write the results as JSON to this file."
+    )
+    args = parser.parse_args()
+    config = SyntheticInventoryConfig(
+        bikes=args.bikes,
+        parts_per_bike=args.parts_per_bike,
+        sold_ratio=args.sold_ratio,
+        seed=args.seed,
+    )
+    if args.buyer_mix:
+        config.buyer_mix = parse_buyer_mix(args.buyer_mix)
+    with tempfile.TemporaryDirectory() as directory:
+        os.environ["DB_URL"] = (
+            f"sqlite:///{os.path.join(directory, 'benchmark.db')}"
+        )
+        create_db_and_tables()
+        engine = rx.model.get_engine()
+        started = time.perf_counter()
+        with rx.session() as session:
+            write_inventory(session, config)
+        setup_ms = (time.perf_counter() - started) * 1000
+        counter = StatementCounter(engine)
+        results = {
+            "config": {
+                "bikes": config.bikes,
+                "parts_per_bike": config.parts_per_bike,
+                "buyer_mix": config.buyer_mix,
+                "sold_ratio": config.sold_ratio,
+                "seed": config.seed,
+                "repeat": args.repeat,
+            },
+            "setup_ms": setup_ms,
+            "reads": benchmark_reads(counter, args.repeat),
+            "mutations": benchmark_mutations(counter, args.repeat),
+        }
+        engine.dispose()
+    for group in ("reads", "mutations"):
+        for name, result in results[group].items():
+            print(
+                f"{name:<36} {result['median_ms']:>9.2f} ms"
+                f" {result['sql_statements']:>5} SQL"
+                f" {result['delta_bytes']:>9} bytes"
+            )
+    if args.output:
+        with open(args.output, "w") as output_file:
+            json.dump(results, output_file, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,167 @@
+"""Measures other sessions' event latency while many users sign in at once.
+
+An observer client sends a cheap MotorbikeState event every few milliseconds
+while a storm of AuthState.sign_in events runs on the same event loop. The
+storm is run twice: once calling bcrypt inline on the loop, as the handlers
+used to, and once through the real sign_in handler, which hashes on the
+password worker pool.
+
+    python -m benchmarks.login_storm --logins 32 --output results.json
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import tempfile
+import time
+from typing import Any, Awaitable, Callable, Dict, List
+
+import bcrypt
+import reflex as rx
+
+from app.db_setup import create_db_and_tables
+from app.models import UserDB
+from app.password_hashing import PASSWORD_HASH_WORKERS
+from app.states.auth_state import AuthState
+from app.states.motorbike_state import MotorbikeState
+from benchmarks.inventory_hot_paths import (
+    HandlerRunner,
+    StatementCounter,
+)
+
+STORM_EMAIL = "storm@example.com"
+STORM_PASSWORD = "password123"
+
+
+def latency_summary(latencies_ms: List[float]) -> Dict[str, Any]:
+    ordered = sorted(latencies_ms)
+    return {
+        "events": len(ordered),
+        "median_ms": statistics.median(ordered),
+        "p99_ms": ordered[
+            min(len(ordered) - 1, int(len(ordered) * 0.99))
+        ],
+        "max_ms": ordered[-1],
+    }
+
+
+async def observe_during(
+    storm: Callable[[], Awaitable[object]],
+    observer: HandlerRunner,
+    interval_ms: float,
+) -> Dict[str, Any]:
+    latencies_ms: List[float] = []
+    storm_done = asyncio.Event()
+
+    async def observe():
+        while not storm_done.is_set():
+            # Latency is measured from when the event was due, so time spent
+            # waiting for a blocked loop counts as well as processing time.
+            due = time.perf_counter() + interval_ms / 1000
+            await asyncio.sleep(interval_ms / 1000)
+            await observer.process(
+                MotorbikeState,
+                "set_part_form_selected_motorbike_id",
+                {"motorbike_id": ""},
+            )
+            latencies_ms.append((time.perf_counter() - due) * 1000)
+
+    async def run_storm():
+        started = time.perf_counter()
+        await storm()
+        storm_done.set()
+        return (time.perf_counter() - started) * 1000
+
+    _, storm_ms = await asyncio.gather(observe(), run_storm())
+    return {
+        "storm_ms": storm_ms,
+        "observer": latency_summary(latencies_ms),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--logins", type=int, default=32)
+    parser.add_argument("--interval-ms", type=float, default=5)
+    parser.add_argument(
+        "--output", help="Write the results as JSON to this file."
+    )
+    args = parser.parse_args()
+    with tempfile.TemporaryDirectory() as directory:
+        os.environ["DB_URL"] = (
+            f"sqlite:///{os.path.join(directory, 'benchmark.db')}"
+        )
+        create_db_and_tables()
+        engine = rx.model.get_engine()
+        password_hash = bcrypt.hashpw(
+            STORM_PASSWORD.encode("utf-8"), bcrypt.gensalt()
+        ).decode("utf-8")
+        with rx.session() as session:
+            session.add(
+                UserDB(email=STORM_EMAIL, password_hash=password_hash)
+            )
+            session.commit()
+        counter = StatementCounter(engine)
+        observer = HandlerRunner(counter)
+
+        async def idle():
+            await asyncio.sleep(0.5)
+
+        async def inline_bcrypt_storm():
+            async def login():
+                await asyncio.sleep(0)
+                bcrypt.checkpw(
+                    STORM_PASSWORD.encode("utf-8"),
+                    password_hash.encode("utf-8"),
+                )
+
+            await asyncio.gather(
+                *(login() for _ in range(args.logins))
+            )
+
+        async def sign_in_storm():
+            await asyncio.gather(
+                *(
+                    HandlerRunner(counter).process(
+                        AuthState,
+                        "sign_in",
+                        {
+                            "form_data": {
+                                "email": STORM_EMAIL,
+                                "password": STORM_PASSWORD,
+                            }
+                        },
+                    )
+                    for _ in range(args.logins)
+                )
+            )
+
+        results = {
+            "logins": args.logins,
+            "password_hash_workers": PASSWORD_HASH_WORKERS,
+        }
+        for name, storm in (
+            ("baseline", idle),
+            ("inline_bcrypt", inline_bcrypt_storm),
+            ("sign_in_worker_pool", sign_in_storm),
+        ):
+            results[name] = asyncio.run(
+                observe_during(storm, observer, args.interval_ms)
+            )
+            observed = results[name]["observer"]
+            print(
+                f"{name:<20} storm {results[name]['storm_ms']:>8.1f} ms,"
+                f" observer median {observed['median_ms']:.2f} ms,"
+                f" p99 {observed['p99_ms']:.2f} ms,"
+                f" max {observed['max_ms']:.2f} ms"
+            )
+        engine.dispose()
+    if args.output:
+        with open(args.output, "w") as output_file:
+            json.dump(results, output_file, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,184 @@
+"""Stress-tests parallel SQLite readers and writers with the default and tuned engines.
+
+Reader threads run the analytics report query while writer threads add parts
+and bump the inventory version, as add_part does, for a fixed duration. Each
+engine gets its own fresh database file with the same synthetic inventory.
+Reported: completed operations, "database is locked" failures and latency.
+
+    python -m benchmarks.sqlite_concurrency --readers 8 --writers 4 --seconds 10
+"""
+
+import argparse
+import json
+import os
+import tempfile
+import threading
+import time
+import uuid
+from typing import Any, Dict, List
+
+import reflex as rx
+import reflex.model
+import sqlmodel
+from sqlalchemy.exc import OperationalError
+from sqlmodel import Session, select
+
+from app.analytics_engine import load_analytics_report
+from app.database import create_tuned_engine
+from app.migrations import run_migrations
+from app.models import MotorbikeDB, PartDB
+from app.queries import bump_inventory_version
+from benchmarks.login_storm import latency_summary
+from benchmarks.synthetic_data import (
+    SyntheticInventoryConfig,
+    write_inventory,
+)
+
+
+def run_stress(
+    engine, readers: int, writers: int, seconds: float
+) -> Dict[str, Any]:
+    with Session(engine) as session:
+        motorbike_ids = list(
+            session.exec(
+                select(MotorbikeDB.id).where(~MotorbikeDB.is_sold)
+            ).all()
+        )
+    deadline = time.perf_counter() + seconds
+    lock = threading.Lock()
+    latencies: Dict[str, List[float]] = {"read": [], "write": []}
+    locked_errors = {"read": 0, "write": 0}
+
+    def record(kind: str, started: float, error: bool) -> None:
+        with lock:
+            if error:
+                locked_errors[kind] += 1
+            else:
+                latencies[kind].append(
+                    (time.perf_counter() - started) * 1000
+                )
+
+    def reader():
+        while time.perf_counter() < deadline:
+            started = time.perf_counter()
+            try:
+                with Session(engine) as session:
+                    load_analytics_report(session, "all")
+            except OperationalError as error:
+                if "locked" not in str(error):
+                    raise
+                record("read", started, True)
+            else:
+                record("read", started, False)
+
+    def writer(writer_index: int):
+        write_index = 0
+        while time.perf_counter() < deadline:
+            started = time.perf_counter()
+            try:
+                with Session(engine) as session:
+                    session.add(
+                        PartDB(
+                            id=str(uuid.uuid4()),
+                            name="Stress part",
+                            source="benchmark",
+                            buyer="Tanya",
+                            cost=10.0,
+                            motorbike_id=motorbike_ids[
+                                (writer_index + write_index)
+                                % len(motorbike_ids)
+                            ],
+                        )
+                    )
+                    bump_inventory_version(session)
+                    session.commit()
+            except OperationalError as error:
+                if "locked" not in str(error):
+                    raise
+                record("write", started, True)
+            else:
+                record("write", started, False)
+            write_index += 1
+
+    threads = [
+        threading.Thread(target=reader) for _ in range(readers)
+    ] + [
+        threading.Thread(target=writer, args=(index,))
+        for index in range(writers)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return {
+        kind: {
+            "operations_per_second": len(latencies[kind]) / seconds,
+            "locked_errors": locked_errors[kind],
+            **(
+                latency_summary(latencies[kind])
+                if latencies[kind]
+                else {}
+            ),
+        }
+        for kind in ("read", "write")
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--bikes", type=int, default=1_000)
+    parser.add_argument("--parts-per-bike", type=int, default=5)
+    parser.add_argument("--readers", type=int, default=8)
+    parser.add_argument("--writers", type=int, default=4)
+    parser.add_argument("--seconds", type=float, default=10)
+    parser.add_argument(
+        "--output", help="Write the results as JSON to this file."
+    )
+    args = parser.parse_args()
+    results: Dict[str, Any] = {
+        "bikes": args.bikes,
+        "readers": args.readers,
+        "writers": args.writers,
+        "seconds": args.seconds,
+    }
+    with tempfile.TemporaryDirectory() as directory:
+        for name, make_engine in (
+            (
+                "default_engine",
+                lambda url: sqlmodel.create_engine(
+                    url, **reflex.model.get_engine_args(url)
+                ),
+            ),
+            ("tuned_engine", create_tuned_engine),
+        ):
+            url = f"sqlite:///{os.path.join(directory, name)}.db"
+            engine = make_engine(url)
+            rx.Model.metadata.create_all(engine)
+            run_migrations(engine)
+            with Session(engine) as session:
+                write_inventory(
+                    session,
+                    SyntheticInventoryConfig(
+                        bikes=args.bikes,
+                        parts_per_bike=args.parts_per_bike,
+                    ),
+                )
+            results[name] = run_stress(
+                engine, args.readers, args.writers, args.seconds
+            )
+            engine.dispose()
+            for kind in ("read", "write"):
+                result = results[name][kind]
+                print(
+                    f"{name:<15} {kind:<5}"
+                    f" {result['operations_per_second']:>8.1f} ops/s,"
+                    f" {result['locked_errors']:>5} locked,"
+                    f" p99 {result.get('p99_ms', 0):>8.2f} ms"
+                )
+    if args.output:
+        with open(args.output, "w") as output_file:
+            json.dump(results, output_file, indent=2)
+
+
+if __name__ == "__main__":
+    main()
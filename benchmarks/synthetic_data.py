@@ -0,0 +1,154 @@
+"""Reproducible synthetic inventories for benchmarks.
+
+    python -m benchmarks.synthetic_data --bikes 10000 --parts-per-bike 8 --db-url sqlite:///bench.db
+"""
+
+import argparse
+import random
+import uuid
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Tuple
+
+import reflex as rx
+from sqlalchemy import insert
+from sqlmodel import Session, create_engine
+
+from app.migrations import run_migrations
+from app.models import MotorbikeDB, PartDB
+from app.queries import bump_inventory_version
+
+PART_NAMES = [
+    "Chain",
+    "Sprocket",
+    "Brake pads",
+    "Battery",
+    "Tyre",
+    "Spark plug",
+    "Air filter",
+    "Clutch cable",
+]
+PART_SOURCES = ["eBay", "Dealer", "Breaker", "Local shop"]
+
+
+@dataclass
+class SyntheticInventoryConfig:
+    bikes: int = 1_000
+    parts_per_bike: int = 5
+    buyer_mix: Dict[str, float] = field(
+        default_factory=lambda: {
+            "Tanya": 0.45,
+            "Gerald": 0.45,
+            "Other": 0.10,
+        }
+    )
+    sold_ratio: float = 0.4
+    ignored_ratio: float = 0.05
+    seed: int = 42
+
+
+def generate_inventory(
+    config: SyntheticInventoryConfig,
+) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+    """Returns motorbike and part rows; the same config always yields the same rows."""
+    rng = random.Random(config.seed)
+    buyers = list(config.buyer_mix)
+    buyer_weights = [config.buyer_mix[buyer] for buyer in buyers]
+    bike_rows: List[Dict[str, Any]] = []
+    part_rows: List[Dict[str, Any]] = []
+    for bike_index in range(config.bikes):
+        motorbike_id = str(uuid.UUID(int=rng.getrandbits(128)))
+        tanya_initial = round(rng.uniform(100, 2000), 2)
+        gerald_initial = round(rng.uniform(100, 2000), 2)
+        is_sold = rng.random() < config.sold_ratio
+        bike_rows.append(
+            {
+                "id": motorbike_id,
+                "name": f"Bike {bike_index:07d}",
+                "initial_cost": tanya_initial + gerald_initial,
+                "tanya_initial_cost": tanya_initial,
+                "gerald_initial_cost": gerald_initial,
+                "buyer": rng.choices(buyers, buyer_weights)[0],
+                "is_sold": is_sold,
+                "sold_value": (
+                    round(rng.uniform(1000, 9000), 2)
+                    if is_sold
+                    else None
+                ),
+                "ignore_from_calculations": rng.random()
+                < config.ignored_ratio,
+            }
+        )
+        for _ in range(config.parts_per_bike):
+            part_rows.append(
+                {
+                    "id": str(uuid.UUID(int=rng.getrandbits(128))),
+                    "name": rng.choice(PART_NAMES),
+                    "source": rng.choice(PART_SOURCES),
+                    "buyer": rng.choices(buyers, buyer_weights)[0],
+                    "cost": round(rng.uniform(5, 400), 2),
+                    "motorbike_id": motorbike_id,
+                }
+            )
+    return bike_rows, part_rows
+
+
+def write_inventory(
+    session: Session, config: SyntheticInventoryConfig
+) -> None:
+    """Bulk-inserts a synthetic inventory and bumps the inventory version once."""
+    bike_rows, part_rows = generate_inventory(config)
+    if bike_rows:
+        session.execute(insert(MotorbikeDB), bike_rows)
+    if part_rows:
+        session.execute(insert(PartDB), part_rows)
+    bump_inventory_version(session)
+    session.commit()
+
+
+def parse_buyer_mix(entries: List[str]) -> Dict[str, float]:
+    buyer_mix: Dict[str, float] = {}
+    for entry in entries:
+        buyer, _, weight = entry.partition("=")
+        buyer_mix[buyer] = float(weight or 1)
+    return buyer_mix
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--bikes", type=int, default=1_000)
+    parser.add_argument("--parts-per-bike", type=int, default=5)
+    parser.add_argument("--sold-ratio", type=float, default=0.4)
+    parser.add_argument(
+        "--buyer-mix",
+        nargs="+",
+        metavar="BUYER=WEIGHT",
+        help="Relative buyer weights, e.g. Tanya=2 Gerald=1.",
+    )
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--db-url", required=True)
+    args = parser.parse_args()
+    engine = create_engine(args.db_url)
+    rx.Model.metadata.create_all(engine)
+    run_migrations(engine)
+    with Session(engine) as session:
+        write_inventory(
+            session,
+            SyntheticInventoryConfig(
+                bikes=args.bikes,
+                parts_per_bike=args.parts_per_bike,
+                sold_ratio=args.sold_ratio,
+                seed=args.seed,
+                **(
+                    {"buyer_mix": parse_buyer_mix(args.buyer_mix)}
+                    if args.buyer_mix
+                    else {}
+                ),
+            ),
+        )
+    print(
+        f"Wrote {args.bikes} bikes with {args.parts_per_bike} parts each to {args.db_url}."
+    )
+
+
+if __name__ == "__main__":
+    main()
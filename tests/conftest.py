@@ -0,0 +1,85 @@
+import os
+import tempfile
+
+# Reflex creates its engine from DB_URL on first use, so point it at a
+# throwaway SQLite file before the app modules are imported.
+_database_directory = tempfile.TemporaryDirectory()
+os.environ["DB_URL"] = (
+    f"sqlite:///{os.path.join(_database_directory.name, 'test.db')}"
+)
+
+import asyncio
+from typing import List
+
+import pytest
+import reflex as rx
+from reflex.event import Event
+from reflex.state import State, StateUpdate
+from sqlalchemy import event as sqlalchemy_event
+from sqlmodel import SQLModel
+
+from app.db_setup import create_db_and_tables
+from app.inventory_cache import inventory_cache
+
+
+@pytest.fixture
+def engine():
+    """An empty, fully migrated database and a cold inventory cache."""
+    create_db_and_tables()
+    engine = rx.model.get_engine()
+    SQLModel.metadata.drop_all(engine)
+    create_db_and_tables()
+    inventory_cache.invalidate()
+    return engine
+
+
+class StatementLog:
+    """Records every SQL statement an engine executes, with its parameters."""
+
+    def __init__(self, engine):
+        self.engine = engine
+        self.statements: List[tuple] = []
+
+    def _on_execute(
+        self, conn, cursor, statement, parameters, context, executemany
+    ):
+        self.statements.append((statement, parameters))
+
+    def __enter__(self):
+        sqlalchemy_event.listen(
+            self.engine, "before_cursor_execute", self._on_execute
+        )
+        return self
+
+    def __exit__(self, *exc_info):
+        sqlalchemy_event.remove(
+            self.engine, "before_cursor_execute", self._on_execute
+        )
+
+
+def new_client() -> State:
+    return State(_reflex_internal_init=True)
+
+
+def substate(root: State, state_cls):
+    return root.get_substate(state_cls.get_full_name().split(".")[1:])
+
+
+def process_event(
+    root: State, state_cls, handler: str, **payload
+) -> List[StateUpdate]:
+    """Runs one event handler the way the websocket does and returns its updates."""
+
+    async def run():
+        return [
+            update
+            async for update in root._process(
+                Event(
+                    token="test",
+                    name=f"{state_cls.get_full_name()}.{handler}",
+                    payload=payload,
+                )
+            )
+        ]
+
+    return asyncio.run(run())
@@ -0,0 +1,39 @@
+from unittest import mock
+
+import reflex as rx
+
+from app.models import UserDB
+from app.states.auth_state import AuthState
+
+from tests.conftest import new_client, process_event, substate
+
+
+def test_sign_up_reports_an_email_taken_while_hashing(engine):
+    async def hash_while_another_sign_up_commits(password: str) -> str:
+        with rx.session() as session:
+            session.add(
+                UserDB(email="rider@example.com", password_hash="other")
+            )
+            session.commit()
+        return "hashed"
+
+    root = new_client()
+    auth_state = substate(root, AuthState)
+    auth_state.in_session = False
+    with mock.patch(
+        "app.states.auth_state.hash_password",
+        hash_while_another_sign_up_commits,
+    ):
+        updates = process_event(
+            root,
+            AuthState,
+            "sign_up",
+            form_data={
+                "email": "rider@example.com",
+                "password": "secret",
+            },
+        )
+    assert "Email already in use." in str(
+        [update.events for update in updates]
+    )
+    assert not auth_state.in_session
@@ -0,0 +1,15 @@
+from app.states.motorbike_form_state import BatchPartFormState
+
+from tests.conftest import new_client, process_event, substate
+
+
+def test_removing_a_batch_row_twice_does_nothing_the_second_time():
+    root = new_client()
+    process_event(root, BatchPartFormState, "add_batch_part_row")
+    process_event(root, BatchPartFormState, "add_batch_part_row")
+    for _ in range(2):
+        updates = process_event(
+            root, BatchPartFormState, "remove_batch_part_row", row_id=1
+        )
+        assert not any(update.events for update in updates)
+    assert substate(root, BatchPartFormState).batch_part_row_ids == [0, 2]
@@ -0,0 +1,67 @@
+import reflex as rx
+
+from app.models import MotorbikeDB
+from app.states.motorbike_form_state import MotorbikeSelectionState
+from app.states.motorbike_state import MotorbikeState
+
+from tests.conftest import new_client, process_event, substate
+
+
+def _add_motorbike(name: str, sold_value: float | None = None) -> str:
+    with rx.session() as session:
+        bike = MotorbikeDB(
+            name=name,
+            initial_cost=100.0,
+            tanya_initial_cost=50.0,
+            gerald_initial_cost=50.0,
+            buyer="Tanya",
+            is_sold=sold_value is not None,
+            sold_value=sold_value,
+        )
+        session.add(bike)
+        session.commit()
+        return bike.id
+
+
+def test_bulk_mark_sold_keeps_sold_values_left_blank(engine):
+    bikes = {
+        "priced": _add_motorbike("Priced"),
+        "already sold": _add_motorbike("Already sold", 900.0),
+        "blank": _add_motorbike("Blank"),
+    }
+    root = new_client()
+    process_event(root, MotorbikeState, "load_all_data")
+    for name, motorbike_id in bikes.items():
+        process_event(
+            root,
+            MotorbikeSelectionState,
+            "toggle_motorbike_selection",
+            motorbike_id=motorbike_id,
+            motorbike_name=name,
+            sold_value=900.0 if name == "already sold" else None,
+        )
+    assert substate(root, MotorbikeSelectionState).selected_motorbikes[
+        bikes["already sold"]
+    ] == {
+        "name": "already sold",
+        "sold_value": "900.0",
+    }
+    process_event(
+        root,
+        MotorbikeState,
+        "bulk_mark_motorbikes_sold",
+        form_data={
+            f"sold_value_{bikes['priced']}": "2500",
+            f"sold_value_{bikes['already sold']}": "",
+            f"sold_value_{bikes['blank']}": "",
+        },
+    )
+    with rx.session() as session:
+        saved = {
+            name: session.get(MotorbikeDB, motorbike_id)
+            for name, motorbike_id in bikes.items()
+        }
+        assert all(bike.is_sold for bike in saved.values())
+        assert {
+            name: bike.sold_value for name, bike in saved.items()
+        } == {"priced": 2500.0, "already sold": 900.0, "blank": None}
@@ -0,0 +1,26 @@
+from reflex.compiler import compiler
+
+from app.pages.dashboard_page import dashboard_page
+
+# The dashboard and its memoized components compiled to about 46 KB when
+# this budget was set; the per-shard card templates had taken it past 200 KB.
+DASHBOARD_COMPILED_BYTES_BUDGET = 64 * 1024
+
+
+def _compiled_dashboard() -> str:
+    page = dashboard_page()
+    _, components_code, _ = compiler.compile_components(
+        page._get_all_custom_components()
+    )
+    return str(page) + components_code
+
+
+def test_dashboard_compiles_the_motorbike_card_once():
+    assert _compiled_dashboard().count("Delete Motorbike") == 1
+
+
+def test_dashboard_stays_within_its_compiled_size_budget():
+    assert (
+        len(_compiled_dashboard().encode("utf-8"))
+        < DASHBOARD_COMPILED_BYTES_BUDGET
+    )
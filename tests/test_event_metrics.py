@@ -0,0 +1,98 @@
+import asyncio
+from unittest import mock
+
+import pytest
+from reflex.event import Event
+from reflex.state import StateUpdate
+from sqlalchemy import text
+from sqlalchemy.exc import OperationalError
+
+from app.delta_metrics import delta_size_recorder
+from app.event_metrics import (
+    EventMetricsMiddleware,
+    _active_event,
+    _ActiveEvent,
+    event_metrics_recorder,
+)
+from app.states.auth_state import AuthState
+from app.states.motorbike_state import MotorbikeState
+
+from tests.conftest import new_client, process_event
+
+
+def test_event_metrics_reports_delta_sizes_from_one_encoding():
+    middleware = EventMetricsMiddleware(
+        [AuthState], report_delta_sizes=True
+    )
+    event_metrics_recorder.reset()
+    delta_size_recorder.reset()
+    events = [
+        Event(
+            token="test",
+            name=f"{AuthState.get_full_name()}.sign_out",
+            payload={},
+        ),
+        Event(token="test", name="state.other_state.handler", payload={}),
+    ]
+    update = StateUpdate(delta={"state": {"value": 1}}, final=True)
+
+    async def run():
+        for event in events:
+            await middleware.preprocess(None, None, event)
+            await middleware.postprocess(None, None, event, update)
+
+    try:
+        with mock.patch.object(
+            StateUpdate,
+            "json",
+            autospec=True,
+            side_effect=StateUpdate.json,
+        ) as encode:
+            asyncio.run(run())
+    finally:
+        middleware.uninstall()
+    assert encode.call_count == len(events)
+    delta_bytes = len(update.json().encode("utf-8"))
+    delta_sizes = delta_size_recorder.stats()
+    for event in events:
+        assert delta_sizes[event.name]["total_bytes"] == delta_bytes
+    assert event_metrics_recorder.stats()[events[0].name][
+        "total_delta_bytes"
+    ] == delta_bytes
+
+
+@pytest.fixture
+def active_event():
+    event = _ActiveEvent("test")
+    token = _active_event.set(event)
+    yield event
+    _active_event.reset(token)
+
+
+def test_computed_var_timing_is_recorded_and_uninstalled(
+    engine, active_event
+):
+    original_var = MotorbikeState.computed_vars["total_cost"]
+    middleware = EventMetricsMiddleware([MotorbikeState])
+    try:
+        assert MotorbikeState.computed_vars["total_cost"] is not (
+            original_var
+        )
+        process_event(new_client(), MotorbikeState, "load_all_data")
+    finally:
+        middleware.uninstall()
+    assert active_event.computed_var_seconds > 0
+    assert active_event.sql_statements > 0
+    assert MotorbikeState.computed_vars["total_cost"] is original_var
+
+
+def test_failed_statements_do_not_unbalance_sql_timing(
+    engine, active_event
+):
+    EventMetricsMiddleware([]).uninstall()
+    with engine.connect() as connection:
+        with pytest.raises(OperationalError):
+            connection.execute(text("SELECT * FROM missing_table"))
+        connection.execute(text("SELECT 1"))
+        assert not connection.info.get("event_metrics_started")
+    assert active_event.sql_statements == 2
@@ -0,0 +1,51 @@
+from types import SimpleNamespace
+
+import pytest
+import reflex as rx
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.export_endpoint import add_export_endpoint
+from app.models import MotorbikeDB
+
+
+@pytest.fixture
+def client(engine):
+    with rx.session() as session:
+        session.add(
+            MotorbikeDB(
+                name="Bike",
+                initial_cost=100.0,
+                tanya_initial_cost=50.0,
+                gerald_initial_cost=50.0,
+                buyer="Tanya",
+            )
+        )
+        session.commit()
+    app = SimpleNamespace(api=FastAPI())
+    add_export_endpoint(app, "export-secret")
+    return TestClient(app.api)
+
+
+@pytest.mark.parametrize(
+    "headers",
+    [{}, {"Authorization": "Bearer wrong"}, {"Authorization": "export-secret"}],
+)
+def test_export_rejects_requests_without_the_token(client, headers):
+    response = client.get("/export/motorbikes", headers=headers)
+    assert response.status_code == 401
+    assert response.headers["www-authenticate"] == "Bearer"
+
+
+def test_export_streams_with_the_token(client):
+    response = client.get(
+        "/export/motorbikes",
+        headers={"Authorization": "Bearer export-secret"},
+    )
+    assert response.status_code == 200
+    assert response.text.splitlines()[1].split(",")[1] == "Bike"
+
+
+def test_export_endpoint_requires_a_token():
+    with pytest.raises(ValueError):
+        add_export_endpoint(SimpleNamespace(api=FastAPI()), "")
@@ -0,0 +1,66 @@
+import io
+import pathlib
+from unittest import mock
+
+import reflex as rx
+from sqlalchemy import func
+from sqlalchemy.exc import OperationalError
+from sqlmodel import select
+
+from app.csv_import import CSV_IMPORT_COLUMNS, import_csv_chunk
+from app.models import MotorbikeDB
+from app.states.inventory_import_state import InventoryImportState
+
+from tests.conftest import new_client, process_event, substate
+
+CSV_TEXT = (
+    ",".join(CSV_IMPORT_COLUMNS)
+    + "\n"
+    + "".join(
+        f"Bike {index},100,50,50,Tanya,Chain,Shop,Gerald,10\n"
+        for index in range(3)
+    )
+)
+
+
+def test_import_reports_a_database_error_and_the_rows_already_saved(
+    engine,
+):
+    chunks = 0
+
+    def fail_on_second_chunk(reader, imported_motorbike_ids, default_buyer):
+        nonlocal chunks
+        chunks += 1
+        if chunks == 2:
+            raise OperationalError(
+                "INSERT", {}, Exception("database is locked")
+            )
+        return import_csv_chunk(
+            reader, imported_motorbike_ids, default_buyer, max_rows=1
+        )
+
+    root = new_client()
+    with mock.patch(
+        "app.states.inventory_import_state.import_csv_chunk",
+        fail_on_second_chunk,
+    ):
+        updates = process_event(
+            root,
+            InventoryImportState,
+            "import_inventory_csv",
+            files=[
+                rx.UploadFile(
+                    file=io.BytesIO(CSV_TEXT.encode()),
+                    path=pathlib.Path("inventory.csv"),
+                )
+            ],
+        )
+    events = str([update.events for update in updates])
+    assert "stopped by a database error" in events
+    assert "the first 1 rows were saved" in events
+    import_state = substate(root, InventoryImportState)
+    assert not import_state.import_in_progress
+    with rx.session() as session:
+        assert (
+            session.exec(select(func.count(MotorbikeDB.id))).one() == 1
+        )
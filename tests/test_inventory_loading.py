@@ -0,0 +1,41 @@
+import reflex as rx
+from sqlmodel import SQLModel
+
+from app.inventory_cache import inventory_cache
+from app.states.motorbike_state import MotorbikeState
+from benchmarks.synthetic_data import (
+    SyntheticInventoryConfig,
+    write_inventory,
+)
+
+from tests.conftest import (
+    StatementLog,
+    new_client,
+    process_event,
+    substate,
+)
+
+
+def _load_all_data_statements(engine, bikes: int) -> int:
+    SQLModel.metadata.drop_all(engine)
+    SQLModel.metadata.create_all(engine)
+    inventory_cache.invalidate()
+    with rx.session() as session:
+        write_inventory(
+            session,
+            SyntheticInventoryConfig(bikes=bikes, parts_per_bike=3),
+        )
+    root = new_client()
+    with StatementLog(engine) as log:
+        process_event(root, MotorbikeState, "load_all_data")
+    loaded = list(substate(root, MotorbikeState)._iter_motorbikes())
+    assert len(loaded) == bikes
+    return len(log.statements)
+
+
+def test_load_all_data_query_count_does_not_grow_with_inventory(engine):
+    small_inventory_statements = _load_all_data_statements(engine, 5)
+    assert small_inventory_statements > 0
+    assert small_inventory_statements == _load_all_data_statements(
+        engine, 50
+    )
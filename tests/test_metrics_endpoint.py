@@ -0,0 +1,37 @@
+from types import SimpleNamespace
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.metrics_endpoint import add_metrics_endpoint
+
+
+@pytest.fixture
+def client(engine):
+    app = SimpleNamespace(api=FastAPI(), event_namespace=None)
+    add_metrics_endpoint(app, "metrics-secret")
+    return TestClient(app.api)
+
+
+@pytest.mark.parametrize(
+    "headers", [{}, {"Authorization": "Bearer wrong"}]
+)
+def test_metrics_rejects_requests_without_the_token(client, headers):
+    response = client.get("/metrics", headers=headers)
+    assert response.status_code == 401
+    assert response.headers["www-authenticate"] == "Bearer"
+
+
+def test_metrics_renders_with_the_token(client):
+    response = client.get(
+        "/metrics",
+        headers={"Authorization": "Bearer metrics-secret"},
+    )
+    assert response.status_code == 200
+    assert "motorbike_tracker_inventory_motorbikes 0" in response.text
+
+
+def test_metrics_endpoint_requires_a_token():
+    with pytest.raises(ValueError):
+        add_metrics_endpoint(SimpleNamespace(api=FastAPI()), "")
@@ -0,0 +1,140 @@
+from typing import List
+
+import pytest
+import reflex as rx
+from sqlalchemy import text
+from sqlmodel import select
+
+from app.analytics_engine import load_analytics_report
+from app.models import MotorbikeDB
+from app.queries import (
+    fetch_cost_rollups,
+    fetch_motorbike_page,
+    fetch_motorbike_with_parts,
+)
+from app.states.motorbike_state import MotorbikeState
+from benchmarks.synthetic_data import (
+    SyntheticInventoryConfig,
+    write_inventory,
+)
+
+from tests.conftest import StatementLog
+
+
+@pytest.fixture
+def inventory(engine):
+    with rx.session() as session:
+        write_inventory(
+            session,
+            SyntheticInventoryConfig(bikes=200, parts_per_bike=3),
+        )
+    return engine
+
+
+def query_plans(engine, run_queries) -> List[str]:
+    """Runs the queries and returns the EXPLAIN QUERY PLAN details of each one."""
+    with StatementLog(engine) as log:
+        with rx.session() as session:
+            run_queries(session)
+    plans = []
+    with engine.connect() as connection:
+        for statement, parameters in log.statements:
+            plans.append(
+                "\n".join(
+                    row[3]
+                    for row in connection.exec_driver_sql(
+                        f"EXPLAIN QUERY PLAN {statement}", parameters
+                    )
+                )
+            )
+    return plans
+
+
+def test_inventory_list_rolls_up_parts_through_the_motorbike_index(
+    inventory,
+):
+    plans = query_plans(
+        inventory, MotorbikeState._fetch_all_motorbikes
+    )
+    rollup_plan = plans[-1]
+    assert (
+        "SEARCH partdb USING INDEX ix_partdb_motorbike_id"
+        in rollup_plan
+    )
+    assert "TEMP B-TREE" not in rollup_plan
+
+
+def test_cost_rollup_for_some_bikes_seeks_by_key(inventory):
+    with rx.session() as session:
+        motorbike_ids = session.exec(
+            select(MotorbikeDB.id).limit(5)
+        ).all()
+    (plan,) = query_plans(
+        inventory,
+        lambda session: fetch_cost_rollups(session, motorbike_ids),
+    )
+    assert "SEARCH motorbikedb USING INDEX" in plan
+    assert (
+        "SEARCH partdb USING INDEX ix_partdb_motorbike_id" in plan
+    )
+
+
+def test_single_bike_parts_use_the_motorbike_index(inventory):
+    with rx.session() as session:
+        motorbike_id = session.exec(select(MotorbikeDB.id)).first()
+    (plan,) = query_plans(
+        inventory,
+        lambda session: fetch_motorbike_with_parts(
+            session, motorbike_id
+        ),
+    )
+    assert "ix_partdb_motorbike_id" in plan
+
+
+def test_motorbike_pages_walk_the_display_order_index(inventory):
+    def first_two_pages(session):
+        _, next_cursor = fetch_motorbike_page(session, 24)
+        fetch_motorbike_page(session, 24, next_cursor)
+
+    first_page_plan, next_page_plan = query_plans(
+        inventory, first_two_pages
+    )
+    for plan in (first_page_plan, next_page_plan):
+        assert "ix_motorbikedb_display_order" in plan
+        assert "TEMP B-TREE" not in plan
+    assert (
+        "SEARCH motorbikedb USING INDEX ix_motorbikedb_display_order"
+        in next_page_plan
+    )
+
+
+def test_analytics_queries_use_the_part_and_sold_indexes(inventory):
+    plans = query_plans(
+        inventory,
+        lambda session: load_analytics_report(session, "sold"),
+    )
+    assert len(plans) == 2
+    for plan in plans:
+        assert "SCAN partdb USING INDEX ix_partdb_motorbike_id" in plan
+        assert (
+            "SEARCH motorbikedb USING INDEX ix_motorbikedb_display_order"
+            in plan
+        )
+        assert "TEMP B-TREE" not in plan
+
+
+def test_migrations_leave_only_the_used_indexes(engine):
+    with engine.connect() as connection:
+        indexes = set(
+            connection.execute(
+                text(
+                    "SELECT name FROM sqlite_master WHERE type = 'index'"
+                )
+            ).scalars()
+        )
+    assert {
+        "ix_partdb_motorbike_id",
+        "ix_motorbikedb_display_order",
+        "ix_motorbikedb_name",
+    } <= indexes
+    assert "ix_motorbikedb_unsold_name" not in indexes
@@ -0,0 +1,37 @@
+from app.states.motorbike_state import MotorbikeState
+
+from tests.conftest import new_client, substate
+
+
+def _summary(index: int, is_sold: bool = False, name: str = "") -> dict:
+    return {
+        "id": f"bike-{index}",
+        "name": name or f"Bike {index}",
+        "is_sold": is_sold,
+    }
+
+
+def _rebuilt_unsold_motorbikes(state) -> list:
+    return [
+        {"id": bike["id"], "name": bike["name"]}
+        for bike in state._iter_motorbikes()
+        if not bike["is_sold"]
+    ]
+
+
+def test_unsold_motorbikes_follow_incremental_edits():
+    state = substate(new_client(), MotorbikeState)
+    state._set_motorbikes(
+        [_summary(index, is_sold=index % 3 == 0) for index in range(200)]
+    )
+    for index in range(200, 260):
+        state._append_motorbike(_summary(index, is_sold=index % 4 == 0))
+    for index in range(0, 260, 7):
+        state._replace_motorbike(_summary(index, is_sold=index % 3 != 0))
+    for index in range(1, 260, 11):
+        state._replace_motorbike(
+            _summary(index, is_sold=False, name=f"Renamed {index}")
+        )
+    for index in range(2, 260, 13):
+        state._remove_motorbike(f"bike-{index}")
+    assert state.unsold_motorbikes == _rebuilt_unsold_motorbikes(state)